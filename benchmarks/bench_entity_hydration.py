@@ -0,0 +1,108 @@
+"""Time hydrating a bestiary-sized result set into Entity objects.
+
+Usage:
+    python benchmarks/bench_entity_hydration.py [--rows 5000] [--repeat 20]
+
+Compares the shared bulk mapper with the previous per-row approach, which
+recomputed the level defaults and read columns by attribute for every row.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sqlalchemy import create_engine, text  # noqa: E402
+
+from rpg.domain.models.entity import Entity  # noqa: E402
+from rpg.infrastructure.db.entity_mapper import (  # noqa: E402
+    ENTITY_COLUMNS,
+    default_combat_fields,
+    default_stats_for_level,
+    rows_to_entities,
+)
+
+
+def _per_row(rows):
+    entities = []
+    for row in rows:
+        level = row.level or 1
+        hp, attack_min, attack_max, armor = default_stats_for_level(level)
+        ac, attack_bonus, damage_die = default_combat_fields(level)
+        hp = row.hp_max or hp
+        entities.append(
+            Entity(
+                id=row.entity_id,
+                name=row.name,
+                level=level,
+                hp=hp,
+                hp_current=hp,
+                hp_max=hp,
+                attack_min=attack_min,
+                attack_max=attack_max,
+                armor=armor,
+                armour_class=row.armour_class or ac,
+                attack_bonus=row.attack_bonus or attack_bonus,
+                damage_die=row.damage_dice or damage_die,
+                kind=row.kind or "beast",
+                tags=[],
+            )
+        )
+    return entities
+
+
+def _load_rows(count: int):
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE entity (entity_id INTEGER PRIMARY KEY, name TEXT, level INTEGER, "
+                "armour_class INTEGER, attack_bonus INTEGER, damage_dice TEXT, hp_max INTEGER, kind TEXT)"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO entity (name, level, armour_class, attack_bonus, damage_dice, hp_max, kind) "
+                "VALUES (:name, :level, :ac, NULL, :dice, :hp, 'beast')"
+            ),
+            [
+                {
+                    "name": f"Monster {i}",
+                    "level": i % 31,
+                    "ac": 12 if i % 3 == 0 else None,
+                    "dice": "2d6" if i % 2 == 0 else None,
+                    "hp": 30 if i % 4 == 0 else None,
+                }
+                for i in range(count)
+            ],
+        )
+    with engine.connect() as conn:
+        return conn.execute(text(f"SELECT {ENTITY_COLUMNS} FROM entity")).all()
+
+
+def _best_of(fn, rows, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(rows)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark entity hydration")
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = _load_rows(args.rows)
+    baseline = _best_of(_per_row, rows, args.repeat)
+    bulk = _best_of(rows_to_entities, rows, args.repeat)
+    print(f"per-row  {baseline:8.2f} ms for {len(rows)} rows")
+    print(f"bulk     {bulk:8.2f} ms for {len(rows)} rows ({bulk / baseline:.0%} of per-row)")
+
+
+if __name__ == "__main__":
+    main()
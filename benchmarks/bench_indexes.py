@@ -0,0 +1,244 @@
+"""Time the hot repository lookups with and without the hot-path indexes.
+
+Usage:
+    python benchmarks/bench_indexes.py [--rows 100000] [--iterations 200]
+
+Seeds ``--rows`` entities and characters spread over a few hundred locations,
+drops the indexes added by ``006_add_hot_path_indexes.sql`` (and their SQLite
+mirrors), times each repository method, then recreates the indexes and times
+it again.
+
+MySQL is only measured when ``RPG_MYSQL_URL`` points at a scratch database with
+``create_tables.sql`` and migrations 001-005 applied: the seed rows are added
+to it and left in place.
+"""
+
+import argparse
+import os
+import re
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sqlalchemy import text  # noqa: E402
+
+MIGRATION = (
+    Path(__file__).resolve().parents[1]
+    / "src/rpg/infrastructure/db/migrations/006_add_hot_path_indexes.sql"
+)
+LOCATIONS = 250
+SEED_CHUNK = 5000
+
+# (index, table) pairs the SQLite schema creates for the same lookups.
+SQLITE_INDEXES = (
+    ("idx_entity_level_cover", "entity"),
+    ("idx_entity_location_location", "entity_location"),
+    ("idx_character_location_location", "character_location"),
+    ("idx_spell_level", "spell"),
+)
+
+
+def _migration_indexes() -> List[Tuple[str, str]]:
+    sql = MIGRATION.read_text(encoding="utf-8")
+    return re.findall(r"CREATE INDEX IF NOT EXISTS (\w+)\s+ON (\w+)", sql)
+
+
+def _time_calls(fn: Callable[[int], object], iterations: int) -> float:
+    samples: List[float] = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        fn(i)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e6
+
+
+def _seed(session_factory, rows: int) -> List[int]:
+    """Insert ``rows`` entities and characters; return the location ids used."""
+    with session_factory() as session:
+        place_id = session.execute(text("SELECT MIN(place_id) FROM place")).scalar()
+        if place_id is None:
+            session.execute(text("INSERT INTO place (name) VALUES ('Bench Town')"))
+            place_id = session.execute(text("SELECT MIN(place_id) FROM place")).scalar()
+        session.execute(
+            text("INSERT INTO location (x, y, place_id) VALUES (:x, -1000000, :place_id)"),
+            [{"x": x, "place_id": place_id} for x in range(LOCATIONS)],
+        )
+        location_ids = list(
+            session.execute(text("SELECT location_id FROM location WHERE y = -1000000 ORDER BY location_id")).scalars()
+        )
+        session.execute(text("INSERT INTO entity_type (name) VALUES ('bench')"))
+        entity_type_id = session.execute(text("SELECT MAX(entity_type_id) FROM entity_type")).scalar()
+        character_type_id = session.execute(text("SELECT MIN(character_type_id) FROM character_type")).scalar()
+        class_id = session.execute(text("SELECT MIN(class_id) FROM class")).scalar()
+        first_entity = (session.execute(text("SELECT MAX(entity_id) FROM entity")).scalar() or 0) + 1
+        first_character = (session.execute(text("SELECT MAX(character_id) FROM `character`")).scalar() or 0) + 1
+
+        for start in range(0, rows, SEED_CHUNK):
+            ids = range(start, min(start + SEED_CHUNK, rows))
+            session.execute(
+                text(
+                    "INSERT INTO entity (entity_id, entity_type_id, name, level, armour_class, attack_bonus, "
+                    "damage_dice, hp_max, kind) VALUES (:id, :type_id, :name, :level, 12, 3, '1d8', 10, 'beast')"
+                ),
+                [
+                    {"id": first_entity + i, "type_id": entity_type_id, "name": f"Bench Beast {i}", "level": i % 30 + 1}
+                    for i in ids
+                ],
+            )
+            session.execute(
+                text("INSERT INTO entity_location (entity_id, location_id) VALUES (:id, :loc)"),
+                [{"id": first_entity + i, "loc": location_ids[i % LOCATIONS]} for i in ids],
+            )
+            session.execute(
+                text(
+                    "INSERT INTO `character` (character_id, character_type_id, name, alive, level, xp, money, "
+                    "hp_current, hp_max) VALUES (:id, :type_id, :name, 1, 1, 0, 0, 10, 10)"
+                ),
+                [{"id": first_character + i, "type_id": character_type_id, "name": f"Bench Hero {i}"} for i in ids],
+            )
+            session.execute(
+                text("INSERT INTO character_location (character_id, location_id) VALUES (:id, :loc)"),
+                [{"id": first_character + i, "loc": location_ids[i % LOCATIONS]} for i in ids],
+            )
+            if class_id is not None:
+                session.execute(
+                    text("INSERT INTO character_class (character_id, class_id) VALUES (:id, :class_id)"),
+                    [{"id": first_character + i, "class_id": class_id} for i in ids],
+                )
+        session.commit()
+    return location_ids
+
+
+def _cases(char_repo, entity_repo, spell_repo, location_ids: Sequence[int]) -> Dict[str, Callable[[int], object]]:
+    first_character = char_repo.list_page(limit=1)[0].id
+
+    def at(i: int) -> int:
+        return location_ids[i % len(location_ids)]
+
+    return {
+        "character.get": lambda i: char_repo.get(first_character + i),
+        "character.find_by_location": lambda i: char_repo.find_by_location(at(i)),
+        "character.list_page": lambda i: char_repo.list_page(after_id=first_character + i * 100, limit=50),
+        "entity.list_by_level_band": lambda i: entity_repo.list_by_level_band(i % 30 + 1, i % 30 + 1),
+        "entity.list_by_location": lambda i: entity_repo.list_by_location(at(i)),
+        "spell.list_by_class": lambda i: spell_repo.list_by_class("wizard", 9),
+    }
+
+
+def _run(
+    name: str,
+    session_factory,
+    repos,
+    location_ids: Sequence[int],
+    indexes: Sequence[Tuple[str, str]],
+    drop_sql: str,
+    analyze_sql: str,
+    create_indexes: Callable[[], None],
+    iterations: int,
+) -> None:
+    cases = _cases(*repos, location_ids)
+    results: Dict[str, List[float]] = {case: [] for case in cases}
+    for phase in ("before", "after"):
+        if phase == "before":
+            with session_factory() as session:
+                for index, table in indexes:
+                    session.execute(text(drop_sql.format(index=index, table=table)))
+                session.commit()
+        else:
+            create_indexes()
+        with session_factory() as session:
+            session.execute(text(analyze_sql))
+            session.commit()
+        for case, fn in cases.items():
+            results[case].append(_time_calls(fn, iterations))
+
+    for case, (before, after) in results.items():
+        print(
+            f"{name:<7} {case:<28} before {before:10.1f} us  after {after:10.1f} us  "
+            f"speedup {before / after if after else float('inf'):6.1f}x"
+        )
+
+
+def bench_sqlite(rows: int, iterations: int) -> None:
+    from rpg.infrastructure.db.sqlite.connection import create_session_factory, ensure_schema
+    from rpg.infrastructure.db.sqlite.repos import (
+        SqliteCharacterRepository,
+        SqliteEntityRepository,
+        SqliteSpellRepository,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        session_factory = create_session_factory(f"sqlite:///{Path(tmp) / 'bench.sqlite3'}")
+        engine = session_factory.kw["bind"]
+        location_ids = _seed(session_factory, rows)
+        repos = (
+            SqliteCharacterRepository(session_factory),
+            SqliteEntityRepository(session_factory),
+            SqliteSpellRepository(session_factory),
+        )
+        _run(
+            "sqlite",
+            session_factory,
+            repos,
+            location_ids,
+            SQLITE_INDEXES,
+            "DROP INDEX IF EXISTS {index}",
+            "ANALYZE",
+            lambda: ensure_schema(engine),
+            iterations,
+        )
+        engine.dispose()
+
+
+def bench_mysql(rows: int, iterations: int) -> None:
+    url = os.getenv("RPG_MYSQL_URL")
+    if not url:
+        print("mysql   skipped (set RPG_MYSQL_URL to a scratch database to include it)")
+        return
+    os.environ["RPG_DATABASE_URL"] = url
+    from rpg.infrastructure.db.mysql.connection import SessionLocal
+    from rpg.infrastructure.db.mysql.repos import (
+        MysqlCharacterRepository,
+        MysqlEntityRepository,
+        MysqlSpellRepository,
+    )
+
+    def apply_migration() -> None:
+        with SessionLocal() as session:
+            for statement in MIGRATION.read_text(encoding="utf-8").split(";"):
+                lines = [line for line in statement.splitlines() if not line.lstrip().startswith("--")]
+                if "".join(lines).strip():
+                    session.execute(text("\n".join(lines)))
+            session.commit()
+
+    location_ids = _seed(SessionLocal, rows)
+    _run(
+        "mysql",
+        SessionLocal,
+        (MysqlCharacterRepository(), MysqlEntityRepository(), MysqlSpellRepository()),
+        location_ids,
+        _migration_indexes(),
+        "DROP INDEX IF EXISTS {index} ON {table}",
+        "ANALYZE TABLE entity, entity_location, `character`, character_location, character_class",
+        apply_migration,
+        iterations,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the hot-path schema indexes")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    bench_sqlite(args.rows, args.iterations)
+    bench_mysql(args.rows, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Time mapping raw Open5e monsters into entities, serially and across processes.
+
+Usage:
+    python benchmarks/bench_monster_mapping.py [--monsters 50000] [--processes 2 4 8] [--chunk 500] [--repeat 3]
+
+Builds synthetic monster payloads with several free-text actions each (the
+regex parsing in ``_parse_action_block`` is what dominates), then times
+``map_monster`` in a loop against ``map_monsters_parallel`` for each process
+count. Every parallel run is checked against the serial output, so the
+speedup is only reported for identical, identically ordered results.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from rpg.infrastructure.db.mysql.open5e_monster_importer import map_monster, map_monsters_parallel  # noqa: E402
+
+ACTION_NAMES = ("Multiattack", "Tail", "Claw", "Bite", "Slam", "Longsword")
+FILLER = (
+    "The target must succeed on a DC 13 Constitution saving throw or become poisoned until the end of its "
+    "next turn. On a success the creature is immune to this effect for 24 hours. "
+)
+
+
+def _monsters(count: int) -> list:
+    monsters = []
+    for i in range(count):
+        actions = [
+            {
+                "name": ACTION_NAMES[(i + n) % len(ACTION_NAMES)],
+                "desc": f"Melee Weapon Attack: +{n + i % 7} to hit, reach 5 ft., one target. "
+                f"Hit: {n + 4} ({n + 1}d{4 + 2 * (i % 4)} + {i % 5}) piercing damage. " + FILLER * (1 + i % 3),
+            }
+            for n in range(4)
+        ]
+        monsters.append(
+            {
+                "name": f"Monster {i}",
+                "challenge_rating": ("1/8", "1/2", "3", "11", "17")[i % 5],
+                "armor_class": None if i % 4 == 0 else 10 + i % 9,
+                "hit_points": None if i % 6 == 0 else 5 + i % 200,
+                "type": ("beast", "Undead", "fiend", "Dragon")[i % 4],
+                "actions": actions,
+            }
+        )
+    return monsters
+
+
+def _best_of(fn, repeat: int):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark serial vs process-pool monster mapping")
+    parser.add_argument("--monsters", type=int, default=50_000)
+    parser.add_argument("--processes", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--chunk", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    monsters = _monsters(args.monsters)
+    serial_ms, expected = _best_of(lambda: [map_monster(monster) for monster in monsters], args.repeat)
+    print(f"serial          {serial_ms:9.1f} ms for {len(monsters)} monsters")
+    for processes in args.processes:
+        parallel_ms, entities = _best_of(
+            lambda: map_monsters_parallel(monsters, processes=processes, chunk_size=args.chunk), args.repeat
+        )
+        if entities != expected:
+            raise SystemExit(f"{processes} processes produced different entities than serial mapping")
+        print(f"{processes:2d} processes    {parallel_ms:9.1f} ms  speedup {serial_ms / parallel_ms:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
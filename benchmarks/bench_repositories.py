@@ -0,0 +1,133 @@
+"""Compare per-call latency of the in-memory, SQLite and MySQL repositories.
+
+Usage:
+    python benchmarks/bench_repositories.py [--iterations 2000]
+
+MySQL is only measured when ``RPG_MYSQL_URL`` points at a database that has
+the schema from ``create_tables.sql`` and the migrations applied.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from rpg.domain.models.character import Character  # noqa: E402
+from rpg.infrastructure.inmemory.inmemory_character_repo import InMemoryCharacterRepository  # noqa: E402
+from rpg.infrastructure.inmemory.inmemory_entity_repo import InMemoryEntityRepository  # noqa: E402
+from rpg.infrastructure.inmemory.inmemory_world_repo import InMemoryWorldRepository  # noqa: E402
+
+
+def _time_calls(fn: Callable[[], object], iterations: int) -> Dict[str, float]:
+    samples: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return {
+        "mean_us": statistics.fmean(samples) * 1e6,
+        "p50_us": samples[len(samples) // 2] * 1e6,
+        "p95_us": samples[int(len(samples) * 0.95) - 1] * 1e6,
+    }
+
+
+def _run_backend(name: str, char_repo, entity_repo, world_repo, location_id: int, iterations: int) -> None:
+    character = char_repo.create(Character(id=None, name="Bench"), location_id)
+    world = world_repo.load_default()
+
+    def save_character() -> None:
+        character.hp_current = 1 if character.hp_current != 1 else 2
+        char_repo.save(character)
+
+    def tick_world() -> None:
+        world.current_turn += 1
+        world_repo.save(world)
+
+    cases = {
+        "character.get": lambda: char_repo.get(character.id),
+        "character.save": save_character,
+        "entity.list_for_level": lambda: entity_repo.list_for_level(3),
+        "world.save": tick_world,
+    }
+    for case, fn in cases.items():
+        stats = _time_calls(fn, iterations)
+        print(f"{name:<10} {case:<24} mean={stats['mean_us']:9.1f}us p50={stats['p50_us']:9.1f}us p95={stats['p95_us']:9.1f}us")
+
+
+def bench_inmemory(iterations: int) -> None:
+    _run_backend(
+        "inmemory",
+        InMemoryCharacterRepository(),
+        InMemoryEntityRepository(),
+        InMemoryWorldRepository(),
+        location_id=1,
+        iterations=iterations,
+    )
+
+
+def bench_sqlite(iterations: int) -> None:
+    from rpg.infrastructure.db.sqlite.connection import create_session_factory
+    from rpg.infrastructure.db.sqlite.repos import (
+        SqliteCharacterRepository,
+        SqliteEntityRepository,
+        SqliteLocationRepository,
+        SqliteWorldRepository,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        session_factory = create_session_factory(f"sqlite:///{Path(tmp) / 'bench.sqlite3'}")
+        location = SqliteLocationRepository(session_factory).get_starting_location()
+        _run_backend(
+            "sqlite",
+            SqliteCharacterRepository(session_factory),
+            SqliteEntityRepository(session_factory),
+            SqliteWorldRepository(session_factory),
+            location_id=location.id,
+            iterations=iterations,
+        )
+        session_factory.kw["bind"].dispose()
+
+
+def bench_mysql(iterations: int) -> None:
+    url = os.getenv("RPG_MYSQL_URL")
+    if not url:
+        print("mysql      skipped (set RPG_MYSQL_URL to include it)")
+        return
+    os.environ["RPG_DATABASE_URL"] = url
+    from rpg.infrastructure.db.mysql.repos import (
+        MysqlCharacterRepository,
+        MysqlEntityRepository,
+        MysqlLocationRepository,
+        MysqlWorldRepository,
+    )
+
+    location = MysqlLocationRepository().get_starting_location()
+    _run_backend(
+        "mysql",
+        MysqlCharacterRepository(),
+        MysqlEntityRepository(),
+        MysqlWorldRepository(),
+        location_id=location.id,
+        iterations=iterations,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark repository backends")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    bench_inmemory(args.iterations)
+    bench_sqlite(args.iterations)
+    bench_mysql(args.iterations)
+
+
+if __name__ == "__main__":
+    main()
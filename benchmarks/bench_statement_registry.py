@@ -0,0 +1,113 @@
+"""Time repository-style reads with per-call vs. shared SQL statements.
+
+Usage:
+    python benchmarks/bench_statement_registry.py [--calls 20000] [--repeat 5]
+
+"inline" builds the ``text()`` clause (and, for ``get_many``, the expanding
+``bindparam``) on every call, as the MySQL repositories used to; "registry"
+executes the prebuilt constants from ``rpg.infrastructure.db.portable``.
+Both run against one in-memory SQLite connection so the difference is the
+Python-side statement overhead, not I/O.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sqlalchemy import bindparam, create_engine, text  # noqa: E402
+
+from rpg.infrastructure.db.entity_mapper import ENTITY_COLUMNS, qualified_entity_columns  # noqa: E402
+from rpg.infrastructure.db import portable  # noqa: E402
+
+
+def _inline_by_location(conn, location_id: int):
+    return conn.execute(
+        text(
+            f"""
+            SELECT {qualified_entity_columns("e")}
+            FROM entity e
+            JOIN entity_location el ON el.entity_id = e.entity_id
+            WHERE el.location_id = :loc
+            """
+        ),
+        {"loc": location_id},
+    ).all()
+
+
+def _inline_get_many(conn, entity_ids):
+    return conn.execute(
+        text(
+            f"""
+            SELECT {ENTITY_COLUMNS}
+            FROM entity
+            WHERE entity_id IN :ids
+            """
+        ).bindparams(bindparam("ids", expanding=True)),
+        {"ids": entity_ids},
+    ).all()
+
+
+def _registry_by_location(conn, location_id: int):
+    return conn.execute(portable.ENTITIES_AT_LOCATION, {"loc": location_id}).all()
+
+
+def _registry_get_many(conn, entity_ids):
+    return conn.execute(portable.ENTITIES_BY_ID, {"ids": entity_ids}).all()
+
+
+def _seed(conn) -> None:
+    conn.execute(
+        text(
+            "CREATE TABLE entity (entity_id INTEGER PRIMARY KEY, name TEXT, level INTEGER, "
+            "armour_class INTEGER, attack_bonus INTEGER, damage_dice TEXT, hp_max INTEGER, kind TEXT)"
+        )
+    )
+    conn.execute(text("CREATE TABLE entity_location (entity_id INTEGER PRIMARY KEY, location_id INTEGER)"))
+    conn.execute(text("CREATE INDEX idx_entity_location_location ON entity_location (location_id)"))
+    conn.execute(
+        text("INSERT INTO entity (entity_id, name, level) VALUES (:id, :name, 1)"),
+        [{"id": i, "name": f"Monster {i}"} for i in range(1, 11)],
+    )
+    conn.execute(
+        text("INSERT INTO entity_location (entity_id, location_id) VALUES (:id, 1)"),
+        [{"id": i} for i in range(1, 4)],
+    )
+
+
+def _best_of(fn, conn, arg, calls: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn(conn, arg)
+        best = min(best, time.perf_counter() - start)
+    return best / calls * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the SQL statement registry")
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        _seed(conn)
+        cases = (
+            ("list_by_location", _inline_by_location, _registry_by_location, 1),
+            ("get_many", _inline_get_many, _registry_get_many, [1, 2, 3]),
+        )
+        for label, inline, registry, arg in cases:
+            before = _best_of(inline, conn, arg, args.calls, args.repeat)
+            after = _best_of(registry, conn, arg, args.calls, args.repeat)
+            print(
+                f"{label:<17} inline {before:7.1f} us/call  registry {after:7.1f} us/call  "
+                f"saved {before - after:5.1f} us ({1 - after / before:.0%})"
+            )
+
+
+if __name__ == "__main__":
+    main()
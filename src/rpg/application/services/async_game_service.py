@@ -0,0 +1,204 @@
+import random
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import Callable, Optional
+
+from rpg.application.dtos import ActionResult, EncounterPlan
+from rpg.application.services.encounter_service import EncounterService
+from rpg.application.services.event_bus import EventBus
+from rpg.application.services.game_service import pick_weighted_encounter, resolve_combat
+from rpg.domain.events import TickAdvanced
+from rpg.domain.models.character import Character
+from rpg.domain.models.entity import Entity
+from rpg.domain.models.location import Location
+from rpg.domain.models.world import World
+from rpg.domain.repositories import (
+    AsyncCharacterRepository,
+    AsyncEntityRepository,
+    AsyncLocationRepository,
+    AsyncWorldRepository,
+    EncounterDefinitionRepository,
+)
+
+
+class AsyncGameService:
+    """Asyncio front end for the core game loop.
+
+    Mirrors ``GameService.make_choice`` / ``explore`` / ``rest`` on top of the
+    async repositories, so one process can serve many players while their
+    database round trips overlap. Encounter and combat rules are shared with
+    ``GameService``; only the I/O differs.
+    """
+
+    def __init__(
+        self,
+        character_repo: AsyncCharacterRepository,
+        entity_repo: AsyncEntityRepository | None = None,
+        location_repo: AsyncLocationRepository | None = None,
+        world_repo: AsyncWorldRepository | None = None,
+        event_bus: EventBus | None = None,
+        unit_of_work_factory: Callable[[], AbstractAsyncContextManager] | None = None,
+        definition_repo: EncounterDefinitionRepository | None = None,
+    ) -> None:
+        self.character_repo = character_repo
+        self.entity_repo = entity_repo
+        self.location_repo = location_repo
+        self.world_repo = world_repo
+        # Definitions are static, in-memory data, so a sync repository is fine.
+        self.definition_repo = definition_repo
+        self.event_bus = event_bus or EventBus()
+        self.unit_of_work_factory = unit_of_work_factory
+        # Only the pure pool-picking helpers are used; all loading happens here.
+        self.encounter_service = EncounterService(entity_repo) if entity_repo else None
+
+    async def rest(self, character_id: int) -> tuple[Character, Optional[World]]:
+        async with self._unit_of_work():
+            character = await self._require_character(character_id)
+            heal_amount = max(character.hp_max // 4, 4)
+            character.hp_current = min(character.hp_current + heal_amount, character.hp_max)
+            character.alive = True
+            character.spell_slots_current = character.spell_slots_max
+            await self.character_repo.save(character)
+            world = await self.advance_world(ticks=1)
+            return character, world
+
+    async def advance_world(self, ticks: int = 1) -> Optional[World]:
+        if not self.world_repo:
+            return None
+        world = await self._require_world()
+        await self.world_repo.advance(world, ticks)
+        self.event_bus.publish(TickAdvanced(turn_after=world.current_turn))
+        return world
+
+    async def explore(self, character_id: int):
+        async with self._unit_of_work():
+            character = await self._require_character(character_id)
+            world = await self._require_world()
+
+            if not self.encounter_service:
+                return EncounterPlan(enemies=[], source="disabled"), character, world
+
+            location = await self.location_repo.get(character.location_id) if self.location_repo else None
+            faction_bias = location.factions[0] if location and location.factions else None
+            plan = await self._generate_plan(
+                location_id=character.location_id or 0,
+                player_level=character.level,
+                world_turn=world.current_turn,
+                faction_bias=faction_bias,
+                max_enemies=2,
+            )
+
+            await self.advance_world(ticks=1)
+            return plan, character, world
+
+    async def make_choice(self, player_id: int, choice: str) -> ActionResult:
+        choice = choice.strip().lower()
+        if choice not in {"explore", "rest", "quit"}:
+            return ActionResult(messages=["Unknown action."], game_over=False)
+
+        if choice == "quit":
+            return ActionResult(messages=["Goodbye."], game_over=True)
+
+        async with self._unit_of_work():
+            world = await self._require_world()
+            character = await self._require_character(player_id)
+            location = await self.location_repo.get(character.location_id) if self.location_repo else None
+
+            if choice == "rest":
+                await self.rest(player_id)
+                return ActionResult(messages=["You rest and feel a bit better."], game_over=False)
+
+            encounter_msg = await self._run_encounter(character, world, location)
+            await self.character_repo.save(character)
+            await self.advance_world(ticks=1)
+            return ActionResult(messages=[encounter_msg], game_over=not character.alive)
+
+    async def _generate_plan(
+        self,
+        location_id: int,
+        player_level: int,
+        world_turn: int,
+        faction_bias: str | None,
+        max_enemies: int,
+    ) -> EncounterPlan:
+        service = self.encounter_service
+        seed = service.encounter_seed(location_id, player_level, world_turn, faction_bias, max_enemies)
+        # A private generator per plan: seeding the global one would let other
+        # tasks draw from it across the awaits below and break determinism.
+        rng = random.Random(seed)
+
+        if self.definition_repo:
+            definitions = self.definition_repo.list_for_location(location_id)
+            if not definitions:
+                definitions = self.definition_repo.list_global()
+            applicable = service.planner.applicable_definitions(definitions, player_level, location_id)
+            ids = service.planner.slot_entity_ids(applicable)
+            loaded = await self.entity_repo.get_many(ids) if ids else []
+            chosen, enemies = service.planner.plan_encounter(
+                definitions=applicable,
+                player_level=player_level,
+                location_id=location_id,
+                seed=seed,
+                faction_bias=faction_bias,
+                max_enemies=max_enemies,
+                entity_lookup={entity.id: entity for entity in loaded},
+            )
+            if enemies:
+                return EncounterPlan(
+                    enemies=enemies,
+                    definition_id=chosen.id if chosen else None,
+                    faction_bias=faction_bias,
+                    source="definition",
+                )
+
+        by_location = await self.entity_repo.list_by_location(location_id)
+        if by_location:
+            return service.plan_from_pool(by_location, "location", faction_bias, max_enemies, rng)
+
+        level_min, level_max = service.level_band(player_level)
+        band = await self.entity_repo.list_by_level_band(level_min, level_max)
+        return service.plan_from_pool(band, "level-band", faction_bias, max_enemies, rng)
+
+    async def _run_encounter(self, character: Character, world: World, location: Optional[Location]) -> str:
+        rng = random.Random(world.rng_seed + world.current_turn + character.location_id)
+        monster = await self._pick_monster(character, location, rng)
+        if monster is None:
+            return "The ruins are silent. Nothing happens."
+
+        evade_roll = rng.random()
+        if evade_roll > 0.8:
+            return f"You spot signs of {monster.name} and steer clear before it notices you."
+
+        return resolve_combat(character, monster, rng, world, location, self.event_bus)
+
+    async def _pick_monster(
+        self, character: Character, location: Optional[Location], rng: random.Random
+    ) -> Optional[Entity]:
+        if location and location.encounters:
+            candidates = await self.entity_repo.get_many([entry.entity_id for entry in location.encounters])
+            monster = pick_weighted_encounter(character, location, candidates, rng)
+            if monster is not None:
+                return monster
+
+        choices = await self.entity_repo.list_by_location(character.location_id)
+        if not choices:
+            choices = await self.entity_repo.list_for_level(target_level=character.level)
+        if not choices:
+            return None
+        return rng.choice(choices)
+
+    def _unit_of_work(self) -> AbstractAsyncContextManager:
+        if self.unit_of_work_factory is None:
+            return nullcontext()
+        return self.unit_of_work_factory()
+
+    async def _require_world(self) -> World:
+        world = await self.world_repo.load_default()
+        if world is None:
+            raise ValueError("World not initialized")
+        return world
+
+    async def _require_character(self, player_id: int) -> Character:
+        character = await self.character_repo.get(player_id)
+        if character is None:
+            raise ValueError("Character not found")
+        return character
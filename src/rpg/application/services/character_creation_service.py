@@ -1,6 +1,9 @@
 import random
-from typing import Dict, List
+import threading
+from contextlib import AbstractContextManager, nullcontext
+from typing import Callable, Dict, List
 
+from rpg.domain.models.character import Character
 from rpg.domain.models.character_class import CharacterClass
 from rpg.domain.models.character_options import Background, DifficultyPreset, Race
 from rpg.domain.repositories import CharacterRepository, ClassRepository, LocationRepository
@@ -21,11 +24,17 @@ class CharacterCreationService:
         class_repo: ClassRepository,
         location_repo: LocationRepository,
         open5e_client=None,
+        operation_tracer: Callable[[str], AbstractContextManager] | None = None,
+        race_catalog=None,
     ):
         self.character_repo = character_repo
+        self.operation_tracer = operation_tracer
         self.class_repo = class_repo
         self.location_repo = location_repo
-        self.races: List[Race] = self._load_races(open5e_client)
+        self.race_catalog = race_catalog
+        self._races_ready = threading.Event()
+        self.races: List[Race] = self._default_races()
+        self._load_races(open5e_client)
         self.backgrounds: List[Background] = self._default_backgrounds()
         self.difficulties: List[DifficultyPreset] = self._default_difficulties()
         self.starting_equipment: Dict[str, List[str]] = self._default_starting_equipment()
@@ -36,6 +45,10 @@ class CharacterCreationService:
     def list_races(self) -> List[Race]:
         return list(self.races)
 
+    def wait_for_races(self, timeout: float | None = None) -> bool:
+        """Block until the remote race catalog has loaded (or failed); False on timeout."""
+        return self._races_ready.wait(timeout)
+
     def list_backgrounds(self) -> List[Background]:
         return list(self.backgrounds)
 
@@ -50,7 +63,20 @@ class CharacterCreationService:
         race: Race | None = None,
         background: Background | None = None,
         difficulty: DifficultyPreset | None = None,
-    ) -> "Character":
+    ) -> Character:
+        tracer = self.operation_tracer("create_character") if self.operation_tracer else nullcontext()
+        with tracer:
+            return self._create_character(name, class_index, ability_scores, race, background, difficulty)
+
+    def _create_character(
+        self,
+        name: str,
+        class_index: int,
+        ability_scores: Dict[str, int] | None,
+        race: Race | None,
+        background: Background | None,
+        difficulty: DifficultyPreset | None,
+    ) -> Character:
         name = self.sanitize_name(name)
         classes = self.class_repo.list_playable()
         if class_index < 0 or class_index >= len(classes):
@@ -143,22 +169,57 @@ class CharacterCreationService:
             Race(name="Halfling", bonuses={"DEX": 2, "CHA": 1}, speed=25, traits=["Lucky", "Brave"]),
         ]
 
-    def _load_races(self, open5e_client) -> List[Race]:
-        defaults = self._default_races()
-        if open5e_client is None:
-            return defaults
+    def _load_races(self, open5e_client) -> None:
+        """Add any cached catalog to the default races now; refresh from Open5e in the background.
+
+        A fresh on-disk catalog skips the network entirely, so startup never
+        waits on Open5e. Otherwise the client pages through ``/races/`` on a
+        daemon thread and ``self.races`` is swapped once it finishes.
+        """
+        cached = None
+        if self.race_catalog is not None:
+            try:
+                cached = self.race_catalog.load()
+                if cached:
+                    self.races = self._merge_races(self.races, [self._map_open5e_race(row) for row in cached])
+            except Exception:
+                cached = None
+
+        if open5e_client is None or (cached and self.race_catalog.is_fresh()):
+            self._close_client(open5e_client)
+            self._races_ready.set()
+            return
 
-        remote: List[Race] = []
+        threading.Thread(
+            target=self._refresh_races, args=(open5e_client,), name="open5e-races", daemon=True
+        ).start()
+
+    def _refresh_races(self, open5e_client) -> None:
         try:
-            remote = self._fetch_open5e_races(open5e_client)
+            rows = self._fetch_open5e_race_rows(open5e_client)
+            if self.race_catalog is not None:
+                try:
+                    self.race_catalog.save(rows)
+                except Exception:
+                    pass
+            self.races = self._merge_races(self._default_races(), [self._map_open5e_race(row) for row in rows])
         except Exception:
-            remote = []
+            pass
         finally:
-            try:
-                open5e_client.close()
-            except Exception:
-                pass
+            self._close_client(open5e_client)
+            self._races_ready.set()
+
+    @staticmethod
+    def _close_client(open5e_client) -> None:
+        if open5e_client is None:
+            return
+        try:
+            open5e_client.close()
+        except Exception:
+            pass
 
+    @staticmethod
+    def _merge_races(defaults: List[Race], remote: List[Race]) -> List[Race]:
         seen = {race.name.lower() for race in defaults}
         merged: List[Race] = list(defaults)
         for race in remote:
@@ -167,20 +228,20 @@ class CharacterCreationService:
                 seen.add(race.name.lower())
         return merged
 
-    def _fetch_open5e_races(self, client) -> List[Race]:
-        races: List[Race] = []
+    @staticmethod
+    def _fetch_open5e_race_rows(client) -> List[dict]:
+        rows: List[dict] = []
         page = 1
         while True:
             payload = client.list_races(page=page)
             results = payload.get("results", [])
             if not results:
                 break
-            for row in results:
-                races.append(self._map_open5e_race(row))
+            rows.extend(results)
             if not payload.get("next"):
                 break
             page += 1
-        return races
+        return rows
 
     def _map_open5e_race(self, row: dict) -> Race:
         name = row.get("name", "Unknown")
@@ -26,14 +26,19 @@ class EncounterService:
         self.faction_repo = faction_repo
         self.planner = EncounterPlanner(entity_repo)
 
-    def _weighted_pick(self, pool: list[Entity], count: int, faction_bias: str | None) -> list[Entity]:
+    def _weighted_pick(
+        self, pool: list[Entity], count: int, faction_bias: str | None, rng: random.Random | None = None
+    ) -> list[Entity]:
+        # Without an rng this draws from the module-level generator that
+        # generate_plan seeds, as it always has.
+        rng = rng or random
         if not pool:
             return []
         if count <= 1:
             if faction_bias:
                 weights = [2 if entity.faction_id == faction_bias else 1 for entity in pool]
-                return [random.choices(pool, weights=weights, k=1)[0]]
-            return [random.choice(pool)]
+                return [rng.choices(pool, weights=weights, k=1)[0]]
+            return [rng.choice(pool)]
 
         remaining = list(pool)
         picks: list[Entity] = []
@@ -42,9 +47,9 @@ class EncounterService:
                 break
             if faction_bias:
                 weights = [2 if entity.faction_id == faction_bias else 1 for entity in remaining]
-                chosen = random.choices(remaining, weights=weights, k=1)[0]
+                chosen = rng.choices(remaining, weights=weights, k=1)[0]
             else:
-                chosen = random.choice(remaining)
+                chosen = rng.choice(remaining)
             picks.append(chosen)
             remaining = [entity for entity in remaining if entity.id != chosen.id]
         return picks
@@ -59,8 +64,7 @@ class EncounterService:
     ) -> EncounterPlan:
         """Return a deterministic encounter plan for the given context."""
 
-        seed_material = f"{location_id}:{player_level}:{world_turn}:{faction_bias}:{max_enemies}"
-        seed = int(hashlib.sha256(seed_material.encode("utf-8")).hexdigest(), 16) % (2**32)
+        seed = self.encounter_seed(location_id, player_level, world_turn, faction_bias, max_enemies)
         random.seed(seed)
 
         if self.definition_repo:
@@ -85,12 +89,9 @@ class EncounterService:
 
         by_location = self.entity_repo.list_by_location(location_id)
         if by_location:
-            count = min(max(1, max_enemies), len(by_location))
-            enemies = self._weighted_pick(by_location, count, faction_bias)
-            return EncounterPlan(enemies=enemies, faction_bias=faction_bias, source="location")
+            return self.plan_from_pool(by_location, "location", faction_bias, max_enemies)
 
-        level_min = max(1, player_level - 1)
-        level_max = player_level + 2
+        level_min, level_max = self.level_band(player_level)
         candidates = getattr(self.entity_repo, "list_by_level_band", None)
         if callable(candidates):
             band = self.entity_repo.list_by_level_band(level_min, level_max)
@@ -98,12 +99,36 @@ class EncounterService:
             mid = (level_min + level_max) // 2
             band = self.entity_repo.list_for_level(mid, tolerance=level_max - mid)
 
-        if not band:
-            return EncounterPlan(enemies=[], faction_bias=faction_bias, source="empty")
+        return self.plan_from_pool(band, "level-band", faction_bias, max_enemies)
+
+    @staticmethod
+    def encounter_seed(
+        location_id: int, player_level: int, world_turn: int, faction_bias: str | None, max_enemies: int
+    ) -> int:
+        seed_material = f"{location_id}:{player_level}:{world_turn}:{faction_bias}:{max_enemies}"
+        return int(hashlib.sha256(seed_material.encode("utf-8")).hexdigest(), 16) % (2**32)
+
+    @staticmethod
+    def level_band(player_level: int) -> tuple[int, int]:
+        return max(1, player_level - 1), player_level + 2
 
-        count = min(max(1, max_enemies), len(band))
-        enemies = self._weighted_pick(band, count, faction_bias)
-        return EncounterPlan(enemies=enemies, faction_bias=faction_bias, source="level-band")
+    def plan_from_pool(
+        self,
+        pool: list[Entity],
+        source: str,
+        faction_bias: str | None,
+        max_enemies: int,
+        rng: random.Random | None = None,
+    ) -> EncounterPlan:
+        """Pick enemies from an already-loaded pool (used by the async service too).
+
+        Pass ``rng`` to draw from a private generator instead of the global one.
+        """
+        if not pool:
+            return EncounterPlan(enemies=[], faction_bias=faction_bias, source="empty")
+        count = min(max(1, max_enemies), len(pool))
+        enemies = self._weighted_pick(pool, count, faction_bias, rng)
+        return EncounterPlan(enemies=enemies, faction_bias=faction_bias, source=source)
 
     def generate(
         self,
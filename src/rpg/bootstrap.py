@@ -12,6 +12,7 @@ from rpg.infrastructure.inmemory.inmemory_faction_repo import InMemoryFactionRep
 from rpg.infrastructure.inmemory.inmemory_location_repo import InMemoryLocationRepository
 from rpg.infrastructure.inmemory.inmemory_world_repo import InMemoryWorldRepository
 from rpg.infrastructure.open5e_client import Open5eClient
+from rpg.infrastructure.race_catalog_cache import RaceCatalogFile
 
 
 def _build_inmemory_game_service() -> GameService:
@@ -31,6 +32,7 @@ def _build_inmemory_game_service() -> GameService:
         entity_repo=entity_repo,
         world_repo=world_repo,
         open5e_client_factory=Open5eClient,
+        race_catalog=RaceCatalogFile.from_env(use_default_path=False),
     )
 
 
@@ -44,12 +46,59 @@ def _build_mysql_game_service():
         MysqlWorldRepository,
         MysqlSpellRepository,
     )
+    from rpg.infrastructure.db.history_recorder import HistoryRecorder
+    from rpg.infrastructure.db.mysql.connection import SessionLocal
+    from rpg.infrastructure.db.mysql.unit_of_work import MysqlUnitOfWork, run_after_commit
+    from rpg.infrastructure.db.write_behind_world_repo import WriteBehindWorldRepository
 
-    char_repo = MysqlCharacterRepository()
+    # Requires create_history_tables.sql; off unless asked for.
+    history = HistoryRecorder(SessionLocal) if os.getenv("RPG_RECORD_HISTORY") else None
+    char_repo = MysqlCharacterRepository(history=history)
     loc_repo = MysqlLocationRepository()
     cls_repo = MysqlClassRepository()
-    entity_repo = MysqlEntityRepository()
-    world_repo = MysqlWorldRepository()
+    entity_repo = MysqlEntityRepository(history=history)
+    world_repo = WriteBehindWorldRepository(
+        MysqlWorldRepository(history=history),
+        flush_interval=float(os.getenv("RPG_WORLD_FLUSH_INTERVAL", "5")),
+        after_commit=run_after_commit,
+    )
+
+    event_bus = EventBus()
+    progression = WorldProgression(world_repo, entity_repo, event_bus)
+
+    return GameService(
+        char_repo,
+        location_repo=loc_repo,
+        class_repo=cls_repo,
+        entity_repo=entity_repo,
+        world_repo=world_repo,
+        progression=progression,
+        open5e_client_factory=Open5eClient,
+        race_catalog=RaceCatalogFile.from_env(),
+        unit_of_work_factory=MysqlUnitOfWork,
+    )
+
+
+def _build_sqlite_game_service(database_url: str) -> GameService:
+    from rpg.infrastructure.db.sqlite.connection import create_session_factory
+    from rpg.infrastructure.db.sqlite.repos import (
+        SqliteCharacterRepository,
+        SqliteClassRepository,
+        SqliteEntityRepository,
+        SqliteLocationRepository,
+        SqliteWorldRepository,
+    )
+    from rpg.infrastructure.db.write_behind_world_repo import WriteBehindWorldRepository
+
+    session_factory = create_session_factory(database_url)
+    char_repo = SqliteCharacterRepository(session_factory)
+    loc_repo = SqliteLocationRepository(session_factory)
+    cls_repo = SqliteClassRepository(session_factory)
+    entity_repo = SqliteEntityRepository(session_factory)
+    world_repo = WriteBehindWorldRepository(
+        SqliteWorldRepository(session_factory),
+        flush_interval=float(os.getenv("RPG_WORLD_FLUSH_INTERVAL", "5")),
+    )
 
     event_bus = EventBus()
     progression = WorldProgression(world_repo, entity_repo, event_bus)
@@ -62,11 +111,16 @@ def _build_mysql_game_service():
         world_repo=world_repo,
         progression=progression,
         open5e_client_factory=Open5eClient,
+        race_catalog=RaceCatalogFile.from_env(),
     )
 
 
 def create_game_service() -> GameService:
-    use_mysql = os.getenv("RPG_DATABASE_URL")
+    database_url = os.getenv("RPG_DATABASE_URL")
+    if database_url and database_url.startswith("sqlite"):
+        return _build_sqlite_game_service(database_url)
+
+    use_mysql = database_url
     if use_mysql:
         try:
             return _build_mysql_game_service()
@@ -0,0 +1,42 @@
+from copy import deepcopy
+from typing import Any, ClassVar, Dict, FrozenSet, Optional, Tuple
+
+
+class ChangeTracked:
+    """Snapshot-based dirty tracking for the persisted fields of a model.
+
+    Repositories call ``mark_clean`` after loading or saving an object and
+    ``dirty_fields`` before writing it, so a save only touches what changed.
+    Comparing against a snapshot (rather than hooking ``__setattr__``) also
+    catches in-place edits to mutable fields such as ``World.flags``.
+    """
+
+    _tracked_fields: ClassVar[Tuple[str, ...]] = ()
+
+    def clean_snapshot(self) -> Dict[str, Any]:
+        """Copy the tracked fields as they are now, for a later ``mark_clean``."""
+        return {name: deepcopy(getattr(self, name)) for name in self._tracked_fields}
+
+    def mark_clean(self, snapshot: Optional[Dict[str, Any]] = None) -> None:
+        """Treat ``snapshot`` (default: the current state) as what storage holds."""
+        if snapshot is None:
+            snapshot = self.clean_snapshot()
+        object.__setattr__(self, "_clean_state", snapshot)
+
+    @property
+    def is_tracked(self) -> bool:
+        """True once the object has been loaded from or written to storage."""
+        return self._snapshot() is not None
+
+    def dirty_fields(self) -> FrozenSet[str]:
+        """Return the tracked fields that differ from the last clean snapshot.
+
+        Untracked objects (never loaded or saved) report every field as dirty.
+        """
+        snapshot = self._snapshot()
+        if snapshot is None:
+            return frozenset(self._tracked_fields)
+        return frozenset(name for name in self._tracked_fields if getattr(self, name) != snapshot[name])
+
+    def _snapshot(self) -> Optional[Dict[str, Any]]:
+        return self.__dict__.get("_clean_state")
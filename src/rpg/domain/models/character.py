@@ -1,5 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+
+from rpg.domain.models.change_tracking import ChangeTracked
 
 
 DEFAULT_ATTRIBUTES: Dict[str, int] = {
@@ -17,7 +19,20 @@ DEFAULT_ATTRIBUTES: Dict[str, int] = {
 
 
 @dataclass
-class Character:
+class Character(ChangeTracked):
+    _tracked_fields: ClassVar[Tuple[str, ...]] = (
+        "name",
+        "alive",
+        "level",
+        "xp",
+        "money",
+        "character_type_id",
+        "hp_current",
+        "hp_max",
+        "location_id",
+        "attributes",
+    )
+
     id: Optional[int]
     name: str
     level: int = 1
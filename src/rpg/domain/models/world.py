@@ -1,9 +1,13 @@
 from dataclasses import dataclass, field
-from typing import Any, Dict
+from typing import Any, ClassVar, Dict, Tuple
+
+from rpg.domain.models.change_tracking import ChangeTracked
 
 
 @dataclass
-class World:
+class World(ChangeTracked):
+    _tracked_fields: ClassVar[Tuple[str, ...]] = ("current_turn", "threat_level", "flags")
+
     id: int
     name: str
     current_turn: int = 0
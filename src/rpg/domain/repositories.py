@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, Iterator, List, Optional, Sequence
 
 from rpg.domain.models.character import Character
 from rpg.domain.models.entity import Entity
@@ -32,6 +32,30 @@ class CharacterRepository(ABC):
     def create(self, character: Character, location_id: int) -> Character:
         raise NotImplementedError
 
+    def save_many(self, characters: Sequence[Character]) -> None:
+        """Persist several characters; SQL backends do it in one transaction."""
+        for character in characters:
+            self.save(character)
+
+    def list_page(self, after_id: int = 0, limit: int = 50) -> List[Character]:
+        """Up to ``limit`` characters with ``id > after_id``, in id order.
+
+        Keyset pagination: pass the last id of one page as ``after_id`` to get
+        the next. The default slices ``list_all``; backends override it.
+        """
+        ordered = sorted((c for c in self.list_all() if (c.id or 0) > after_id), key=lambda c: c.id or 0)
+        return ordered[:limit]
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[Character]:
+        """Yield every character in id order, holding one page at a time."""
+        after_id = 0
+        while True:
+            page = self.list_page(after_id=after_id, limit=batch_size)
+            yield from page
+            if len(page) < batch_size:
+                return
+            after_id = page[-1].id or 0
+
 
 class WorldRepository(ABC):
     @abstractmethod
@@ -122,3 +146,114 @@ class SpellRepository(ABC):
     @abstractmethod
     def list_by_class(self, class_slug: str, max_level: int):
         raise NotImplementedError
+
+
+class AsyncCharacterRepository(ABC):
+    """Awaitable counterpart of CharacterRepository for asyncio front ends."""
+
+    @abstractmethod
+    async def get(self, character_id: int) -> Optional[Character]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_all(self) -> List[Character]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save(self, character: Character) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_location(self, location_id: int) -> List[Character]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create(self, character: Character, location_id: int) -> Character:
+        raise NotImplementedError
+
+    async def save_many(self, characters: Sequence[Character]) -> None:
+        for character in characters:
+            await self.save(character)
+
+    async def list_page(self, after_id: int = 0, limit: int = 50) -> List[Character]:
+        ordered = sorted((c for c in await self.list_all() if (c.id or 0) > after_id), key=lambda c: c.id or 0)
+        return ordered[:limit]
+
+    async def iter_all(self, batch_size: int = 500) -> AsyncIterator[Character]:
+        after_id = 0
+        while True:
+            page = await self.list_page(after_id=after_id, limit=batch_size)
+            for character in page:
+                yield character
+            if len(page) < batch_size:
+                return
+            after_id = page[-1].id or 0
+
+
+class AsyncWorldRepository(ABC):
+    @abstractmethod
+    async def load_default(self) -> Optional[World]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save(self, world: World) -> None:
+        raise NotImplementedError
+
+    async def advance(self, world: World, ticks: int = 1) -> World:
+        """Advance the persisted turn counter; backends may do this atomically."""
+        world.advance_turns(ticks)
+        await self.save(world)
+        return world
+
+
+class AsyncEntityRepository(ABC):
+    @abstractmethod
+    async def get(self, entity_id: int) -> Optional[Entity]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_many(self, entity_ids: List[int]) -> List[Entity]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_for_level(self, target_level: int, tolerance: int = 2) -> List[Entity]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_by_location(self, location_id: int) -> List[Entity]:
+        raise NotImplementedError
+
+    async def list_by_level_band(self, level_min: int, level_max: int) -> List[Entity]:
+        target = (level_min + level_max) // 2
+        tolerance = max(level_max - target, 0)
+        return await self.list_for_level(target_level=target, tolerance=tolerance)
+
+
+class AsyncLocationRepository(ABC):
+    @abstractmethod
+    async def get(self, location_id: int) -> Optional[Location]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_all(self) -> List[Location]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_starting_location(self) -> Optional[Location]:
+        raise NotImplementedError
+
+
+class AsyncClassRepository(ABC):
+    @abstractmethod
+    async def list_playable(self) -> List[CharacterClass]:
+        raise NotImplementedError
+
+
+class AsyncSpellRepository(ABC):
+    @abstractmethod
+    async def get_by_slug(self, slug: str) -> Optional[Spell]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_by_class(self, class_slug: str, max_level: int):
+        raise NotImplementedError
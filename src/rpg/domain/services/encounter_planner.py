@@ -14,14 +14,26 @@ class EncounterPlanner:
     def __init__(self, entity_repo: EntityRepository) -> None:
         self.entity_repo = entity_repo
 
+    @staticmethod
+    def applicable_definitions(
+        definitions: Sequence[EncounterDefinition], player_level: int, location_id: int
+    ) -> List[EncounterDefinition]:
+        return [
+            definition
+            for definition in definitions
+            if definition.matches_level(player_level)
+            and definition.applies_to_location(location_id)
+        ]
+
+    @staticmethod
+    def slot_entity_ids(definitions: Sequence[EncounterDefinition]) -> List[int]:
+        return sorted({slot.entity_id for definition in definitions for slot in definition.slots})
+
     def _load_entities(self, definitions: Sequence[EncounterDefinition]) -> dict[int, Entity]:
-        ids: set[int] = set()
-        for definition in definitions:
-            for slot in definition.slots:
-                ids.add(slot.entity_id)
+        ids = self.slot_entity_ids(definitions)
         if not ids:
             return {}
-        loaded = self.entity_repo.get_many(list(ids))
+        loaded = self.entity_repo.get_many(ids)
         return {entity.id: entity for entity in loaded}
 
     def _score_definition(
@@ -95,21 +107,22 @@ class EncounterPlanner:
         seed: int,
         faction_bias: Optional[str] = None,
         max_enemies: int = 3,
+        entity_lookup: Optional[dict[int, Entity]] = None,
     ) -> tuple[Optional[EncounterDefinition], List[Entity]]:
-        """Select a deterministic set of entities matching the provided constraints."""
+        """Select a deterministic set of entities matching the provided constraints.
 
-        applicable = [
-            definition
-            for definition in definitions
-            if definition.matches_level(player_level)
-            and definition.applies_to_location(location_id)
-        ]
+        Callers that load entities themselves (the async service) pass them as
+        ``entity_lookup``; otherwise they are fetched from the entity repository.
+        """
+
+        applicable = self.applicable_definitions(definitions, player_level, location_id)
         rng = random.Random(seed)
 
         if not applicable:
             return None, []
 
-        entity_lookup = self._load_entities(applicable)
+        if entity_lookup is None:
+            entity_lookup = self._load_entities(applicable)
         chosen = self._pick_definition(applicable, player_level, faction_bias, rng)
         if not chosen:
             return None, []
@@ -108,7 +108,7 @@ CREATE TABLE `h_character_location` (
     h_character_location_id bigint UNSIGNED NOT NULL AUTO_INCREMENT,
     h_action ENUM('create', 'update', 'delete'),
     h_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-    `character_location_id` int(11) UNSIGNED NOT NULL,
+    `character_location_id` int(11) UNSIGNED NULL,
     `character_id` int(11) UNSIGNED NOT NULL,
     `location_id` int(11) UNSIGNED NOT NULL,
     PRIMARY KEY (`h_character_location_id`)
@@ -488,3 +488,15 @@ CREATE TABLE `h_character_title` (
     `title_id` int(11) UNSIGNED NOT NULL,
     PRIMARY KEY (`h_character_title_id`)
 );
+
+CREATE TABLE `h_world` (
+    h_world_id bigint UNSIGNED NOT NULL AUTO_INCREMENT,
+    h_action ENUM('create', 'update', 'delete'),
+    h_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    `world_id` int(11) UNSIGNED NOT NULL,
+    `name` varchar(255) NOT NULL,
+    `current_turn` bigint UNSIGNED NOT NULL,
+    `threat_level` int NOT NULL,
+    `flags` JSON NULL,
+    PRIMARY KEY (`h_world_id`)
+);
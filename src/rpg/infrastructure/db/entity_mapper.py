@@ -0,0 +1,97 @@
+"""Row-to-Entity hydration shared by every SQL-backed entity repository.
+
+Queries select ``ENTITY_COLUMNS`` in this exact order so rows can be unpacked
+positionally, and per-level fallbacks come from tables built once at import
+instead of being recomputed for every row.
+"""
+
+from typing import Iterable, List, NamedTuple, Tuple
+
+from rpg.domain.models.entity import Entity
+
+
+_COLUMN_NAMES = ("entity_id", "name", "level", "armour_class", "attack_bonus", "damage_dice", "hp_max", "kind")
+ENTITY_COLUMNS = ", ".join(_COLUMN_NAMES)
+MAX_TABLE_LEVEL = 30
+
+
+def qualified_entity_columns(alias: str) -> str:
+    """``ENTITY_COLUMNS`` prefixed with a table alias, for joined queries."""
+    return ", ".join(f"{alias}.{column}" for column in _COLUMN_NAMES)
+
+
+class LevelDefaults(NamedTuple):
+    hp: int
+    attack_min: int
+    attack_max: int
+    armor: int
+    armour_class: int
+    attack_bonus: int
+    damage_die: str
+
+
+def default_stats_for_level(level: int) -> Tuple[int, int, int, int]:
+    scaled_level = max(level, 1)
+    hp = 6 + scaled_level * 3
+    attack_min = 1 + scaled_level // 2
+    attack_max = 2 + scaled_level
+    armor = max(scaled_level // 3, 0)
+    return hp, attack_min, attack_max, armor
+
+
+def default_combat_fields(level: int) -> Tuple[int, int, str]:
+    ac = max(10, 10 + level // 2)
+    attack_bonus = 2 + level // 2
+    damage_die = "d6" if level < 3 else "d8"
+    return ac, attack_bonus, damage_die
+
+
+def _compute_defaults(level: int) -> LevelDefaults:
+    return LevelDefaults(*default_stats_for_level(level), *default_combat_fields(level))
+
+
+_LEVEL_DEFAULTS: Tuple[LevelDefaults, ...] = tuple(_compute_defaults(level) for level in range(MAX_TABLE_LEVEL + 1))
+
+
+def defaults_for_level(level: int) -> LevelDefaults:
+    """Return the fallback stats for ``level``; table lookup for 0-30."""
+    if 0 <= level <= MAX_TABLE_LEVEL:
+        return _LEVEL_DEFAULTS[level]
+    return _compute_defaults(level)
+
+
+def row_to_entity(row) -> Entity:
+    return rows_to_entities((row,))[0]
+
+
+def rows_to_entities(rows: Iterable) -> List[Entity]:
+    """Hydrate ``ENTITY_COLUMNS`` rows into entities in one pass.
+
+    Stored values win; missing ones fall back to the level defaults.
+    """
+    table = _LEVEL_DEFAULTS
+    top = MAX_TABLE_LEVEL
+    entities: List[Entity] = []
+    append = entities.append
+    for entity_id, name, level, armour_class, attack_bonus, damage_dice, hp_max, kind in rows:
+        level = level or 1
+        defaults = table[level] if 0 <= level <= top else _compute_defaults(level)
+        hp = hp_max or defaults.hp
+        append(
+            Entity(
+                id=entity_id,
+                name=name,
+                level=level,
+                hp=hp,
+                hp_current=hp,
+                hp_max=hp,
+                attack_min=defaults.attack_min,
+                attack_max=defaults.attack_max,
+                armor=defaults.armor,
+                armour_class=armour_class or defaults.armour_class,
+                attack_bonus=attack_bonus or defaults.attack_bonus,
+                damage_die=damage_dice or defaults.damage_die,
+                kind=kind or "beast",
+            )
+        )
+    return entities
@@ -0,0 +1,214 @@
+import atexit
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Mapping, Optional, Tuple
+
+from sqlalchemy import column, insert, table
+
+# Source columns copied into each ``h_<table>`` row (see create_history_tables.sql).
+HISTORY_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "character": ("character_id", "character_type_id", "name", "alive", "level", "xp", "money"),
+    "character_location": ("character_id", "location_id"),
+    "entity": ("entity_id", "entity_type_id", "name", "level"),
+    "world": ("world_id", "name", "current_turn", "threat_level", "flags"),
+}
+HISTORY_ACTIONS = frozenset({"create", "update", "delete"})
+
+_STOP = object()
+_FLUSH = object()
+
+
+@dataclass(frozen=True)
+class HistoryStats:
+    recorded: int
+    written: int
+    dropped: int
+    failed: int
+    pending: int
+    high_water: int
+    capacity: int
+
+    @property
+    def backpressure(self) -> float:
+        """How full the buffer is, from 0.0 (idle) to 1.0 (dropping records)."""
+        return self.pending / self.capacity if self.capacity else 0.0
+
+
+class HistoryRecorder:
+    """Append row snapshots to the ``h_*`` audit tables off the request path.
+
+    ``record`` only enqueues; a background thread collects records until it
+    has ``batch_size`` of them or ``flush_interval`` has passed since the first
+    one arrived, then writes each table's share as one multi-row INSERT.
+    If that batch fails it is retried one row at a time, so a single bad row
+    is counted as failed without losing the rest of the batch.
+    The buffer holds at most ``max_pending`` records. When it is full, new
+    records are dropped and counted rather than blocking the caller, and
+    ``stats()`` reports the backlog so operators can see audit pressure.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        max_pending: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: float = 0.5,
+        on_flush_error: Optional[Callable[[Exception], None]] = None,
+        register_atexit: bool = True,
+        autostart: bool = True,
+    ) -> None:
+        self.session_factory = session_factory
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.on_flush_error = on_flush_error
+        self.flush_count = 0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._recorded = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._high_water = 0
+        self._thread: Optional[threading.Thread] = None
+        if register_atexit:
+            atexit.register(self.close)
+        if autostart:
+            self.start()
+
+    def start(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="history-recorder", daemon=True)
+            self._thread.start()
+
+    def record(self, table_name: str, action: str, row: Mapping[str, object]) -> bool:
+        """Queue one snapshot of ``row`` for ``h_<table_name>``; False if dropped."""
+        columns = HISTORY_COLUMNS.get(table_name)
+        if columns is None:
+            raise ValueError(f"No history table for {table_name!r}")
+        if action not in HISTORY_ACTIONS:
+            raise ValueError(f"Unknown history action {action!r}")
+
+        values = {name: row.get(name) for name in columns}
+        values["h_action"] = action
+        try:
+            self._queue.put_nowait((table_name, values))
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+            return False
+        with self._lock:
+            self._recorded += 1
+            self._high_water = max(self._high_water, self._queue.qsize())
+        return True
+
+    def stats(self) -> HistoryStats:
+        with self._lock:
+            return HistoryStats(
+                recorded=self._recorded,
+                written=self._written,
+                dropped=self._dropped,
+                failed=self._failed,
+                pending=self._queue.qsize(),
+                high_water=self._high_water,
+                capacity=self.max_pending,
+            )
+
+    def flush(self) -> None:
+        """Block until everything recorded so far has been written (or failed)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._drain_inline()
+            return
+        # Cut the current batch short instead of waiting out ``flush_interval``.
+        self._queue.put(_FLUSH)
+        self._queue.join()
+
+    def close(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._thread = None
+        self._drain_inline()
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is _FLUSH:
+                self._queue.task_done()
+                continue
+            if first is _STOP:
+                self._queue.task_done()
+                return
+            batch = [first]
+            stop = False
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _FLUSH or item is _STOP:
+                    self._queue.task_done()
+                    stop = item is _STOP
+                    break
+                batch.append(item)
+            self._write(batch)
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _drain_inline(self) -> None:
+        batch: List[Tuple[str, Dict[str, object]]] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            self._queue.task_done()
+            if item is not _STOP and item is not _FLUSH:
+                batch.append(item)
+        for start in range(0, len(batch), self.batch_size):
+            self._write(batch[start : start + self.batch_size])
+
+    def _write(self, batch: List[Tuple[str, Dict[str, object]]]) -> None:
+        try:
+            self._insert(batch)
+        except Exception as exc:
+            if len(batch) > 1:
+                for item in batch:
+                    self._write([item])
+                return
+            with self._lock:
+                self._failed += 1
+            if self.on_flush_error is not None:
+                self.on_flush_error(exc)
+            return
+        with self._lock:
+            self._written += len(batch)
+            self.flush_count += 1
+
+    def _insert(self, batch: List[Tuple[str, Dict[str, object]]]) -> None:
+        by_table: Dict[Hashable, List[Dict[str, object]]] = {}
+        for table_name, values in batch:
+            by_table.setdefault(table_name, []).append(values)
+        with self.session_factory() as session:
+            for table_name, rows in by_table.items():
+                session.execute(insert(_history_table(table_name)).values(rows))
+            session.commit()
+
+
+_HISTORY_TABLES: Dict[str, object] = {}
+
+
+def _history_table(table_name: str):
+    cached = _HISTORY_TABLES.get(table_name)
+    if cached is None:
+        columns = [column("h_action"), *(column(name) for name in HISTORY_COLUMNS[table_name])]
+        cached = _HISTORY_TABLES[table_name] = table(f"h_{table_name}", *columns)
+    return cached
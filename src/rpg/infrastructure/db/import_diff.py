@@ -0,0 +1,59 @@
+"""Dry-run change reports for the Open5e importers.
+
+An importer's dry run loads every stored key and ``source_hash`` for its table
+in one query, hashes the incoming rows exactly as a real import would, and
+compares the two in memory. Nothing is written. Keys present in the database
+but absent from the input are reported as orphaned; an import never deletes
+them, so against a partial input (``--pages 2``) most rows will show up there.
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterable, List, Mapping, Optional, Tuple
+
+
+@dataclass
+class ChangeReport:
+    kind: str
+    new: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    orphaned: List[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.new or self.changed)
+
+    def lines(self, limit: int = 10) -> List[str]:
+        lines = [
+            f"{self.kind}: {len(self.new)} new, {len(self.changed)} changed, "
+            f"{len(self.unchanged)} unchanged, {len(self.orphaned)} orphaned (dry run, nothing written)"
+        ]
+        for label, keys in (("new", self.new), ("changed", self.changed), ("orphaned", self.orphaned)):
+            if keys:
+                more = f" ... (+{len(keys) - limit} more)" if len(keys) > limit else ""
+                lines.append(f"  {label:<8} {', '.join(keys[:limit])}{more}")
+        return lines
+
+
+def diff_hashes(
+    kind: str, stored: Mapping[str, Optional[str]], incoming: Iterable[Tuple[str, str]]
+) -> ChangeReport:
+    """Classify ``(key, source_hash)`` pairs against the ``stored`` key -> hash map.
+
+    Keys keep their first-seen order; a key repeated in the input is judged by
+    its last hash, as the import would leave it.
+    """
+    latest: dict = {}
+    for key, source_hash in incoming:
+        latest[key] = source_hash
+
+    report = ChangeReport(kind=kind)
+    for key, source_hash in latest.items():
+        if key not in stored:
+            report.new.append(key)
+        elif stored[key] == source_hash:
+            report.unchanged.append(key)
+        else:
+            report.changed.append(key)
+    report.orphaned = sorted(key for key in stored if key not in latest)
+    return report
@@ -1,3 +1,4 @@
+from bisect import bisect_right, insort
 from typing import Dict, List, Optional
 
 from rpg.domain.models.character import Character
@@ -28,6 +29,8 @@ class InMemoryWorldRepository(WorldRepository):
 class InMemoryCharacterRepository(CharacterRepository):
     def __init__(self, initial: Dict[int, Character]) -> None:
         self._characters = dict(initial)
+        # Ids in ascending order, so a page is a bisect plus a slice.
+        self._ids: List[int] = sorted(self._characters)
 
     def get(self, character_id: int) -> Character | None:
         return self._characters.get(character_id)
@@ -35,19 +38,33 @@ class InMemoryCharacterRepository(CharacterRepository):
     def list_all(self) -> List[Character]:
         return list(self._characters.values())
 
+    def list_page(self, after_id: int = 0, limit: int = 50) -> List[Character]:
+        start = bisect_right(self._ids, after_id)
+        return [self._characters[cid] for cid in self._ids[start : start + limit]]
+
     def save(self, character: Character) -> None:
+        if character.id is None:
+            # A character that was never created gets the next id, as ``create`` would give it.
+            character.id = self._next_id()
+            self._ids.append(character.id)
+        elif character.id not in self._characters:
+            insort(self._ids, character.id)
         self._characters[character.id] = character
 
     def find_by_location(self, location_id: int) -> List[Character]:
         return [c for c in self._characters.values() if c.location_id == location_id]
 
     def create(self, character: Character, location_id: int) -> Character:
-        next_id = max(self._characters.keys(), default=0) + 1
+        next_id = self._next_id()
         character.id = next_id
         character.location_id = location_id
         self._characters[next_id] = character
+        self._ids.append(next_id)
         return character
 
+    def _next_id(self) -> int:
+        return (self._ids[-1] if self._ids else 0) + 1
+
 
 class InMemoryEntityRepository(EntityRepository):
     def __init__(self, entities: List[Entity]) -> None:
@@ -0,0 +1,139 @@
+"""Per-action query instrumentation built on SQLAlchemy engine events.
+
+``QueryInstrumentation.attach(engine)`` hooks cursor execution; statements run
+inside ``instrumentation.operation("make_choice")`` are counted and timed
+against that operation. Services receive ``instrumentation.operation`` as
+their ``operation_tracer``, so the application layer never imports this module.
+Completed operations are handed to exporters, and ``QueryBudget`` is one such
+exporter that flags actions issuing more statements than they declared.
+"""
+
+import heapq
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+
+
+@dataclass
+class OperationStats:
+    operation: str
+    statement_count: int = 0
+    total_time: float = 0.0
+    # (seconds, sql) pairs, slowest first once the operation finishes.
+    slowest: List[Tuple[float, str]] = field(default_factory=list)
+
+
+@dataclass
+class OperationTotals:
+    runs: int = 0
+    statements: int = 0
+    total_time: float = 0.0
+    max_statements: int = 0
+
+
+Exporter = Callable[[OperationStats], None]
+
+
+class QueryInstrumentation:
+    def __init__(self, keep_slowest: int = 3) -> None:
+        self.keep_slowest = keep_slowest
+        self.totals: Dict[str, OperationTotals] = {}
+        self._exporters: List[Exporter] = []
+        self._engines: list = []
+        self._current: ContextVar[Optional[OperationStats]] = ContextVar(f"query_operation_{id(self)}", default=None)
+
+    def attach(self, engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engines.append(engine)
+
+    def detach(self) -> None:
+        for engine in self._engines:
+            event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+            event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engines.clear()
+
+    def add_exporter(self, exporter: Exporter) -> None:
+        self._exporters.append(exporter)
+
+    @contextmanager
+    def operation(self, name: str) -> Iterator[Optional[OperationStats]]:
+        """Attribute statements run in this block to ``name``.
+
+        Nested operations (``make_choice`` resting, say) count toward the
+        outermost one, which is what the player actually triggered.
+        """
+        if self._current.get() is not None:
+            yield None
+            return
+
+        stats = OperationStats(operation=name)
+        token = self._current.set(stats)
+        try:
+            yield stats
+        finally:
+            self._current.reset(token)
+            self._finish(stats)
+
+    def _finish(self, stats: OperationStats) -> None:
+        stats.slowest.sort(reverse=True)
+        totals = self.totals.setdefault(stats.operation, OperationTotals())
+        totals.runs += 1
+        totals.statements += stats.statement_count
+        totals.total_time += stats.total_time
+        totals.max_statements = max(totals.max_statements, stats.statement_count)
+        for exporter in self._exporters:
+            exporter(stats)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if self._current.get() is not None:
+            conn.info.setdefault("rpg_query_start", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        stats = self._current.get()
+        starts = conn.info.get("rpg_query_start")
+        if stats is None or not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        stats.statement_count += 1
+        stats.total_time += elapsed
+        entry = (elapsed, " ".join(statement.split()))
+        if len(stats.slowest) < self.keep_slowest:
+            heapq.heappush(stats.slowest, entry)
+        elif self.keep_slowest:
+            heapq.heappushpop(stats.slowest, entry)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryBudget:
+    """Exporter that records operations issuing more statements than allowed."""
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None) -> None:
+        self.limits: Dict[str, int] = dict(limits or {})
+        self.violations: List[OperationStats] = []
+
+    def limit(self, operation: str, max_statements: int) -> None:
+        self.limits[operation] = max_statements
+
+    def __call__(self, stats: OperationStats) -> None:
+        allowed = self.limits.get(stats.operation)
+        if allowed is not None and stats.statement_count > allowed:
+            self.violations.append(stats)
+
+    def check(self) -> None:
+        if not self.violations:
+            return
+        lines = []
+        for stats in self.violations:
+            lines.append(
+                f"{stats.operation}: {stats.statement_count} statements (budget {self.limits[stats.operation]})"
+            )
+            lines.extend(f"    {elapsed * 1000:.2f} ms  {sql}" for elapsed, sql in stats.slowest)
+        raise QueryBudgetExceeded("query budget exceeded:\n" + "\n".join(lines))
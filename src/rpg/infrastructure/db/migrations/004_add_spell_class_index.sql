@@ -0,0 +1,25 @@
+-- Normalised spell -> class index so list_by_class is an indexed range scan
+-- instead of a JSON_CONTAINS test on every spell row.
+-- class_key is the lower-cased class name; '*' marks spells with no class list
+-- (classes_json IS NULL). An empty JSON array gets no rows, so like the old
+-- JSON_CONTAINS filter it matches no class.
+CREATE TABLE IF NOT EXISTS spell_class (
+  class_key   VARCHAR(64)  NOT NULL,
+  level_int   INT          NOT NULL,
+  spell_slug  VARCHAR(128) NOT NULL,
+  PRIMARY KEY (class_key, level_int, spell_slug),
+  KEY idx_spell_class_slug (spell_slug),
+  CONSTRAINT fk_spell_class_spell_slug FOREIGN KEY (spell_slug) REFERENCES spell (slug) ON DELETE CASCADE ON UPDATE CASCADE
+);
+
+-- Backfill from the existing JSON column (MySQL 8.0+ / MariaDB 10.6+).
+INSERT IGNORE INTO spell_class (class_key, level_int, spell_slug)
+SELECT LOWER(TRIM(jt.class_name)), s.level_int, s.slug
+FROM spell s
+JOIN JSON_TABLE(s.classes_json, '$[*]' COLUMNS (class_name VARCHAR(64) PATH '$')) AS jt
+WHERE s.classes_json IS NOT NULL AND TRIM(jt.class_name) <> '';
+
+INSERT IGNORE INTO spell_class (class_key, level_int, spell_slug)
+SELECT '*', s.level_int, s.slug
+FROM spell s
+WHERE s.classes_json IS NULL;
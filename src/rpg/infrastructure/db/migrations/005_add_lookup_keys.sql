@@ -0,0 +1,15 @@
+-- Lower-cased key columns so case-insensitive lookups are plain indexed
+-- equality (`slug_key = :slug`) instead of LOWER(column) scans.
+ALTER TABLE class
+    ADD COLUMN IF NOT EXISTS slug_key VARCHAR(128) GENERATED ALWAYS AS (LOWER(open5e_slug)) STORED,
+    ADD COLUMN IF NOT EXISTS name_key VARCHAR(255) GENERATED ALWAYS AS (LOWER(name)) STORED;
+CREATE UNIQUE INDEX IF NOT EXISTS uk_class_slug_key ON class (slug_key);
+CREATE UNIQUE INDEX IF NOT EXISTS uk_class_name_key ON class (name_key);
+
+ALTER TABLE entity_type
+    ADD COLUMN IF NOT EXISTS name_key VARCHAR(255) GENERATED ALWAYS AS (LOWER(name)) STORED;
+CREATE INDEX IF NOT EXISTS idx_entity_type_name_key ON entity_type (name_key);
+
+ALTER TABLE entity
+    ADD COLUMN IF NOT EXISTS name_key VARCHAR(255) GENERATED ALWAYS AS (LOWER(name)) STORED;
+CREATE INDEX IF NOT EXISTS idx_entity_name_key ON entity (name_key);
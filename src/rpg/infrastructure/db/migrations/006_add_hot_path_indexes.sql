@@ -0,0 +1,24 @@
+-- Secondary indexes matched to the queries in mysql/statements.py.
+-- Each one lets the lookup be answered from the index alone (InnoDB secondary
+-- indexes carry the primary key), so no clustered-row fetch per match.
+
+-- LIST_ENTITIES_BY_LEVEL_BAND: range on level, selects ENTITY_COLUMNS.
+CREATE INDEX IF NOT EXISTS idx_entity_level_cover
+    ON entity (level, name, armour_class, attack_bonus, damage_dice, hp_max, kind);
+
+-- LIST_ENTITIES_BY_LOCATION: equality on location_id, joins to entity by entity_id.
+CREATE INDEX IF NOT EXISTS idx_entity_location_location
+    ON entity_location (location_id, entity_id);
+
+-- FIND_CHARACTERS_BY_LOCATION: equality on location_id, joins to character by character_id.
+CREATE INDEX IF NOT EXISTS idx_character_location_location
+    ON character_location (location_id, character_id);
+
+-- GET_CHARACTER and LOAD_CHARACTER_ATTRIBUTES need nothing here: the
+-- UNIQUE (character_id) key on character_class and UNIQUE (character_id,
+-- attribute_id) on character_attribute already lead with character_id.
+
+-- LIST_SPELLS_BY_CLASS filters on spell_class (class_key, level_int), which its
+-- primary key from 004 already covers; only the ORDER BY needs this one.
+CREATE INDEX IF NOT EXISTS idx_spell_level_name
+    ON spell (level_int, name);
@@ -0,0 +1,11 @@
+-- Content hash of the mapped Open5e values last written to each imported row.
+-- Importers fetch the stored hashes in bulk and skip rows whose hash is
+-- unchanged, so a re-import only writes what Open5e actually changed.
+ALTER TABLE entity
+    ADD COLUMN IF NOT EXISTS source_hash CHAR(32) NULL;
+
+ALTER TABLE spell
+    ADD COLUMN IF NOT EXISTS source_hash CHAR(32) NULL;
+
+ALTER TABLE class
+    ADD COLUMN IF NOT EXISTS source_hash CHAR(32) NULL;
@@ -0,0 +1,17 @@
+-- Audit history for the world row and character moves (RPG_RECORD_HISTORY).
+-- Location moves are upserts keyed by character, so the history writer
+-- records the character and location without the character_location_id.
+CREATE TABLE IF NOT EXISTS `h_world` (
+    h_world_id bigint UNSIGNED NOT NULL AUTO_INCREMENT,
+    h_action ENUM('create', 'update', 'delete'),
+    h_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    `world_id` int(11) UNSIGNED NOT NULL,
+    `name` varchar(255) NOT NULL,
+    `current_turn` bigint UNSIGNED NOT NULL,
+    `threat_level` int NOT NULL,
+    `flags` JSON NULL,
+    PRIMARY KEY (`h_world_id`)
+);
+
+ALTER TABLE `h_character_location`
+    MODIFY `character_location_id` int(11) UNSIGNED NULL;
@@ -1,3 +1,10 @@
 SOURCE C:/Users/fezeh/OneDrive/Documents/Text Based Games/DND GAME/src/rpg/infrastructure/db/create_tables.sql;
 SOURCE C:/Users/fezeh/OneDrive/Documents/Text Based Games/DND GAME/src/rpg/infrastructure/db/create_history_tables.sql;
 SOURCE C:/Users/fezeh/OneDrive/Documents/Text Based Games/DND GAME/src/rpg/infrastructure/db/migrations/001_add_world_and_hp.sql;
+SOURCE C:/Users/fezeh/OneDrive/Documents/Text Based Games/DND GAME/src/rpg/infrastructure/db/migrations/002_add_spell_table.sql;
+SOURCE C:/Users/fezeh/OneDrive/Documents/Text Based Games/DND GAME/src/rpg/infrastructure/db/migrations/003_update_entity_combat.sql;
+SOURCE C:/Users/fezeh/OneDrive/Documents/Text Based Games/DND GAME/src/rpg/infrastructure/db/migrations/004_add_spell_class_index.sql;
+SOURCE C:/Users/fezeh/OneDrive/Documents/Text Based Games/DND GAME/src/rpg/infrastructure/db/migrations/005_add_lookup_keys.sql;
+SOURCE C:/Users/fezeh/OneDrive/Documents/Text Based Games/DND GAME/src/rpg/infrastructure/db/migrations/006_add_hot_path_indexes.sql;
+SOURCE C:/Users/fezeh/OneDrive/Documents/Text Based Games/DND GAME/src/rpg/infrastructure/db/migrations/007_add_source_hash.sql;
+SOURCE C:/Users/fezeh/OneDrive/Documents/Text Based Games/DND GAME/src/rpg/infrastructure/db/migrations/008_add_world_history.sql;
@@ -0,0 +1,318 @@
+import json
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Sequence
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from rpg.domain.models.character import Character
+from rpg.domain.models.character_class import CharacterClass
+from rpg.domain.models.entity import Entity
+from rpg.domain.models.location import Location
+from rpg.domain.models.spell import Spell
+from rpg.domain.models.world import World
+from rpg.domain.repositories import (
+    AsyncCharacterRepository,
+    AsyncClassRepository,
+    AsyncEntityRepository,
+    AsyncLocationRepository,
+    AsyncSpellRepository,
+    AsyncWorldRepository,
+)
+from rpg.infrastructure.db import portable
+from rpg.infrastructure.db.entity_mapper import rows_to_entities
+from rpg.infrastructure.db.spell_classes import ANY_CLASS_KEY, class_key
+from .async_unit_of_work import current_async_unit_of_work, run_after_commit
+
+
+# Reads come from ``portable``; writes avoid MySQL-only upsert syntax so the
+# same repositories run on aiomysql in production and aiosqlite in tests.
+_UPDATE_CHARACTER_LOCATION = text("UPDATE character_location SET location_id = :loc WHERE character_id = :cid")
+_INSERT_CHARACTER_WITH_ID = text(
+    """
+    INSERT INTO `character` (character_id, name, alive, level, xp, money, character_type_id, hp_current, hp_max)
+    VALUES (:cid, :name, :alive, :level, :xp, :money, :character_type_id, :hp_current, :hp_max)
+    """
+)
+_DELETE_CHARACTER_ATTRIBUTES = text(
+    """
+    DELETE FROM character_attribute
+    WHERE character_id = :cid
+      AND attribute_id IN (SELECT attribute_id FROM attribute WHERE name IN :names)
+    """
+).bindparams(bindparam("names", expanding=True))
+_INSERT_CHARACTER_ATTRIBUTE = text(
+    """
+    INSERT INTO character_attribute (character_id, attribute_id, value)
+    SELECT :cid, attribute_id, :val FROM attribute WHERE name = :name
+    """
+)
+_ADVANCE_WORLD = text("UPDATE world SET current_turn = current_turn + :ticks WHERE world_id = :wid")
+_WORLD_TURN = text("SELECT current_turn FROM world WHERE world_id = :wid")
+
+
+def _mark_clean_after_commit(model) -> None:
+    """Mark ``model`` clean as of now, but only once the unit of work commits."""
+    snapshot = model.clean_snapshot()
+    run_after_commit(lambda: model.mark_clean(snapshot))
+
+
+class _AsyncRepository:
+    def __init__(self, session_factory: async_sessionmaker) -> None:
+        self.session_factory = session_factory
+
+    @asynccontextmanager
+    async def _session_scope(self) -> AsyncIterator[AsyncSession]:
+        """Yield the task's unit-of-work session, or a short-lived one of our own."""
+        uow = current_async_unit_of_work()
+        if uow is not None:
+            yield uow.session
+            return
+        async with self.session_factory() as session:
+            yield session
+
+    @staticmethod
+    async def _commit(session: AsyncSession) -> None:
+        if current_async_unit_of_work() is None:
+            await session.commit()
+
+
+class AsyncMysqlCharacterRepository(_AsyncRepository, AsyncCharacterRepository):
+    async def get(self, character_id: int) -> Optional[Character]:
+        uow = current_async_unit_of_work()
+        if uow is not None:
+            cached = uow.get_loaded(Character, character_id)
+            if cached is not None:
+                return cached
+
+        async with self._session_scope() as session:
+            row = (await session.execute(portable.GET_CHARACTER, {"cid": character_id})).first()
+            if not row:
+                return None
+            attributes = await self._load_attributes(session, [row.character_id])
+
+        character = portable.row_to_character(row, attributes.get(row.character_id, {}))
+        if uow is not None:
+            uow.register(Character, character.id, character)
+        return character
+
+    async def list_all(self) -> List[Character]:
+        async with self._session_scope() as session:
+            rows = (await session.execute(portable.LIST_CHARACTERS)).all()
+        return [portable.row_to_character(row, {}) for row in rows]
+
+    async def list_page(self, after_id: int = 0, limit: int = 50) -> List[Character]:
+        async with self._session_scope() as session:
+            rows = (await session.execute(portable.LIST_CHARACTERS_PAGE, {"after_id": after_id, "limit": limit})).all()
+        return [portable.row_to_character(row, {}) for row in rows]
+
+    async def find_by_location(self, location_id: int) -> List[Character]:
+        async with self._session_scope() as session:
+            rows = (await session.execute(portable.FIND_CHARACTERS_AT, {"loc": location_id})).all()
+            attributes = await self._load_attributes(session, [row.character_id for row in rows])
+        return [portable.row_to_character(row, attributes.get(row.character_id, {})) for row in rows]
+
+    async def save(self, character: Character) -> None:
+        dirty = character.dirty_fields()
+        if dirty:
+            # UPDATE first and INSERT only when no row matched: the portable
+            # spelling of the sync repository's upsert.
+            columns = tuple(column for column in portable.CHARACTER_COLUMNS if column in dirty)
+            async with self._session_scope() as session:
+                if columns:
+                    params = {column: getattr(character, column) for column in columns}
+                    if "alive" in params:
+                        params["alive"] = int(params["alive"])
+                    result = await session.execute(portable.character_update(columns), params | {"cid": character.id})
+                    if result.rowcount == 0:
+                        if character.is_tracked:
+                            raise LookupError(f"Character {character.id} is no longer stored")
+                        await session.execute(_INSERT_CHARACTER_WITH_ID, params | {"cid": character.id})
+                if "attributes" in dirty and character.attributes:
+                    await self._replace_attributes(session, character)
+                if "location_id" in dirty:
+                    params = {"cid": character.id, "loc": character.location_id}
+                    result = await session.execute(_UPDATE_CHARACTER_LOCATION, params)
+                    if result.rowcount == 0:
+                        await session.execute(portable.INSERT_CHARACTER_LOCATION, params)
+                await self._commit(session)
+            _mark_clean_after_commit(character)
+
+        uow = current_async_unit_of_work()
+        if uow is not None:
+            uow.register(Character, character.id, character)
+
+    async def create(self, character: Character, location_id: int) -> Character:
+        async with self._session_scope() as session:
+            ctype_id = (await session.execute(portable.PLAYER_TYPE_ID)).scalar()
+            if ctype_id is None:
+                ctype_id = (await session.execute(portable.INSERT_PLAYER_TYPE)).lastrowid
+            result = await session.execute(
+                portable.INSERT_CHARACTER,
+                {
+                    "ctype": ctype_id,
+                    "name": character.name,
+                    "level": character.level,
+                    "xp": character.xp,
+                    "money": character.money,
+                    "hp_current": character.hp_current,
+                    "hp_max": character.hp_max,
+                },
+            )
+            character_id = result.lastrowid
+
+            class_name = character.class_name or "fighter"
+            class_id = (await session.execute(portable.CLASS_ID_BY_SLUG, {"slug": class_name.lower()})).scalar()
+            if class_id is None:
+                class_id = (
+                    await session.execute(portable.INSERT_LOCAL_CLASS, {"name": class_name, "slug": class_name.lower()})
+                ).lastrowid
+            await session.execute(portable.INSERT_CHARACTER_CLASS, {"cid": character_id, "class_id": class_id})
+
+            attributes = [
+                {"cid": character_id, "name": name, "val": value}
+                for name, value in (character.attributes or {}).items()
+            ]
+            if attributes:
+                await session.execute(_INSERT_CHARACTER_ATTRIBUTE, attributes)
+            await session.execute(portable.INSERT_CHARACTER_LOCATION, {"cid": character_id, "loc": location_id})
+            await self._commit(session)
+
+        character.id = character_id
+        character.location_id = location_id
+        character.character_type_id = ctype_id
+        _mark_clean_after_commit(character)
+        uow = current_async_unit_of_work()
+        if uow is not None:
+            uow.register(Character, character_id, character)
+        return character
+
+    @staticmethod
+    async def _replace_attributes(session: AsyncSession, character: Character) -> None:
+        await session.execute(
+            _DELETE_CHARACTER_ATTRIBUTES, {"cid": character.id, "names": list(character.attributes)}
+        )
+        await session.execute(
+            _INSERT_CHARACTER_ATTRIBUTE,
+            [{"cid": character.id, "name": name, "val": value} for name, value in character.attributes.items()],
+        )
+
+    @staticmethod
+    async def _load_attributes(session: AsyncSession, character_ids: Sequence[int]) -> Dict[int, Dict[str, int]]:
+        if not character_ids:
+            return {}
+        attributes: Dict[int, Dict[str, int]] = {}
+        for row in await session.execute(portable.LOAD_ATTRIBUTES, {"cids": list(character_ids)}):
+            attributes.setdefault(row.character_id, {})[row.attr_name] = row.value
+        return attributes
+
+
+class AsyncMysqlEntityRepository(_AsyncRepository, AsyncEntityRepository):
+    async def get(self, entity_id: int) -> Optional[Entity]:
+        results = await self.get_many([entity_id])
+        return results[0] if results else None
+
+    async def get_many(self, entity_ids: List[int]) -> List[Entity]:
+        if not entity_ids:
+            return []
+        async with self._session_scope() as session:
+            rows = (await session.execute(portable.ENTITIES_BY_ID, {"ids": list(entity_ids)})).all()
+        return rows_to_entities(rows)
+
+    async def list_for_level(self, target_level: int, tolerance: int = 2) -> List[Entity]:
+        return await self.list_by_level_band(target_level - tolerance, target_level + tolerance)
+
+    async def list_by_level_band(self, level_min: int, level_max: int) -> List[Entity]:
+        async with self._session_scope() as session:
+            rows = (await session.execute(portable.ENTITIES_BY_LEVEL, {"low": level_min, "high": level_max})).all()
+        return rows_to_entities(rows)
+
+    async def list_by_location(self, location_id: int) -> List[Entity]:
+        async with self._session_scope() as session:
+            rows = (await session.execute(portable.ENTITIES_AT_LOCATION, {"loc": location_id})).all()
+        return rows_to_entities(rows)
+
+
+class AsyncMysqlWorldRepository(_AsyncRepository, AsyncWorldRepository):
+    async def load_default(self) -> Optional[World]:
+        uow = current_async_unit_of_work()
+        if uow is not None:
+            cached = uow.get_loaded(World, "default")
+            if cached is not None:
+                return cached
+
+        async with self._session_scope() as session:
+            row = (await session.execute(portable.LOAD_WORLD)).first()
+            if not row:
+                await session.execute(portable.INSERT_WORLD)
+                await self._commit(session)
+                row = (await session.execute(portable.LOAD_WORLD)).first()
+
+        world = portable.row_to_world(row)
+        if uow is not None:
+            uow.register(World, "default", world)
+        return world
+
+    async def save(self, world: World) -> None:
+        dirty = world.dirty_fields()
+        if dirty:
+            columns = tuple(column for column in World._tracked_fields if column in dirty)
+            params = {column: getattr(world, column) for column in columns}
+            if "flags" in params:
+                params["flags"] = json.dumps(world.flags)
+            async with self._session_scope() as session:
+                await session.execute(portable.world_update(columns), params | {"wid": world.id})
+                await self._commit(session)
+            _mark_clean_after_commit(world)
+
+        uow = current_async_unit_of_work()
+        if uow is not None:
+            uow.register(World, "default", world)
+
+    async def advance(self, world: World, ticks: int = 1) -> World:
+        # Increment in SQL so concurrent players' ticks add up instead of
+        # overwriting each other with the turn each of them loaded.
+        async with self._session_scope() as session:
+            await session.execute(_ADVANCE_WORLD, {"ticks": ticks, "wid": world.id})
+            world.current_turn = (await session.execute(_WORLD_TURN, {"wid": world.id})).scalar()
+            await self._commit(session)
+        if world.dirty_fields() <= {"current_turn"}:
+            _mark_clean_after_commit(world)
+        return world
+
+
+class AsyncMysqlLocationRepository(_AsyncRepository, AsyncLocationRepository):
+    async def get(self, location_id: int) -> Optional[Location]:
+        async with self._session_scope() as session:
+            row = (await session.execute(portable.GET_LOCATION, {"loc": location_id})).first()
+        return portable.row_to_location(row) if row else None
+
+    async def list_all(self) -> List[Location]:
+        async with self._session_scope() as session:
+            rows = (await session.execute(portable.LIST_LOCATIONS)).all()
+        return [portable.row_to_location(row) for row in rows]
+
+    async def get_starting_location(self) -> Optional[Location]:
+        async with self._session_scope() as session:
+            row = (await session.execute(portable.STARTING_LOCATION)).first()
+        return portable.row_to_location(row) if row else None
+
+
+class AsyncMysqlClassRepository(_AsyncRepository, AsyncClassRepository):
+    async def list_playable(self) -> List[CharacterClass]:
+        async with self._session_scope() as session:
+            rows = (await session.execute(portable.LIST_CLASSES)).all()
+        return [portable.row_to_class(row) for row in rows]
+
+
+class AsyncMysqlSpellRepository(_AsyncRepository, AsyncSpellRepository):
+    async def get_by_slug(self, slug: str) -> Optional[Spell]:
+        async with self._session_scope() as session:
+            row = (await session.execute(portable.SPELL_BY_SLUG, {"slug": slug})).first()
+        return portable.row_to_spell(row) if row else None
+
+    async def list_by_class(self, class_slug: str, max_level: int) -> Sequence[Spell]:
+        params = {"class_key": class_key(class_slug), "any_class": ANY_CLASS_KEY, "max_level": max_level}
+        async with self._session_scope() as session:
+            rows = (await session.execute(portable.SPELLS_FOR_CLASS, params)).all()
+        return [portable.row_to_spell(row) for row in rows]
@@ -10,3 +10,9 @@ DATABASE_URL = os.getenv("RPG_DATABASE_URL", DEFAULT_DATABASE_URL)
 
 engine = create_engine(DATABASE_URL, echo=False, future=True)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+# Optional replica for static content reads (classes, spells, bestiary, map).
+# Unset means every read goes to the primary through SessionLocal.
+READ_DATABASE_URL = os.getenv("RPG_READ_DATABASE_URL")
+read_engine = create_engine(READ_DATABASE_URL, echo=False, future=True) if READ_DATABASE_URL else None
+ReadSessionLocal = sessionmaker(bind=read_engine, autoflush=False, autocommit=False) if read_engine else None
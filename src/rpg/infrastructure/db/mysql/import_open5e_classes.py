@@ -2,14 +2,20 @@
 
 Usage:
     python -m rpg.infrastructure.db.mysql.import_open5e_classes --pages 1
+    python -m rpg.infrastructure.db.mysql.import_open5e_classes --snapshot open5e.jsonl.gz [--dry-run]
 """
 
 import argparse
+from typing import Iterator, Optional
 
 from sqlalchemy import text
 
+from rpg.infrastructure.db.import_diff import ChangeReport, diff_hashes
 from rpg.infrastructure.db.mysql.connection import SessionLocal
+from rpg.infrastructure.db.source_hash import content_hash
 from rpg.infrastructure.open5e_client import Open5eClient
+from rpg.infrastructure.open5e_snapshot import SnapshotOpen5eClient
+from rpg.infrastructure.open5e_transport import SHARED_STATS
 
 
 def _ensure_class_table_columns(session) -> None:
@@ -22,57 +28,94 @@ def _ensure_class_table_columns(session) -> None:
                 ADD COLUMN IF NOT EXISTS primary_ability VARCHAR(32) NULL,
                 ADD COLUMN IF NOT EXISTS source VARCHAR(32) NULL,
                 ADD COLUMN IF NOT EXISTS open5e_slug VARCHAR(128) NULL,
+                ADD COLUMN IF NOT EXISTS source_hash CHAR(32) NULL,
                 ADD UNIQUE KEY IF NOT EXISTS uk_class_open5e_slug (open5e_slug)
             """
         )
     )
 
 
-def import_classes(pages: int = 1, source: str = "open5e") -> None:
-    client = Open5eClient()
+_CLASS_HASHES = text("SELECT open5e_slug, source_hash FROM class")
+
+
+def _class_values(client, pages: int, source: str) -> Iterator[dict]:
+    for page in range(1, pages + 1):
+        payload = client.list_classes(page=page)
+        for cls in payload.get("results", []):
+            name = cls.get("name", "Unknown")
+            yield {
+                "name": name,
+                "slug": cls.get("slug") or name.lower(),
+                "hit_die": cls.get("hit_die"),
+                "primary": cls.get("primary_ability"),
+                "source": source,
+            }
+
+
+def import_classes(pages: int = 1, source: str = "open5e", client: Optional[Open5eClient] = None) -> None:
+    client = client or Open5eClient()
     imported = 0
+    skipped = 0
     with SessionLocal() as session:
         _ensure_class_table_columns(session)
-        for page in range(1, pages + 1):
-            payload = client.list_classes(page=page)
-            for cls in payload.get("results", []):
-                name = cls.get("name", "Unknown")
-                slug = cls.get("slug") or name.lower()
-                hit_die = cls.get("hit_die")
-                primary = cls.get("primary_ability")
-
-                session.execute(
-                    text(
-                        """
-                        INSERT INTO class (name, open5e_slug, hit_die, primary_ability, source)
-                        VALUES (:name, :slug, :hit_die, :primary, :source)
-                        ON DUPLICATE KEY UPDATE
-                            hit_die = VALUES(hit_die),
-                            primary_ability = VALUES(primary_ability),
-                            source = VALUES(source),
-                            name = VALUES(name)
-                        """
-                    ),
-                    {
-                        "name": name,
-                        "slug": slug,
-                        "hit_die": hit_die,
-                        "primary": primary,
-                        "source": source,
-                    },
-                )
-                imported += 1
+        stored_hashes = dict(session.execute(_CLASS_HASHES).all())
+        for values in _class_values(client, pages, source):
+            slug = values["slug"]
+            source_hash = content_hash(values)
+            if stored_hashes.get(slug) == source_hash:
+                skipped += 1
+                continue
+
+            session.execute(
+                text(
+                    """
+                    INSERT INTO class (name, open5e_slug, hit_die, primary_ability, source, source_hash)
+                    VALUES (:name, :slug, :hit_die, :primary, :source, :source_hash)
+                    ON DUPLICATE KEY UPDATE
+                        hit_die = VALUES(hit_die),
+                        primary_ability = VALUES(primary_ability),
+                        source = VALUES(source),
+                        name = VALUES(name),
+                        source_hash = VALUES(source_hash)
+                    """
+                ),
+                values | {"source_hash": source_hash},
+            )
+            stored_hashes[slug] = source_hash
+            imported += 1
         session.commit()
 
     client.close()
-    print(f"Imported or updated {imported} class records from Open5e.")
+    print(f"Imported or updated {imported} class records from Open5e, skipped {skipped} unchanged.")
+
+
+def diff_classes(pages: int = 1, source: str = "open5e", client: Optional[Open5eClient] = None) -> ChangeReport:
+    """Dry run of ``import_classes``: one hash query, an in-memory diff and no writes."""
+    client = client or Open5eClient()
+    try:
+        incoming = [(values["slug"], content_hash(values)) for values in _class_values(client, pages, source)]
+    finally:
+        client.close()
+    with SessionLocal() as session:
+        stored_hashes = dict(session.execute(_CLASS_HASHES).all())
+    # Classes seeded without an Open5e slug cannot be matched; leave them out.
+    stored_hashes.pop(None, None)
+    return diff_hashes("classes", stored_hashes, incoming)
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Import Open5e classes into MySQL")
     parser.add_argument("--pages", type=int, default=1, help="How many pages of classes to import")
+    parser.add_argument("--snapshot", default=None, help="Read every class page from this offline snapshot file")
+    parser.add_argument("--dry-run", action="store_true", help="Report new/changed/unchanged/orphaned classes only")
     args = parser.parse_args()
-    import_classes(pages=args.pages)
+    client = SnapshotOpen5eClient(args.snapshot) if args.snapshot else None
+    pages = client.reader.page_count("classes") if client else args.pages
+    if args.dry_run:
+        print("\n".join(diff_classes(pages=pages, client=client).lines()))
+    else:
+        import_classes(pages=pages, client=client)
+    print("\n".join(SHARED_STATS.lines()))
 
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
 import json
-from typing import Dict, List, Optional, Sequence
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence
 
-from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
 
 from rpg.domain.models.character import Character
 from rpg.domain.models.character_class import CharacterClass
@@ -17,287 +18,241 @@ from rpg.domain.repositories import (
     WorldRepository,
     SpellRepository,
 )
+from rpg.infrastructure.db.entity_mapper import rows_to_entities
+from rpg.infrastructure.db.history_recorder import HistoryRecorder
+from rpg.infrastructure.db.import_diff import ChangeReport, diff_hashes
 from rpg.infrastructure.db.mysql.open5e_monster_importer import UpsertResult
-from .connection import SessionLocal
-
-
-DEFAULT_CLASS_BASE_ATTRIBUTES: Dict[str, Dict[str, int]] = {
-    "barbarian": {"STR": 15, "DEX": 12, "CON": 14, "INT": 8, "WIS": 10, "CHA": 10},
-    "bard": {"STR": 10, "DEX": 12, "CON": 12, "INT": 12, "WIS": 10, "CHA": 15},
-    "cleric": {"STR": 12, "DEX": 10, "CON": 13, "INT": 10, "WIS": 15, "CHA": 11},
-    "druid": {"STR": 10, "DEX": 12, "CON": 13, "INT": 12, "WIS": 15, "CHA": 10},
-    "fighter": {"STR": 15, "DEX": 12, "CON": 14, "INT": 10, "WIS": 10, "CHA": 10},
-    "monk": {"STR": 12, "DEX": 15, "CON": 12, "INT": 10, "WIS": 14, "CHA": 10},
-    "paladin": {"STR": 15, "DEX": 10, "CON": 14, "INT": 10, "WIS": 12, "CHA": 14},
-    "ranger": {"STR": 13, "DEX": 15, "CON": 13, "INT": 10, "WIS": 12, "CHA": 10},
-    "rogue": {"STR": 10, "DEX": 16, "CON": 12, "INT": 12, "WIS": 10, "CHA": 12},
-    "sorcerer": {"STR": 8, "DEX": 12, "CON": 12, "INT": 12, "WIS": 10, "CHA": 16},
-    "warlock": {"STR": 10, "DEX": 12, "CON": 12, "INT": 12, "WIS": 12, "CHA": 16},
-    "wizard": {"STR": 8, "DEX": 12, "CON": 12, "INT": 16, "WIS": 12, "CHA": 10},
-}
-
-
-def _row_to_spell(row) -> Spell:
-    classes = None
-    if getattr(row, "classes_json", None):
-        if isinstance(row.classes_json, str):
-            try:
-                classes = json.loads(row.classes_json)
-            except Exception:
-                classes = None
-        elif isinstance(row.classes_json, list):
-            classes = row.classes_json
-
-    return Spell(
-        slug=row.slug,
-        name=row.name,
-        level_int=row.level_int,
-        school=row.school,
-        casting_time=row.casting_time,
-        range_text=row.range_text,
-        duration=row.duration,
-        components=row.components,
-        concentration=bool(row.concentration),
-        ritual=bool(row.ritual),
-        desc_text=row.desc_text,
-        higher_level=row.higher_level,
-        classes=classes,
-    )
-
-
-def _default_stats_for_level(level: int) -> tuple[int, int, int, int]:
-    scaled_level = max(level, 1)
-    hp = 6 + scaled_level * 3
-    attack_min = 1 + scaled_level // 2
-    attack_max = 2 + scaled_level
-    armor = max(scaled_level // 3, 0)
-    return hp, attack_min, attack_max, armor
-
-
-def _default_combat_fields(level: int) -> tuple[int, int, str]:
-    ac = max(10, 10 + level // 2)
-    attack_bonus = 2 + level // 2
-    damage_die = "d6" if level < 3 else "d8"
-    return ac, attack_bonus, damage_die
+from rpg.infrastructure.db import portable
+from rpg.infrastructure.db.spell_classes import ANY_CLASS_KEY, class_key
+from . import statements
+from .connection import ReadSessionLocal, SessionLocal
+from .unit_of_work import current_unit_of_work, run_after_commit
+
+
+@contextmanager
+def _session_scope(read_only: bool = False) -> Iterator[Session]:
+    """Yield the active unit-of-work session, or a short-lived one of our own.
+
+    ``read_only`` queries may be served by the read replica; see
+    ``MysqlUnitOfWork.read_session`` for the read-your-writes rule.
+    """
+    uow = current_unit_of_work()
+    if uow is not None:
+        yield uow.read_session if read_only else uow.session
+        return
+    factory = (ReadSessionLocal or SessionLocal) if read_only else SessionLocal
+    with factory() as session:
+        yield session
+
+
+def _commit(session: Session) -> None:
+    # Inside a unit of work the owner commits once on exit.
+    uow = current_unit_of_work()
+    if uow is None:
+        session.commit()
+    else:
+        uow.mark_written()
+
+
+def _mark_clean_after_commit(model) -> None:
+    """Mark ``model`` clean as of now, but only once the write is committed.
+
+    A rolled-back unit of work leaves it dirty so the next save retries, and
+    edits made after this save but before the commit stay dirty either way.
+    """
+    snapshot = model.clean_snapshot()
+    run_after_commit(lambda: model.mark_clean(snapshot))
+
+
+def _execute_upserts(session, builder, rows) -> None:
+    """Run ``builder``'s multi-row upsert over ``rows`` in bounded chunks."""
+    size = statements.UPSERT_CHUNK_SIZE
+    for start in range(0, len(rows), size):
+        chunk = rows[start : start + size]
+        session.execute(builder(len(chunk)), statements.numbered_params(chunk))
 
 
 class MysqlClassRepository(ClassRepository):
     def list_playable(self) -> List[CharacterClass]:
-        with SessionLocal() as session:
-            rows = session.execute(
-                text(
-                    """
-                    SELECT class_id, name, open5e_slug, hit_die, primary_ability, source
-                    FROM class
-                    ORDER BY name
-                    """
-                )
-            ).all()
-
-            classes: List[CharacterClass] = []
-            for row in rows:
-                slug = row.open5e_slug or row.name.lower()
-                classes.append(
-                    CharacterClass(
-                        id=row.class_id,
-                        name=row.name,
-                        slug=slug,
-                        hit_die=row.hit_die,
-                        primary_ability=row.primary_ability,
-                        base_attributes=DEFAULT_CLASS_BASE_ATTRIBUTES.get(slug, {}),
-                    )
-                )
-            return classes
+        with _session_scope(read_only=True) as session:
+            rows = session.execute(portable.LIST_CLASSES).all()
+            return [portable.row_to_class(row) for row in rows]
 
     def get_by_slug(self, slug: str) -> Optional[CharacterClass]:
-        slug_key = slug.lower().strip()
-        with SessionLocal() as session:
+        with _session_scope(read_only=True) as session:
             row = session.execute(
-                text(
-                    """
-                    SELECT class_id, name, open5e_slug, hit_die, primary_ability, source
-                    FROM class
-                    WHERE LOWER(open5e_slug) = :slug OR LOWER(name) = :slug
-                    LIMIT 1
-                    """
-                ),
-                {"slug": slug_key},
+                statements.GET_CLASS_BY_SLUG,
+                {"slug": slug.lower().strip()},
             ).first()
-
-            if not row:
-                return None
-
-            return CharacterClass(
-                id=row.class_id,
-                name=row.name,
-                slug=row.open5e_slug or row.name.lower(),
-                hit_die=row.hit_die,
-                primary_ability=row.primary_ability,
-                base_attributes=DEFAULT_CLASS_BASE_ATTRIBUTES.get(slug_key, {}),
-            )
+            return portable.row_to_class(row) if row else None
 
 
 class MysqlCharacterRepository(CharacterRepository):
+    def __init__(self, history: Optional[HistoryRecorder] = None) -> None:
+        self.history = history
+
     def get(self, character_id: int) -> Optional[Character]:
-        with SessionLocal() as session:
+        uow = current_unit_of_work()
+        if uow is not None:
+            cached = uow.get_loaded(Character, character_id)
+            if cached is not None:
+                return cached
+
+        with _session_scope() as session:
             row = session.execute(
-                text(
-                    """
-                    SELECT c.character_id, c.name, c.alive, c.level, c.xp, c.money,
-                           c.character_type_id, c.hp_current, c.hp_max,
-                           cl.location_id, cls.name AS class_name
-                    FROM `character` c
-                    LEFT JOIN character_location cl ON cl.character_id = c.character_id
-                    LEFT JOIN character_class cc ON cc.character_id = c.character_id
-                    LEFT JOIN class cls ON cls.class_id = cc.class_id
-                    WHERE c.character_id = :cid
-                    """
-                ),
+                portable.GET_CHARACTER,
                 {"cid": character_id},
             ).first()
 
             if not row:
                 return None
 
-            attributes = self._load_attributes(session, row.character_id)
-
-            return Character(
-                id=row.character_id,
-                name=row.name,
-                alive=bool(row.alive),
-                level=row.level,
-                xp=row.xp,
-                money=row.money,
-                character_type_id=row.character_type_id,
-                location_id=row.location_id or 0,
-                hp_current=row.hp_current,
-                hp_max=row.hp_max,
-                class_name=row.class_name,
-                attributes=attributes,
-            )
+            attributes = self._load_attributes(session, [row.character_id])
+            character = portable.row_to_character(row, attributes.get(row.character_id, {}))
+            if uow is not None:
+                uow.register(Character, character.id, character)
+            return character
 
     def list_all(self) -> List[Character]:
+        with _session_scope() as session:
+            rows = session.execute(portable.LIST_CHARACTERS).all()
+            return [portable.row_to_character(row, {}) for row in rows]
+
+    def list_page(self, after_id: int = 0, limit: int = 50) -> List[Character]:
+        with _session_scope() as session:
+            rows = session.execute(portable.LIST_CHARACTERS_PAGE, {"after_id": after_id, "limit": limit}).all()
+            return [portable.row_to_character(row, {}) for row in rows]
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[Character]:
+        if current_unit_of_work() is not None:
+            # An unbuffered cursor would block other statements on the shared
+            # unit-of-work connection until drained, so page by key instead.
+            yield from super().iter_all(batch_size)
+            return
         with SessionLocal() as session:
-            rows = session.execute(
-                text(
-                    """
-                    SELECT c.character_id, c.name, c.alive, c.level, c.xp, c.money,
-                           c.character_type_id, c.hp_current, c.hp_max, cl.location_id
-                    FROM `character` c
-                    LEFT JOIN character_location cl ON cl.character_id = c.character_id
-                    ORDER BY c.character_id
-                    """
-                )
-            ).all()
-
-            return [
-                Character(
-                    id=row.character_id,
-                    name=row.name,
-                    alive=bool(row.alive),
-                    level=row.level,
-                    xp=row.xp,
-                    money=row.money,
-                    character_type_id=row.character_type_id,
-                    location_id=row.location_id or 0,
-                    hp_current=row.hp_current,
-                    hp_max=row.hp_max,
-                )
-                for row in rows
-            ]
+            result = session.execute(
+                portable.LIST_CHARACTERS,
+                execution_options={"stream_results": True, "yield_per": batch_size},
+            )
+            for row in result:
+                yield portable.row_to_character(row, {})
 
     def save(self, character: Character) -> None:
-        with SessionLocal() as session:
-            session.execute(
-                text(
-                    """
-                    INSERT INTO `character` (character_id, name, alive, level, xp, money, character_type_id, hp_current, hp_max)
-                    VALUES (:cid, :name, :alive, :level, :xp, :money, :ctype, :hp_current, :hp_max)
-                    ON DUPLICATE KEY UPDATE
-                        name = VALUES(name),
-                        alive = VALUES(alive),
-                        level = VALUES(level),
-                        xp = VALUES(xp),
-                        money = VALUES(money),
-                        character_type_id = VALUES(character_type_id),
-                        hp_current = VALUES(hp_current),
-                        hp_max = VALUES(hp_max)
-                    """
-                ),
-                {
-                    "cid": character.id,
-                    "name": character.name,
-                    "alive": int(character.alive),
-                    "level": character.level,
-                    "xp": character.xp,
-                    "money": character.money,
-                    "ctype": character.character_type_id,
-                    "hp_current": character.hp_current,
-                    "hp_max": character.hp_max,
-                },
-            )
-            # Upsert location mapping
+        dirty = character.dirty_fields()
+        if dirty:
+            with _session_scope() as session:
+                if character.is_tracked:
+                    self._update_changed(session, character, dirty)
+                else:
+                    self._upsert_full(session, character)
+                _commit(session)
+            _mark_clean_after_commit(character)
+            self._record_history("update", character, moved="location_id" in dirty)
+
+        uow = current_unit_of_work()
+        if uow is not None:
+            uow.register(Character, character.id, character)
+
+    def save_many(self, characters: Sequence[Character]) -> None:
+        changed = [character for character in characters if character.dirty_fields()]
+        if any(character.id is None for character in changed):
+            raise ValueError("save_many only updates stored characters; use create for new ones")
+
+        if changed:
+            character_rows = []
+            location_rows = []
+            for character in changed:
+                row = {column: getattr(character, column) for column in portable.CHARACTER_COLUMNS}
+                row["alive"] = int(row["alive"])
+                character_rows.append({"character_id": character.id} | row)
+                if character.location_id is not None:
+                    location_rows.append({"character_id": character.id, "location_id": character.location_id})
+
+            with _session_scope() as session:
+                _execute_upserts(session, statements.upsert_characters, character_rows)
+                _execute_upserts(session, statements.upsert_character_locations, location_rows)
+                # Attributes aren't selected by list queries, so only write edited ones.
+                self._upsert_attributes(session, [c for c in changed if "attributes" in c.dirty_fields()])
+                _commit(session)
+
+            for character in changed:
+                moved = "location_id" in character.dirty_fields()
+                _mark_clean_after_commit(character)
+                self._record_history("update", character, moved=moved)
+
+        uow = current_unit_of_work()
+        if uow is not None:
+            for character in characters:
+                uow.register(Character, character.id, character)
+
+    @staticmethod
+    def _upsert_attributes(session, characters: Sequence[Character]) -> None:
+        names = sorted({name for character in characters for name in (character.attributes or {})})
+        if not names:
+            return
+        attribute_ids = {
+            row.name: row.attribute_id
+            for row in session.execute(statements.GET_ATTRIBUTE_IDS, {"names": names}).all()
+        }
+        rows = [
+            {"character_id": character.id, "attribute_id": attribute_ids[name], "value": value}
+            for character in characters
+            for name, value in character.attributes.items()
+            if name in attribute_ids
+        ]
+        _execute_upserts(session, statements.upsert_character_attributes, rows)
+
+    @staticmethod
+    def _update_changed(session, character: Character, dirty) -> None:
+        columns = tuple(column for column in portable.CHARACTER_COLUMNS if column in dirty)
+        if columns:
+            params = {column: getattr(character, column) for column in columns}
+            if "alive" in params:
+                params["alive"] = int(params["alive"])
+            session.execute(portable.character_update(columns), params | {"cid": character.id})
+        if "location_id" in dirty:
             session.execute(
-                text(
-                    """
-                    INSERT INTO character_location (character_id, location_id)
-                    VALUES (:cid, :loc)
-                    ON DUPLICATE KEY UPDATE location_id = VALUES(location_id)
-                    """
-                ),
+                statements.UPSERT_CHARACTER_LOCATION,
                 {"cid": character.id, "loc": character.location_id},
             )
-            session.commit()
+        if "attributes" in dirty:
+            MysqlCharacterRepository._upsert_attributes(session, [character])
 
-    def find_by_location(self, location_id: int) -> List[Character]:
-        with SessionLocal() as session:
-            rows = session.execute(
-                text(
-                    """
-                    SELECT c.character_id, c.name, c.alive, c.level, c.xp, c.money,
-                           c.character_type_id, c.hp_current, c.hp_max,
-                           cl.location_id, cls.name AS class_name
-                    FROM `character` c
-                    INNER JOIN character_location cl ON cl.character_id = c.character_id
-                    LEFT JOIN character_class cc ON cc.character_id = c.character_id
-                    LEFT JOIN class cls ON cls.class_id = cc.class_id
-                    WHERE cl.location_id = :loc
-                    """
-                ),
-                {"loc": location_id},
-            ).all()
+    @staticmethod
+    def _upsert_full(session, character: Character) -> None:
+        session.execute(
+            statements.UPSERT_CHARACTER,
+            {
+                "cid": character.id,
+                "name": character.name,
+                "alive": int(character.alive),
+                "level": character.level,
+                "xp": character.xp,
+                "money": character.money,
+                "ctype": character.character_type_id,
+                "hp_current": character.hp_current,
+                "hp_max": character.hp_max,
+            },
+        )
+        # Upsert location mapping
+        session.execute(
+            statements.UPSERT_CHARACTER_LOCATION,
+            {"cid": character.id, "loc": character.location_id},
+        )
+        if character.id is not None:
+            MysqlCharacterRepository._upsert_attributes(session, [character])
 
-            characters: List[Character] = []
-            for row in rows:
-                attributes = self._load_attributes(session, row.character_id)
-                characters.append(
-                    Character(
-                        id=row.character_id,
-                        name=row.name,
-                        alive=bool(row.alive),
-                        level=row.level,
-                        xp=row.xp,
-                        money=row.money,
-                        character_type_id=row.character_type_id,
-                        location_id=row.location_id,
-                        hp_current=row.hp_current,
-                        hp_max=row.hp_max,
-                        class_name=row.class_name,
-                        attributes=attributes,
-                    )
-                )
-            return characters
+    def find_by_location(self, location_id: int) -> List[Character]:
+        with _session_scope() as session:
+            rows = session.execute(portable.FIND_CHARACTERS_AT, {"loc": location_id}).all()
+            attributes = self._load_attributes(session, [row.character_id for row in rows])
+        return [portable.row_to_character(row, attributes.get(row.character_id, {})) for row in rows]
 
     def create(self, character: Character, location_id: int) -> Character:
-        with SessionLocal() as session:
+        with _session_scope() as session:
             ctype_id = self._resolve_character_type_id(session)
             result = session.execute(
-                text(
-                    """
-                    INSERT INTO `character` (character_type_id, name, alive, level, xp, money, hp_current, hp_max)
-                    VALUES (:ctype, :name, 1, :level, :xp, :money, :hp_current, :hp_max)
-                    """
-                ),
+                portable.INSERT_CHARACTER,
                 {
                     "ctype": ctype_id,
                     "name": character.name,
@@ -312,12 +267,7 @@ class MysqlCharacterRepository(CharacterRepository):
 
             class_id = self._resolve_class_id(session, character.class_name or "fighter")
             session.execute(
-                text(
-                    """
-                    INSERT INTO character_class (character_id, class_id)
-                    VALUES (:cid, :class_id)
-                    """
-                ),
+                portable.INSERT_CHARACTER_CLASS,
                 {"cid": character_id, "class_id": class_id},
             )
 
@@ -326,69 +276,67 @@ class MysqlCharacterRepository(CharacterRepository):
                 if attr_id is None:
                     continue
                 session.execute(
-                    text(
-                        """
-                        INSERT INTO character_attribute (character_id, attribute_id, value)
-                        VALUES (:cid, :aid, :val)
-                        ON DUPLICATE KEY UPDATE value = VALUES(value)
-                        """
-                    ),
+                    statements.UPSERT_CHARACTER_ATTRIBUTE,
                     {"cid": character_id, "aid": attr_id, "val": value},
                 )
 
             session.execute(
-                text(
-                    """
-                    INSERT INTO character_location (character_id, location_id)
-                    VALUES (:cid, :loc)
-                    """
-                ),
+                portable.INSERT_CHARACTER_LOCATION,
                 {"cid": character_id, "loc": location_id},
             )
 
-            session.commit()
+            _commit(session)
             character.id = character_id
             character.location_id = location_id
             character.character_type_id = ctype_id
+            _mark_clean_after_commit(character)
+            self._record_history("create", character, moved=True)
+            uow = current_unit_of_work()
+            if uow is not None:
+                uow.register(Character, character_id, character)
             return character
 
-    def _load_attributes(self, session, character_id: int) -> dict[str, int]:
-        rows = session.execute(
-            text(
-                """
-                SELECT a.name AS attr_name, ca.value
-                FROM character_attribute ca
-                INNER JOIN attribute a ON a.attribute_id = ca.attribute_id
-                WHERE ca.character_id = :cid
-                """
-            ),
-            {"cid": character_id},
-        ).all()
-        return {row.attr_name: row.value for row in rows}
+    def _record_history(self, action: str, character: Character, moved: bool = False) -> None:
+        if self.history is None:
+            return
+        snapshot = {
+            "character_id": character.id,
+            "character_type_id": character.character_type_id,
+            "name": character.name,
+            "alive": int(character.alive),
+            "level": character.level,
+            "xp": character.xp,
+            "money": character.money,
+        }
+        placement = {"character_id": character.id, "location_id": character.location_id} if moved else None
+        history = self.history
+
+        def record() -> None:
+            history.record("character", action, snapshot)
+            if placement is not None:
+                history.record("character_location", action, placement)
+
+        run_after_commit(record)
+
+    @staticmethod
+    def _load_attributes(session, character_ids: Sequence[int]) -> Dict[int, Dict[str, int]]:
+        if not character_ids:
+            return {}
+        attributes: Dict[int, Dict[str, int]] = {}
+        for row in session.execute(portable.LOAD_ATTRIBUTES, {"cids": list(character_ids)}):
+            attributes.setdefault(row.character_id, {})[row.attr_name] = row.value
+        return attributes
 
     def _resolve_class_id(self, session, class_name: str) -> int:
         existing = session.execute(
-            text(
-                """
-                SELECT class_id
-                FROM class
-                WHERE LOWER(open5e_slug) = :slug OR LOWER(name) = :slug
-                LIMIT 1
-                """
-            ),
+            portable.CLASS_ID_BY_SLUG,
             {"slug": class_name.lower()},
         ).scalar()
         if existing:
             return existing
 
         result = session.execute(
-            text(
-                """
-                INSERT INTO class (name, open5e_slug, source)
-                VALUES (:name, :slug, 'local')
-                ON DUPLICATE KEY UPDATE name = VALUES(name)
-                """
-            ),
+            statements.INSERT_LOCAL_CLASS,
             {"name": class_name, "slug": class_name.lower()},
         )
         session.flush()
@@ -396,40 +344,30 @@ class MysqlCharacterRepository(CharacterRepository):
 
     def _resolve_attribute_id(self, session, attr_name: str) -> Optional[int]:
         return session.execute(
-            text("SELECT attribute_id FROM attribute WHERE name = :name LIMIT 1"),
+            statements.GET_ATTRIBUTE_ID,
             {"name": attr_name},
         ).scalar()
 
     def _resolve_character_type_id(self, session) -> int:
-        existing = session.execute(
-            text("SELECT character_type_id FROM character_type WHERE name = 'player' LIMIT 1")
-        ).scalar()
+        existing = session.execute(portable.PLAYER_TYPE_ID).scalar()
         if existing:
             return existing
-        result = session.execute(
-            text("INSERT INTO character_type (name) VALUES ('player')")
-        )
+        result = session.execute(portable.INSERT_PLAYER_TYPE)
         session.flush()
         return result.lastrowid
 
 
 class MysqlEntityRepository(EntityRepository):
+    def __init__(self, history: Optional[HistoryRecorder] = None) -> None:
+        self.history = history
+
     def get(self, entity_id: int) -> Optional[Entity]:
         results = self.get_many([entity_id])
         return results[0] if results else None
 
     def get_default_location_id(self) -> Optional[int]:
-        with SessionLocal() as session:
-            return session.execute(
-                text(
-                    """
-                    SELECT location_id
-                    FROM location
-                    ORDER BY location_id
-                    LIMIT 1
-                    """
-                )
-            ).scalar()
+        with _session_scope(read_only=True) as session:
+            return session.execute(statements.GET_DEFAULT_LOCATION_ID).scalar()
 
     def upsert_entities(self, entities: Sequence[Entity], location_id: Optional[int] = None) -> UpsertResult:
         if not entities:
@@ -437,126 +375,126 @@ class MysqlEntityRepository(EntityRepository):
 
         created = 0
         updated = 0
+        skipped = 0
         attached = 0
+        snapshots = []
 
-        with SessionLocal.begin() as session:
+        with _session_scope() as session:
             monster_type_id = self._ensure_entity_type(session, "monster")
+            # One lookup for the whole batch: monster name_key -> (entity_id, source_hash).
+            # Only monsters are matched on purpose: imports never touch an NPC or other
+            # entity that happens to share a monster's name (same as diff_entities).
+            stored = {
+                row.name_key: (row.entity_id, row.source_hash)
+                for row in session.execute(
+                    statements.GET_ENTITY_HASHES_BY_NAME,
+                    {
+                        "entity_type_id": monster_type_id,
+                        "names": sorted({entity.name.lower() for entity in entities}),
+                    },
+                )
+            }
 
             for entity in entities:
-                payload = {
-                    "entity_type_id": monster_type_id,
-                    "name": entity.name,
-                    "level": entity.level,
-                    "armour_class": entity.armour_class,
-                    "attack_bonus": entity.attack_bonus,
-                    "damage_dice": entity.damage_die,
-                    "hp_max": entity.hp_max,
-                    "kind": entity.kind,
-                }
-
-                existing_id = session.execute(
-                    text(
-                        """
-                        SELECT entity_id
-                        FROM entity
-                        WHERE LOWER(name) = :name
-                        LIMIT 1
-                        """
-                    ),
-                    {"name": entity.name.lower()},
-                ).scalar()
-
-                if existing_id:
-                    session.execute(
-                        text(
-                            """
-                            UPDATE entity
-                            SET level = :level,
-                                armour_class = :armour_class,
-                                attack_bonus = :attack_bonus,
-                                damage_dice = :damage_dice,
-                                hp_max = :hp_max,
-                                kind = :kind
-                            WHERE entity_id = :entity_id
-                            """
-                        ),
-                        payload | {"entity_id": existing_id},
-                    )
+                payload = portable.entity_import_payload(entity, monster_type_id)
+
+                existing_id, existing_hash = stored.get(entity.name.lower(), (None, None))
+                if existing_id and existing_hash == payload["source_hash"]:
                     entity_id = existing_id
-                    updated += 1
+                    skipped += 1
                 else:
-                    result = session.execute(
-                        text(
-                            """
-                            INSERT INTO entity (entity_type_id, name, level, armour_class, attack_bonus, damage_dice, hp_max, kind)
-                            VALUES (:entity_type_id, :name, :level, :armour_class, :attack_bonus, :damage_dice, :hp_max, :kind)
-                            """
-                        ),
-                        payload,
-                    )
-                    entity_id = result.lastrowid
-                    created += 1
+                    if existing_id:
+                        session.execute(
+                            statements.UPDATE_ENTITY,
+                            payload | {"entity_id": existing_id},
+                        )
+                        entity_id = existing_id
+                        updated += 1
+                    else:
+                        result = session.execute(
+                            statements.INSERT_ENTITY,
+                            payload,
+                        )
+                        entity_id = result.lastrowid
+                        created += 1
+                    stored[entity.name.lower()] = (entity_id, payload["source_hash"])
+
+                    if self.history is not None:
+                        snapshots.append(
+                            (
+                                "update" if existing_id else "create",
+                                {
+                                    "entity_id": entity_id,
+                                    "entity_type_id": monster_type_id,
+                                    "name": entity.name,
+                                    "level": entity.level,
+                                },
+                            )
+                        )
 
                 if location_id is not None:
                     attached_now = self._attach_location(session, entity_id, location_id)
                     attached += 1 if attached_now else 0
 
-        return UpsertResult(created=created, updated=updated, attached=attached)
+            _commit(session)
+
+        if snapshots:
+            history = self.history
+
+            def record_snapshots() -> None:
+                for action, row in snapshots:
+                    history.record("entity", action, row)
+
+            run_after_commit(record_snapshots)
+        return UpsertResult(created=created, updated=updated, attached=attached, skipped=skipped)
+
+    def diff_entities(self, entities: Sequence[Entity]) -> ChangeReport:
+        """Dry run of ``upsert_entities``: compare against every stored monster without writing."""
+        with _session_scope(read_only=True) as session:
+            monster_type_id = session.execute(statements.GET_ENTITY_TYPE_ID, {"name": "monster"}).scalar()
+            stored = (
+                dict(session.execute(statements.LIST_ENTITY_HASHES_BY_TYPE, {"entity_type_id": monster_type_id}).all())
+                if monster_type_id is not None
+                else {}
+            )
+        return diff_hashes(
+            "monsters",
+            stored,
+            (
+                (entity.name.lower(), portable.entity_import_payload(entity, monster_type_id)["source_hash"])
+                for entity in entities
+            ),
+        )
 
     @staticmethod
     def _ensure_entity_type(session, name: str) -> int:
         row = session.execute(
-            text(
-                """
-                SELECT entity_type_id
-                FROM entity_type
-                WHERE LOWER(name) = :name
-                LIMIT 1
-                """
-            ),
+            statements.GET_ENTITY_TYPE_ID,
             {"name": name.lower()},
         ).first()
         if row:
             return row.entity_type_id
 
-        result = session.execute(text("INSERT INTO entity_type (name) VALUES (:name)"), {"name": name})
+        result = session.execute(statements.INSERT_ENTITY_TYPE, {"name": name})
         return result.lastrowid
 
     @staticmethod
     def _attach_location(session, entity_id: int, location_id: int) -> bool:
         current_location = session.execute(
-            text(
-                """
-                SELECT location_id
-                FROM entity_location
-                WHERE entity_id = :entity_id
-                LIMIT 1
-                """
-            ),
+            statements.GET_ENTITY_LOCATION,
             {"entity_id": entity_id},
         ).scalar()
 
         if current_location is None:
             session.execute(
-                text(
-                    """
-                    INSERT INTO entity_location (entity_id, location_id)
-                    VALUES (:entity_id, :location_id)
-                    """
-                ),
+                statements.INSERT_ENTITY_LOCATION,
                 {"entity_id": entity_id, "location_id": location_id},
             )
             return True
 
         if current_location != location_id:
             session.execute(
-                text(
-                    """
-                    UPDATE entity_location
-                    SET location_id = :location_id
-                    WHERE entity_id = :entity_id
-                    """
-                ),
+                statements.UPDATE_ENTITY_LOCATION,
                 {"entity_id": entity_id, "location_id": location_id},
             )
             return True
@@ -569,283 +507,131 @@ class MysqlEntityRepository(EntityRepository):
         return self.list_by_level_band(lower, upper)
 
     def list_by_level_band(self, level_min: int, level_max: int) -> List[Entity]:
-        with SessionLocal() as session:
+        with _session_scope(read_only=True) as session:
             rows = session.execute(
-                text(
-                    """
-                    SELECT entity_id, name, level, armour_class, attack_bonus, damage_dice, hp_max, kind
-                    FROM entity
-                    WHERE level BETWEEN :low AND :high
-                    """
-                ),
+                portable.ENTITIES_BY_LEVEL,
                 {"low": level_min, "high": level_max},
             ).all()
-            entities: List[Entity] = []
-            for row in rows:
-                level = row.level or 1
-                hp, attack_min, attack_max, armor = _default_stats_for_level(level)
-                ac, attack_bonus, damage_die = _default_combat_fields(level)
-                if row.hp_max:
-                    hp = row.hp_max
-                if row.armour_class:
-                    ac = row.armour_class
-                if row.attack_bonus:
-                    attack_bonus = row.attack_bonus
-                if row.damage_dice:
-                    damage_die = row.damage_dice
-                entities.append(
-                    Entity(
-                        id=row.entity_id,
-                        name=row.name,
-                        level=level,
-                        hp=hp,
-                        hp_current=hp,
-                        hp_max=hp,
-                        attack_min=attack_min,
-                        attack_max=attack_max,
-                        armor=armor,
-                        armour_class=ac,
-                        attack_bonus=attack_bonus,
-                        damage_die=damage_die,
-                        kind=row.kind or "beast",
-                        tags=[],
-                    )
-                )
-            return entities
+            return rows_to_entities(rows)
 
     def list_by_location(self, location_id: int) -> List[Entity]:
-        with SessionLocal() as session:
+        with _session_scope(read_only=True) as session:
             rows = session.execute(
-                text(
-                    """
-                    SELECT e.entity_id, e.name, e.level, e.entity_type_id, e.armour_class, e.attack_bonus, e.damage_dice, e.hp_max, e.kind
-                    FROM entity e
-                    JOIN entity_location el ON el.entity_id = e.entity_id
-                    WHERE el.location_id = :loc
-                    """
-                ),
+                portable.ENTITIES_AT_LOCATION,
                 {"loc": location_id},
             ).all()
-
-            entities: List[Entity] = []
-            for row in rows:
-                level = row.level or 1
-                hp, attack_min, attack_max, armor = _default_stats_for_level(level)
-                ac, attack_bonus, damage_die = _default_combat_fields(level)
-                if row.hp_max:
-                    hp = row.hp_max
-                if row.armour_class:
-                    ac = row.armour_class
-                if row.attack_bonus:
-                    attack_bonus = row.attack_bonus
-                if row.damage_dice:
-                    damage_die = row.damage_dice
-                entities.append(
-                    Entity(
-                        id=row.entity_id,
-                        name=row.name,
-                        level=level,
-                        hp=hp,
-                        hp_current=hp,
-                        hp_max=hp,
-                        attack_min=attack_min,
-                        attack_max=attack_max,
-                        armor=armor,
-                        armour_class=ac,
-                        attack_bonus=attack_bonus,
-                        damage_die=damage_die,
-                        kind=row.kind or "beast",
-                        tags=[],
-                    )
-                )
-            return entities
+            return rows_to_entities(rows)
 
     def get_many(self, entity_ids: List[int]) -> List[Entity]:
         if not entity_ids:
             return []
 
-        with SessionLocal() as session:
+        with _session_scope(read_only=True) as session:
             rows = session.execute(
-                text(
-                    """
-                    SELECT entity_id, name, level, armour_class, attack_bonus, damage_dice, hp_max, kind
-                    FROM entity
-                    WHERE entity_id IN :ids
-                    """
-                ).bindparams(bindparam("ids", expanding=True)),
+                portable.ENTITIES_BY_ID,
                 {"ids": entity_ids},
             ).all()
-
-            entities: List[Entity] = []
-            for row in rows:
-                level = row.level or 1
-                hp, attack_min, attack_max, armor = _default_stats_for_level(level)
-                ac, attack_bonus, damage_die = _default_combat_fields(level)
-                if row.hp_max:
-                    hp = row.hp_max
-                if row.armour_class:
-                    ac = row.armour_class
-                if row.attack_bonus:
-                    attack_bonus = row.attack_bonus
-                if row.damage_dice:
-                    damage_die = row.damage_dice
-                entities.append(
-                    Entity(
-                        id=row.entity_id,
-                        name=row.name,
-                        level=level,
-                        hp=hp,
-                        hp_current=hp,
-                        hp_max=hp,
-                        attack_min=attack_min,
-                        attack_max=attack_max,
-                        armor=armor,
-                        armour_class=ac,
-                        attack_bonus=attack_bonus,
-                        damage_die=damage_die,
-                        kind=row.kind or "beast",
-                        tags=[],
-                    )
-                )
-            return entities
+            return rows_to_entities(rows)
 
 
 class MysqlWorldRepository(WorldRepository):
+    def __init__(self, history: Optional[HistoryRecorder] = None) -> None:
+        self.history = history
+
     def load_default(self) -> Optional[World]:
-        with SessionLocal() as session:
-            row = session.execute(
-                text(
-                    """
-                    SELECT world_id, name, current_turn, threat_level, flags, 1 as rng_seed
-                    FROM world
-                    ORDER BY world_id
-                    LIMIT 1
-                    """
-                )
-            ).first()
-            if not row:
-                session.execute(text("INSERT INTO world (name) VALUES ('Default World')"))
-                session.commit()
-                inserted_id = 1
-                return World(
-                    id=inserted_id,
-                    name="Default World",
-                    current_turn=0,
-                    threat_level=0,
-                    flags={},
-                    rng_seed=1,
-                )
-            flags = json.loads(row.flags) if isinstance(row.flags, str) else (row.flags or {})
+        uow = current_unit_of_work()
+        if uow is not None:
+            cached = uow.get_loaded(World, "default")
+            if cached is not None:
+                return cached
+
+        world = self._load_default()
+        if world is not None:
+            world.mark_clean()
+            if uow is not None:
+                uow.register(World, "default", world)
+        return world
+
+    def _load_default(self) -> Optional[World]:
+        with _session_scope() as session:
+            row = session.execute(portable.LOAD_WORLD).first()
+            if row:
+                return portable.row_to_world(row)
+            session.execute(portable.INSERT_WORLD)
+            _commit(session)
+            inserted_id = 1
             return World(
-                id=row.world_id,
-                name=row.name,
-                current_turn=row.current_turn,
-                threat_level=row.threat_level,
-                flags=flags if isinstance(flags, dict) else {},
+                id=inserted_id,
+                name="Default World",
+                current_turn=0,
+                threat_level=0,
+                flags={},
                 rng_seed=1,
             )
 
     def save(self, world: World) -> None:
-        with SessionLocal() as session:
-            payload_flags = world.flags if isinstance(world.flags, str) else json.dumps(world.flags)
-            session.execute(
-                text(
-                    """
-                    UPDATE world
-                    SET current_turn = :turn,
-                        threat_level = :threat,
-                        flags = :flags
-                    WHERE world_id = :wid
-                    """
-                ),
-                {"turn": world.current_turn, "threat": world.threat_level, "flags": payload_flags, "wid": world.id},
-            )
-            session.commit()
+        dirty = world.dirty_fields()
+        if dirty:
+            columns = tuple(column for column in World._tracked_fields if column in dirty)
+            params = {column: getattr(world, column) for column in columns}
+            if "flags" in params and not isinstance(world.flags, str):
+                # Only re-serialise flags on ticks that actually changed them.
+                params["flags"] = json.dumps(world.flags)
+            with _session_scope() as session:
+                session.execute(portable.world_update(columns), params | {"wid": world.id})
+                _commit(session)
+            _mark_clean_after_commit(world)
+            self._record_history(world)
+
+        uow = current_unit_of_work()
+        if uow is not None:
+            uow.register(World, "default", world)
+
+
+    def _record_history(self, world: World) -> None:
+        if self.history is None:
+            return
+        snapshot = {
+            "world_id": world.id,
+            "name": world.name,
+            "current_turn": world.current_turn,
+            "threat_level": world.threat_level,
+            "flags": world.flags if isinstance(world.flags, str) else json.dumps(world.flags),
+        }
+        history = self.history
+        run_after_commit(lambda: history.record("world", "update", snapshot))
 
 
 class MysqlLocationRepository(LocationRepository):
     def get(self, location_id: int) -> Optional[Location]:
-        with SessionLocal() as session:
-            row = session.execute(
-                text(
-                    """
-                    SELECT l.location_id, l.x, l.y, p.name AS place_name
-                    FROM location l
-                    INNER JOIN place p ON p.place_id = l.place_id
-                    WHERE l.location_id = :loc
-                    """
-                ),
-                {"loc": location_id},
-            ).first()
-            if not row:
-                return None
-            return Location(id=row.location_id, name=row.place_name, base_level=1)
+        with _session_scope(read_only=True) as session:
+            row = session.execute(portable.GET_LOCATION, {"loc": location_id}).first()
+            return portable.row_to_location(row) if row else None
 
     def list_all(self) -> List[Location]:
-        with SessionLocal() as session:
-            rows = session.execute(
-                text(
-                    """
-                    SELECT l.location_id, l.x, l.y, p.name AS place_name
-                    FROM location l
-                    INNER JOIN place p ON p.place_id = l.place_id
-                    ORDER BY l.location_id
-                    """
-                )
-            ).all()
-            return [Location(id=row.location_id, name=row.place_name, base_level=1) for row in rows]
+        with _session_scope(read_only=True) as session:
+            rows = session.execute(portable.LIST_LOCATIONS).all()
+            return [portable.row_to_location(row) for row in rows]
 
     def get_starting_location(self) -> Optional[Location]:
-        with SessionLocal() as session:
-            row = session.execute(
-                text(
-                    """
-                    SELECT l.location_id, l.x, l.y, p.name AS place_name
-                    FROM location l
-                    INNER JOIN place p ON p.place_id = l.place_id
-                    ORDER BY l.location_id
-                    LIMIT 1
-                    """
-                )
-            ).first()
-            if not row:
-                return None
-            return Location(id=row.location_id, name=row.place_name, base_level=1)
+        with _session_scope(read_only=True) as session:
+            row = session.execute(portable.STARTING_LOCATION).first()
+            return portable.row_to_location(row) if row else None
 
 
 class MysqlSpellRepository(SpellRepository):
     def get_by_slug(self, slug: str) -> Optional[Spell]:
-        with SessionLocal() as session:
+        with _session_scope(read_only=True) as session:
             row = session.execute(
-                text(
-                    """
-                    SELECT slug, name, level_int, school, casting_time, range_text, duration,
-                           components, concentration, ritual, desc_text, higher_level, classes_json
-                    FROM spell
-                    WHERE slug = :slug
-                    """
-                ),
+                portable.SPELL_BY_SLUG,
                 {"slug": slug},
-            ).mappings().first()
-            return _row_to_spell(row) if row else None
+            ).first()
+            return portable.row_to_spell(row) if row else None
 
     def list_by_class(self, class_slug: str, max_level: int) -> Sequence[Spell]:
-        class_name = class_slug.title()
-        with SessionLocal() as session:
+        with _session_scope(read_only=True) as session:
             rows = session.execute(
-                text(
-                    """
-                    SELECT slug, name, level_int, school, casting_time, range_text, duration,
-                           components, concentration, ritual, desc_text, higher_level, classes_json
-                    FROM spell
-                    WHERE level_int <= :max_level
-                      AND (
-                        classes_json IS NULL
-                        OR JSON_CONTAINS(classes_json, JSON_QUOTE(:class_name))
-                      )
-                    ORDER BY level_int ASC, name ASC
-                    """
-                ),
-                {"max_level": max_level, "class_name": class_name},
-            ).mappings().all()
-            return [_row_to_spell(r) for r in rows]
+                portable.SPELLS_FOR_CLASS,
+                {"class_key": class_key(class_slug), "any_class": ANY_CLASS_KEY, "max_level": max_level},
+            ).all()
+            return [portable.row_to_spell(r) for r in rows]
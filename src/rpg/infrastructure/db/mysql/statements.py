@@ -0,0 +1,191 @@
+"""SQL for the MySQL repositories, built once at import.
+
+Each constant is a single ``TextClause`` shared by every call, so repository
+methods do no string formatting or ``text()`` parsing per call. SQLAlchemy
+keys its compiled cache on the engine (and so the dialect) plus the
+statement's cache key, so each statement is compiled once per dialect and
+reused from then on; the expanding ``IN`` parameter is declared here too so
+``get_many`` doesn't rebuild it either.
+
+Reads and updates that MySQL shares with the SQLite and asyncio backends live
+in ``rpg.infrastructure.db.portable``; this module keeps the MySQL-only SQL
+(``ON DUPLICATE KEY`` upserts, generated ``*_key`` lookups, importer writes).
+"""
+
+from functools import lru_cache
+
+from sqlalchemy import bindparam, text
+
+from rpg.infrastructure.db.portable import CHARACTER_COLUMNS, CLASS_COLUMNS
+
+
+# -- classes -----------------------------------------------------------------
+
+GET_CLASS_BY_SLUG = text(CLASS_COLUMNS + " WHERE slug_key = :slug OR name_key = :slug LIMIT 1")
+
+INSERT_LOCAL_CLASS = text(
+    """
+    INSERT INTO class (name, open5e_slug, source)
+    VALUES (:name, :slug, 'local')
+    ON DUPLICATE KEY UPDATE name = VALUES(name)
+    """
+)
+
+# -- characters --------------------------------------------------------------
+
+UPSERT_CHARACTER = text(
+    """
+    INSERT INTO `character` (character_id, name, alive, level, xp, money, character_type_id, hp_current, hp_max)
+    VALUES (:cid, :name, :alive, :level, :xp, :money, :ctype, :hp_current, :hp_max)
+    ON DUPLICATE KEY UPDATE
+        name = VALUES(name),
+        alive = VALUES(alive),
+        level = VALUES(level),
+        xp = VALUES(xp),
+        money = VALUES(money),
+        character_type_id = VALUES(character_type_id),
+        hp_current = VALUES(hp_current),
+        hp_max = VALUES(hp_max)
+    """
+)
+
+UPSERT_CHARACTER_ATTRIBUTE = text(
+    """
+    INSERT INTO character_attribute (character_id, attribute_id, value)
+    VALUES (:cid, :aid, :val)
+    ON DUPLICATE KEY UPDATE value = VALUES(value)
+    """
+)
+
+UPSERT_CHARACTER_LOCATION = text(
+    """
+    INSERT INTO character_location (character_id, location_id)
+    VALUES (:cid, :loc)
+    ON DUPLICATE KEY UPDATE location_id = VALUES(location_id)
+    """
+)
+
+GET_ATTRIBUTE_ID = text("SELECT attribute_id FROM attribute WHERE name = :name LIMIT 1")
+
+# Rows per multi-row upsert in save_many; bounds packet size and cached variants.
+UPSERT_CHUNK_SIZE = 500
+
+_CHARACTER_UPSERT_COLUMNS = ("character_id",) + CHARACTER_COLUMNS
+
+
+def _multi_row_upsert(table_sql: str, columns: tuple[str, ...], update_columns: tuple[str, ...], count: int):
+    rows = ", ".join("(" + ", ".join(f":{column}_{i}" for column in columns) + ")" for i in range(count))
+    updates = ", ".join(f"{column} = VALUES({column})" for column in update_columns)
+    return text(f"INSERT INTO {table_sql} ({', '.join(columns)}) VALUES {rows} ON DUPLICATE KEY UPDATE {updates}")
+
+
+def numbered_params(rows) -> dict:
+    """Flatten row dicts into the ``:column_<row>`` parameters used by the upserts below."""
+    return {f"{column}_{i}": value for i, row in enumerate(rows) for column, value in row.items()}
+
+
+@lru_cache(maxsize=64)
+def upsert_characters(count: int):
+    return _multi_row_upsert("`character`", _CHARACTER_UPSERT_COLUMNS, CHARACTER_COLUMNS, count)
+
+
+@lru_cache(maxsize=64)
+def upsert_character_locations(count: int):
+    return _multi_row_upsert("character_location", ("character_id", "location_id"), ("location_id",), count)
+
+
+@lru_cache(maxsize=64)
+def upsert_character_attributes(count: int):
+    return _multi_row_upsert(
+        "character_attribute", ("character_id", "attribute_id", "value"), ("value",), count
+    )
+
+
+GET_ATTRIBUTE_IDS = text("SELECT attribute_id, name FROM attribute WHERE name IN :names").bindparams(
+    bindparam("names", expanding=True)
+)
+
+
+# -- entities ----------------------------------------------------------------
+
+GET_DEFAULT_LOCATION_ID = text(
+    """
+    SELECT location_id
+    FROM location
+    ORDER BY location_id
+    LIMIT 1
+    """
+)
+
+GET_ENTITY_HASHES_BY_NAME = text(
+    """
+    SELECT entity_id, name_key, source_hash
+    FROM entity
+    WHERE entity_type_id = :entity_type_id
+      AND name_key IN :names
+    """
+).bindparams(bindparam("names", expanding=True))
+
+LIST_ENTITY_HASHES_BY_TYPE = text(
+    """
+    SELECT name_key, source_hash
+    FROM entity
+    WHERE entity_type_id = :entity_type_id
+    """
+)
+
+UPDATE_ENTITY = text(
+    """
+    UPDATE entity
+    SET level = :level,
+        armour_class = :armour_class,
+        attack_bonus = :attack_bonus,
+        damage_dice = :damage_dice,
+        hp_max = :hp_max,
+        kind = :kind,
+        source_hash = :source_hash
+    WHERE entity_id = :entity_id
+    """
+)
+
+INSERT_ENTITY = text(
+    """
+    INSERT INTO entity (entity_type_id, name, level, armour_class, attack_bonus, damage_dice, hp_max, kind, source_hash)
+    VALUES (:entity_type_id, :name, :level, :armour_class, :attack_bonus, :damage_dice, :hp_max, :kind, :source_hash)
+    """
+)
+
+GET_ENTITY_TYPE_ID = text(
+    """
+    SELECT entity_type_id
+    FROM entity_type
+    WHERE name_key = :name
+    LIMIT 1
+    """
+)
+
+INSERT_ENTITY_TYPE = text("INSERT INTO entity_type (name) VALUES (:name)")
+
+GET_ENTITY_LOCATION = text(
+    """
+    SELECT location_id
+    FROM entity_location
+    WHERE entity_id = :entity_id
+    LIMIT 1
+    """
+)
+
+INSERT_ENTITY_LOCATION = text(
+    """
+    INSERT INTO entity_location (entity_id, location_id)
+    VALUES (:entity_id, :location_id)
+    """
+)
+
+UPDATE_ENTITY_LOCATION = text(
+    """
+    UPDATE entity_location
+    SET location_id = :location_id
+    WHERE entity_id = :entity_id
+    """
+)
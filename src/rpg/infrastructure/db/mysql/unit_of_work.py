@@ -0,0 +1,137 @@
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session, sessionmaker
+
+
+_current_uow: ContextVar[Optional["MysqlUnitOfWork"]] = ContextVar("mysql_unit_of_work", default=None)
+
+
+def current_unit_of_work() -> Optional["MysqlUnitOfWork"]:
+    """Return the unit of work active in this context, if any."""
+    return _current_uow.get()
+
+
+def run_after_commit(callback: Callable[[], None]) -> None:
+    """Run ``callback`` now, or when the active unit of work commits."""
+    uow = _current_uow.get()
+    if uow is None:
+        callback()
+    else:
+        uow.after_commit(callback)
+
+
+class MysqlUnitOfWork:
+    """Share one session, one transaction and an identity map across repositories.
+
+    Usage:
+        with MysqlUnitOfWork():
+            world = world_repo.load_default()
+            character = character_repo.get(1)
+            character_repo.save(character)
+
+    Every MySQL repository call made inside the block reuses the same session and
+    commits once on exit (or rolls back if the block raises). Nested units of work
+    join the outermost one, so services can open a scope without knowing whether
+    the caller already did. Read-only repository queries use ``read_session``,
+    which targets the replica (``RPG_READ_DATABASE_URL``) when one is configured.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[sessionmaker] = None,
+        read_session_factory: Optional[sessionmaker] = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._read_session_factory = read_session_factory
+        self._session: Optional[Session] = None
+        self._read_session: Optional[Session] = None
+        self._wrote = False
+        self._token = None
+        self._joined: Optional["MysqlUnitOfWork"] = None
+        self.identity_map: Dict[Tuple[type, Hashable], Any] = {}
+        self._after_commit: List[Callable[[], None]] = []
+
+    @property
+    def session(self) -> Session:
+        if self._joined is not None:
+            return self._joined.session
+        if self._session is None:
+            factory = self._session_factory
+            if factory is None:
+                from .connection import SessionLocal
+
+                factory = SessionLocal
+            self._session = factory()
+        return self._session
+
+    @property
+    def read_session(self) -> Session:
+        """Session for read-only queries: the replica until this unit of work writes.
+
+        After the first write every read sticks to the primary session, so the
+        action always sees its own changes.
+        """
+        owner = self._joined or self
+        factory = owner._read_session_factory
+        if factory is None and owner._session_factory is None:
+            from .connection import ReadSessionLocal
+
+            factory = ReadSessionLocal
+        if owner._wrote or factory is None:
+            return owner.session
+        if owner._read_session is None:
+            owner._read_session = factory()
+        return owner._read_session
+
+    def mark_written(self) -> None:
+        owner = self._joined or self
+        owner._wrote = True
+
+    def get_loaded(self, kind: type, key: Hashable) -> Any:
+        owner = self._joined or self
+        return owner.identity_map.get((kind, key))
+
+    def register(self, kind: type, key: Hashable, obj: Any) -> None:
+        owner = self._joined or self
+        owner.identity_map[(kind, key)] = obj
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Run ``callback`` once the outermost unit of work has committed."""
+        owner = self._joined or self
+        owner._after_commit.append(callback)
+
+    def __enter__(self) -> "MysqlUnitOfWork":
+        outer = _current_uow.get()
+        if outer is not None:
+            self._joined = outer
+            return self
+        self._token = _current_uow.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._joined is not None:
+            self._joined = None
+            return
+        try:
+            if self._session is not None:
+                if exc_type is None:
+                    self._session.commit()
+                else:
+                    self._session.rollback()
+        finally:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+            if self._read_session is not None:
+                self._read_session.close()
+                self._read_session = None
+            self._wrote = False
+            self.identity_map.clear()
+            _current_uow.reset(self._token)
+            self._token = None
+            callbacks, self._after_commit = self._after_commit, []
+        # Reached only if the commit (when there was one) succeeded.
+        if exc_type is None:
+            for callback in callbacks:
+                callback()
@@ -0,0 +1,247 @@
+"""Dialect-neutral SQL and row mappers shared by the SQLite, MySQL and asyncio repositories.
+
+The embedded SQLite repositories, the MySQL repositories and the asyncio
+repositories (aiomysql in production, aiosqlite in tests) read the same
+tables with the same queries, so the SELECTs, the column lists, the cached UPDATE builders and the
+row-to-model mappers live here once. Everything uses syntax both MySQL and
+SQLite accept (`character` is backtick-quoted, which SQLite also allows);
+upserts differ per dialect and stay with each backend.
+"""
+
+import json
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from sqlalchemy import bindparam, text
+
+from rpg.domain.models.character import Character
+from rpg.domain.models.character_class import CharacterClass
+from rpg.domain.models.entity import Entity
+from rpg.domain.models.location import Location
+from rpg.domain.models.spell import Spell
+from rpg.domain.models.world import World
+from rpg.infrastructure.db.entity_mapper import qualified_entity_columns
+from rpg.infrastructure.db.source_hash import content_hash
+
+
+DEFAULT_CLASS_BASE_ATTRIBUTES: Dict[str, Dict[str, int]] = {
+    "barbarian": {"STR": 15, "DEX": 12, "CON": 14, "INT": 8, "WIS": 10, "CHA": 10},
+    "bard": {"STR": 10, "DEX": 12, "CON": 12, "INT": 12, "WIS": 10, "CHA": 15},
+    "cleric": {"STR": 12, "DEX": 10, "CON": 13, "INT": 10, "WIS": 15, "CHA": 11},
+    "druid": {"STR": 10, "DEX": 12, "CON": 13, "INT": 12, "WIS": 15, "CHA": 10},
+    "fighter": {"STR": 15, "DEX": 12, "CON": 14, "INT": 10, "WIS": 10, "CHA": 10},
+    "monk": {"STR": 12, "DEX": 15, "CON": 12, "INT": 10, "WIS": 14, "CHA": 10},
+    "paladin": {"STR": 15, "DEX": 10, "CON": 14, "INT": 10, "WIS": 12, "CHA": 14},
+    "ranger": {"STR": 13, "DEX": 15, "CON": 13, "INT": 10, "WIS": 12, "CHA": 10},
+    "rogue": {"STR": 10, "DEX": 16, "CON": 12, "INT": 12, "WIS": 10, "CHA": 12},
+    "sorcerer": {"STR": 8, "DEX": 12, "CON": 12, "INT": 12, "WIS": 10, "CHA": 16},
+    "warlock": {"STR": 10, "DEX": 12, "CON": 12, "INT": 12, "WIS": 12, "CHA": 16},
+    "wizard": {"STR": 8, "DEX": 12, "CON": 12, "INT": 16, "WIS": 12, "CHA": 10},
+}
+
+CHARACTER_COLUMNS = ("name", "alive", "level", "xp", "money", "character_type_id", "hp_current", "hp_max")
+
+# -- characters --------------------------------------------------------------
+
+_CHARACTER_SELECT = """
+    SELECT c.character_id, c.name, c.alive, c.level, c.xp, c.money,
+           c.character_type_id, c.hp_current, c.hp_max,
+           cl.location_id, cls.name AS class_name
+    FROM `character` c
+    LEFT JOIN character_location cl ON cl.character_id = c.character_id
+    LEFT JOIN character_class cc ON cc.character_id = c.character_id
+    LEFT JOIN class cls ON cls.class_id = cc.class_id
+"""
+GET_CHARACTER = text(_CHARACTER_SELECT + " WHERE c.character_id = :cid")
+LIST_CHARACTERS = text(_CHARACTER_SELECT + " ORDER BY c.character_id")
+LIST_CHARACTERS_PAGE = text(
+    _CHARACTER_SELECT + " WHERE c.character_id > :after_id ORDER BY c.character_id LIMIT :limit"
+)
+FIND_CHARACTERS_AT = text(_CHARACTER_SELECT + " WHERE cl.location_id = :loc ORDER BY c.character_id")
+LOAD_ATTRIBUTES = text(
+    """
+    SELECT ca.character_id, a.name AS attr_name, ca.value
+    FROM character_attribute ca
+    INNER JOIN attribute a ON a.attribute_id = ca.attribute_id
+    WHERE ca.character_id IN :cids
+    """
+).bindparams(bindparam("cids", expanding=True))
+INSERT_CHARACTER = text(
+    """
+    INSERT INTO `character` (character_type_id, name, alive, level, xp, money, hp_current, hp_max)
+    VALUES (:ctype, :name, 1, :level, :xp, :money, :hp_current, :hp_max)
+    """
+)
+INSERT_CHARACTER_CLASS = text("INSERT INTO character_class (character_id, class_id) VALUES (:cid, :class_id)")
+INSERT_CHARACTER_LOCATION = text("INSERT INTO character_location (character_id, location_id) VALUES (:cid, :loc)")
+PLAYER_TYPE_ID = text("SELECT character_type_id FROM character_type WHERE name = 'player' LIMIT 1")
+INSERT_PLAYER_TYPE = text("INSERT INTO character_type (name) VALUES ('player')")
+
+# -- classes -----------------------------------------------------------------
+
+CLASS_COLUMNS = "SELECT class_id, name, open5e_slug, hit_die, primary_ability, source FROM class"
+LIST_CLASSES = text(CLASS_COLUMNS + " ORDER BY name")
+CLASS_ID_BY_SLUG = text("SELECT class_id FROM class WHERE slug_key = :slug OR name_key = :slug LIMIT 1")
+INSERT_LOCAL_CLASS = text("INSERT INTO class (name, open5e_slug, source) VALUES (:name, :slug, 'local')")
+
+# -- entities ----------------------------------------------------------------
+
+_ENTITY_COLUMNS = qualified_entity_columns("e")
+ENTITIES_BY_ID = text(f"SELECT {_ENTITY_COLUMNS} FROM entity e WHERE e.entity_id IN :ids").bindparams(
+    bindparam("ids", expanding=True)
+)
+ENTITIES_BY_LEVEL = text(f"SELECT {_ENTITY_COLUMNS} FROM entity e WHERE e.level BETWEEN :low AND :high")
+ENTITIES_AT_LOCATION = text(
+    f"""
+    SELECT {_ENTITY_COLUMNS}
+    FROM entity_location el
+    JOIN entity e ON e.entity_id = el.entity_id
+    WHERE el.location_id = :loc
+    """
+)
+
+# -- world and locations -----------------------------------------------------
+
+LOAD_WORLD = text("SELECT world_id, name, current_turn, threat_level, flags FROM world ORDER BY world_id LIMIT 1")
+INSERT_WORLD = text("INSERT INTO world (name) VALUES ('Default World')")
+
+_LOCATION_SELECT = """
+    SELECT l.location_id, p.name AS place_name
+    FROM location l
+    INNER JOIN place p ON p.place_id = l.place_id
+"""
+GET_LOCATION = text(_LOCATION_SELECT + " WHERE l.location_id = :loc")
+LIST_LOCATIONS = text(_LOCATION_SELECT + " ORDER BY l.location_id")
+STARTING_LOCATION = text(_LOCATION_SELECT + " ORDER BY l.location_id LIMIT 1")
+
+# -- spells ------------------------------------------------------------------
+
+SPELL_BY_SLUG = text(
+    """
+    SELECT slug, name, level_int, school, casting_time, range_text, duration,
+           components, concentration, ritual, desc_text, higher_level, classes_json
+    FROM spell
+    WHERE slug = :slug
+    """
+)
+SPELLS_FOR_CLASS = text(
+    """
+    SELECT s.slug, s.name, s.level_int, s.school, s.casting_time, s.range_text, s.duration,
+           s.components, s.concentration, s.ritual, s.desc_text, s.higher_level, s.classes_json
+    FROM spell_class sc
+    INNER JOIN spell s ON s.slug = sc.spell_slug
+    WHERE sc.class_key IN (:class_key, :any_class)
+      AND sc.level_int <= :max_level
+    ORDER BY s.level_int ASC, s.name ASC
+    """
+)
+
+
+@lru_cache(maxsize=None)
+def character_update(columns: tuple[str, ...]):
+    """UPDATE for just ``columns`` of one character, built once per column set."""
+    assignments = ", ".join(f"{column} = :{column}" for column in columns)
+    return text(f"UPDATE `character` SET {assignments} WHERE character_id = :cid")
+
+
+@lru_cache(maxsize=None)
+def world_update(columns: tuple[str, ...]):
+    """UPDATE for just ``columns`` of the world row, built once per column set."""
+    assignments = ", ".join(f"{column} = :{column}" for column in columns)
+    return text(f"UPDATE world SET {assignments} WHERE world_id = :wid")
+
+
+def entity_import_payload(entity: Entity, entity_type_id: Optional[int]) -> dict:
+    """Column values an import writes for ``entity``, plus their ``source_hash``."""
+    payload = {
+        "entity_type_id": entity_type_id,
+        "name": entity.name,
+        "level": entity.level,
+        "armour_class": entity.armour_class,
+        "attack_bonus": entity.attack_bonus,
+        "damage_dice": entity.damage_die,
+        "hp_max": entity.hp_max,
+        "kind": entity.kind,
+    }
+    payload["source_hash"] = content_hash(payload)
+    return payload
+
+
+def row_to_character(row, attributes: Dict[str, int]) -> Character:
+    character = Character(
+        id=row.character_id,
+        name=row.name,
+        alive=bool(row.alive),
+        level=row.level,
+        xp=row.xp,
+        money=row.money,
+        character_type_id=row.character_type_id,
+        location_id=row.location_id or 0,
+        hp_current=row.hp_current,
+        hp_max=row.hp_max,
+        class_name=row.class_name,
+        attributes=attributes,
+    )
+    character.mark_clean()
+    return character
+
+
+def row_to_class(row) -> CharacterClass:
+    slug = row.open5e_slug or row.name.lower()
+    return CharacterClass(
+        id=row.class_id,
+        name=row.name,
+        slug=slug,
+        hit_die=row.hit_die,
+        primary_ability=row.primary_ability,
+        base_attributes=DEFAULT_CLASS_BASE_ATTRIBUTES.get(slug, {}),
+    )
+
+
+def row_to_world(row) -> World:
+    flags = row.flags
+    if isinstance(flags, str):
+        flags = json.loads(flags) if flags else {}
+    world = World(
+        id=row.world_id,
+        name=row.name,
+        current_turn=row.current_turn,
+        threat_level=row.threat_level,
+        flags=flags if isinstance(flags, dict) else {},
+        rng_seed=1,
+    )
+    world.mark_clean()
+    return world
+
+
+def row_to_location(row) -> Location:
+    return Location(id=row.location_id, name=row.place_name, base_level=1)
+
+
+def _decode_classes(raw) -> Optional[List[str]]:
+    if isinstance(raw, list):
+        return raw
+    if isinstance(raw, str) and raw:
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+    return None
+
+
+def row_to_spell(row) -> Spell:
+    return Spell(
+        slug=row.slug,
+        name=row.name,
+        level_int=row.level_int,
+        school=row.school,
+        casting_time=row.casting_time,
+        range_text=row.range_text,
+        duration=row.duration,
+        components=row.components,
+        concentration=bool(row.concentration),
+        ritual=bool(row.ritual),
+        desc_text=row.desc_text,
+        higher_level=row.higher_level,
+        classes=_decode_classes(row.classes_json),
+    )
@@ -0,0 +1,15 @@
+"""Content hashes for imported rows (the ``source_hash`` columns).
+
+The hash covers the values an importer would write, not the raw API payload,
+so a mapping change also counts as a change. Keys are sorted, which makes the
+hash independent of dict ordering.
+"""
+
+import hashlib
+import json
+from typing import Mapping
+
+
+def content_hash(values: Mapping[str, object]) -> str:
+    encoded = json.dumps(values, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
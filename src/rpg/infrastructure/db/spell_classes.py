@@ -0,0 +1,32 @@
+"""Keys for the ``spell_class`` index that backs spell lookups by class.
+
+Each spell gets one row per class that can learn it, keyed by the lower-cased
+class name. Spells with no class list at all (``classes_json`` is NULL) are
+open to everyone and get a single ``ANY_CLASS_KEY`` row, so a class lookup is
+``class_key IN (:key, '*')``. An explicit empty list gets no rows and matches
+no class, exactly as the old ``JSON_CONTAINS`` filter behaved.
+"""
+
+from typing import Iterable, List, Optional
+
+
+ANY_CLASS_KEY = "*"
+
+
+def class_key(class_name: str) -> str:
+    return class_name.strip().lower()
+
+
+def spell_class_keys(classes: Optional[Iterable[str]]) -> List[str]:
+    """Return the distinct index keys for a spell's class list, in order.
+
+    ``None`` (no list) maps to ``[ANY_CLASS_KEY]``; an empty list maps to ``[]``.
+    """
+    if classes is None:
+        return [ANY_CLASS_KEY]
+    keys: List[str] = []
+    for name in classes:
+        key = class_key(str(name))
+        if key and key not in keys:
+            keys.append(key)
+    return keys
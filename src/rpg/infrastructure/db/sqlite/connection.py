@@ -0,0 +1,59 @@
+import os
+from pathlib import Path
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+DEFAULT_SQLITE_URL = "sqlite:///rpg_game.sqlite3"
+SCHEMA_PATH = Path(__file__).with_name("schema.sql")
+# Columns added after a table first shipped; CREATE TABLE IF NOT EXISTS leaves older files without them.
+ADDED_COLUMNS = (("entity", "source_hash", "TEXT"),)
+
+
+def create_sqlite_engine(url: str | None = None) -> Engine:
+    """Create an engine tuned for an embedded, single-file game database.
+
+    File databases run in WAL mode so readers never block the writer, with
+    ``synchronous=NORMAL`` (safe under WAL) and foreign keys enforced.
+    """
+    url = url or os.getenv("RPG_DATABASE_URL", DEFAULT_SQLITE_URL)
+    engine = create_engine(
+        url,
+        echo=False,
+        future=True,
+        # sqlite3 keeps this many prepared statements per connection.
+        connect_args={"cached_statements": 256, "check_same_thread": False},
+    )
+
+    @event.listens_for(engine, "connect")
+    def _configure_connection(dbapi_connection, _record) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    return engine
+
+
+def ensure_schema(engine: Engine) -> None:
+    """Create tables, indexes and seed rows if they are missing (idempotent)."""
+    script = SCHEMA_PATH.read_text(encoding="utf-8")
+    raw = engine.raw_connection()
+    try:
+        connection = raw.driver_connection
+        connection.executescript(script)
+        for table, column, column_type in ADDED_COLUMNS:
+            existing = {row[1] for row in connection.execute(f"PRAGMA table_info({table})")}
+            if column not in existing:
+                connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+        raw.commit()
+    finally:
+        raw.close()
+
+
+def create_session_factory(url: str | None = None) -> sessionmaker:
+    engine = create_sqlite_engine(url)
+    ensure_schema(engine)
+    return sessionmaker(bind=engine, autoflush=False, autocommit=False)
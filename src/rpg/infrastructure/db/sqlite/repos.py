@@ -0,0 +1,420 @@
+import json
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import sessionmaker
+
+from rpg.domain.models.character import Character
+from rpg.domain.models.character_class import CharacterClass
+from rpg.domain.models.entity import Entity
+from rpg.domain.models.location import Location
+from rpg.domain.models.spell import Spell
+from rpg.domain.models.world import World
+from rpg.domain.repositories import (
+    CharacterRepository,
+    ClassRepository,
+    EntityRepository,
+    LocationRepository,
+    SpellRepository,
+    WorldRepository,
+)
+from rpg.infrastructure.db import portable
+from rpg.infrastructure.db.entity_mapper import rows_to_entities
+from rpg.infrastructure.db.mysql.open5e_monster_importer import UpsertResult
+from rpg.infrastructure.db.spell_classes import ANY_CLASS_KEY, class_key
+
+
+# Reads come from ``portable``; the upserts below use SQLite's ON CONFLICT.
+# Statements are built once at import; sqlite3 then reuses its prepared form
+# from the per-connection statement cache.
+_UPSERT_CHARACTER = text(
+    """
+    INSERT INTO "character" (character_id, name, alive, level, xp, money, character_type_id, hp_current, hp_max)
+    VALUES (:cid, :name, :alive, :level, :xp, :money, :ctype, :hp_current, :hp_max)
+    ON CONFLICT (character_id) DO UPDATE SET
+        name = excluded.name,
+        alive = excluded.alive,
+        level = excluded.level,
+        xp = excluded.xp,
+        money = excluded.money,
+        character_type_id = excluded.character_type_id,
+        hp_current = excluded.hp_current,
+        hp_max = excluded.hp_max
+    """
+)
+_UPSERT_CHARACTER_LOCATION = text(
+    """
+    INSERT INTO character_location (character_id, location_id)
+    VALUES (:cid, :loc)
+    ON CONFLICT (character_id) DO UPDATE SET location_id = excluded.location_id
+    """
+)
+_UPSERT_CHARACTER_CLASS = text(
+    """
+    INSERT INTO character_class (character_id, class_id)
+    VALUES (:cid, :class_id)
+    ON CONFLICT (character_id) DO UPDATE SET class_id = excluded.class_id
+    """
+)
+_UPSERT_CHARACTER_ATTRIBUTE = text(
+    """
+    INSERT INTO character_attribute (character_id, attribute_id, value)
+    SELECT :cid, attribute_id, :val FROM attribute WHERE name = :name
+    ON CONFLICT (character_id, attribute_id) DO UPDATE SET value = excluded.value
+    """
+)
+_CLASS_BY_SLUG = text(
+    portable.CLASS_COLUMNS
+    + " WHERE open5e_slug = :slug COLLATE NOCASE"
+    + " UNION ALL "
+    + portable.CLASS_COLUMNS
+    + " WHERE name = :slug COLLATE NOCASE LIMIT 1"
+)
+
+_FIRST_LOCATION_ID = text("SELECT location_id FROM location ORDER BY location_id LIMIT 1")
+_ENTITY_TYPE_ID = text("SELECT entity_type_id FROM entity_type WHERE name = :name")
+_INSERT_ENTITY_TYPE = text("INSERT INTO entity_type (name) VALUES (:name)")
+_ENTITY_HASHES_BY_NAME = text(
+    """
+    SELECT entity_id, lower(name) AS name_key, source_hash
+    FROM entity
+    WHERE entity_type_id = :entity_type_id
+      AND name COLLATE NOCASE IN :names
+    """
+).bindparams(bindparam("names", expanding=True))
+_UPDATE_ENTITY = text(
+    """
+    UPDATE entity
+    SET level = :level,
+        armour_class = :armour_class,
+        attack_bonus = :attack_bonus,
+        damage_dice = :damage_dice,
+        hp_max = :hp_max,
+        kind = :kind,
+        source_hash = :source_hash
+    WHERE entity_id = :entity_id
+    """
+)
+_INSERT_ENTITY = text(
+    """
+    INSERT INTO entity (
+        entity_type_id, name, level, armour_class, attack_bonus, damage_dice, hp_max, kind, source_hash
+    )
+    VALUES (
+        :entity_type_id, :name, :level, :armour_class, :attack_bonus, :damage_dice, :hp_max, :kind, :source_hash
+    )
+    """
+)
+_ENTITY_LOCATION = text("SELECT location_id FROM entity_location WHERE entity_id = :entity_id")
+_UPSERT_ENTITY_LOCATION = text(
+    """
+    INSERT INTO entity_location (entity_id, location_id)
+    VALUES (:entity_id, :location_id)
+    ON CONFLICT (entity_id) DO UPDATE SET location_id = excluded.location_id
+    """
+)
+
+
+class _SqliteRepository:
+    def __init__(self, session_factory: sessionmaker) -> None:
+        self.session_factory = session_factory
+
+
+class SqliteClassRepository(_SqliteRepository, ClassRepository):
+    def list_playable(self) -> List[CharacterClass]:
+        with self.session_factory() as session:
+            rows = session.execute(portable.LIST_CLASSES).all()
+        return [portable.row_to_class(row) for row in rows]
+
+    def get_by_slug(self, slug: str) -> Optional[CharacterClass]:
+        with self.session_factory() as session:
+            row = session.execute(_CLASS_BY_SLUG, {"slug": slug.strip()}).first()
+        return portable.row_to_class(row) if row else None
+
+
+class SqliteCharacterRepository(_SqliteRepository, CharacterRepository):
+    def get(self, character_id: int) -> Optional[Character]:
+        with self.session_factory() as session:
+            row = session.execute(portable.GET_CHARACTER, {"cid": character_id}).first()
+            if not row:
+                return None
+            attributes = self._load_attributes(session, [row.character_id])
+        return portable.row_to_character(row, attributes.get(row.character_id, {}))
+
+    def list_all(self) -> List[Character]:
+        with self.session_factory() as session:
+            rows = session.execute(portable.LIST_CHARACTERS).all()
+        return [portable.row_to_character(row, {}) for row in rows]
+
+    def list_page(self, after_id: int = 0, limit: int = 50) -> List[Character]:
+        with self.session_factory() as session:
+            rows = session.execute(portable.LIST_CHARACTERS_PAGE, {"after_id": after_id, "limit": limit}).all()
+        return [portable.row_to_character(row, {}) for row in rows]
+
+    def find_by_location(self, location_id: int) -> List[Character]:
+        with self.session_factory() as session:
+            rows = session.execute(portable.FIND_CHARACTERS_AT, {"loc": location_id}).all()
+            attributes = self._load_attributes(session, [row.character_id for row in rows])
+        return [portable.row_to_character(row, attributes.get(row.character_id, {})) for row in rows]
+
+    def save(self, character: Character) -> None:
+        dirty = character.dirty_fields()
+        if not dirty:
+            return
+        with self.session_factory() as session:
+            if character.is_tracked:
+                columns = tuple(column for column in portable.CHARACTER_COLUMNS if column in dirty)
+                if columns:
+                    params = {column: getattr(character, column) for column in columns}
+                    if "alive" in params:
+                        params["alive"] = int(params["alive"])
+                    session.execute(portable.character_update(columns), params | {"cid": character.id})
+                write_location = "location_id" in dirty
+            else:
+                session.execute(
+                    _UPSERT_CHARACTER,
+                    {
+                        "cid": character.id,
+                        "name": character.name,
+                        "alive": int(character.alive),
+                        "level": character.level,
+                        "xp": character.xp,
+                        "money": character.money,
+                        "ctype": character.character_type_id,
+                        "hp_current": character.hp_current,
+                        "hp_max": character.hp_max,
+                    },
+                )
+                write_location = True
+            if write_location:
+                session.execute(_UPSERT_CHARACTER_LOCATION, {"cid": character.id, "loc": character.location_id})
+            if "attributes" in dirty and character.attributes:
+                session.execute(
+                    _UPSERT_CHARACTER_ATTRIBUTE,
+                    [{"cid": character.id, "name": name, "val": value} for name, value in character.attributes.items()],
+                )
+            session.commit()
+        character.mark_clean()
+
+    def save_many(self, characters: Sequence[Character]) -> None:
+        changed = [character for character in characters if character.dirty_fields()]
+        if not changed:
+            return
+        if any(character.id is None for character in changed):
+            raise ValueError("save_many only updates stored characters; use create for new ones")
+
+        character_rows = [
+            {
+                "cid": character.id,
+                "name": character.name,
+                "alive": int(character.alive),
+                "level": character.level,
+                "xp": character.xp,
+                "money": character.money,
+                "ctype": character.character_type_id,
+                "hp_current": character.hp_current,
+                "hp_max": character.hp_max,
+            }
+            for character in changed
+        ]
+        location_rows = [
+            {"cid": character.id, "loc": character.location_id}
+            for character in changed
+            if character.location_id is not None
+        ]
+        attribute_rows = [
+            {"cid": character.id, "name": name, "val": value}
+            for character in changed
+            if "attributes" in character.dirty_fields()
+            for name, value in character.attributes.items()
+        ]
+        # One transaction; each statement runs once per row via executemany,
+        # which is as close to a multi-row insert as SQLite needs in-process.
+        with self.session_factory() as session:
+            session.execute(_UPSERT_CHARACTER, character_rows)
+            if location_rows:
+                session.execute(_UPSERT_CHARACTER_LOCATION, location_rows)
+            if attribute_rows:
+                session.execute(_UPSERT_CHARACTER_ATTRIBUTE, attribute_rows)
+            session.commit()
+        for character in changed:
+            character.mark_clean()
+
+    def create(self, character: Character, location_id: int) -> Character:
+        with self.session_factory() as session:
+            ctype_id = session.execute(portable.PLAYER_TYPE_ID).scalar()
+            if ctype_id is None:
+                ctype_id = session.execute(portable.INSERT_PLAYER_TYPE).lastrowid
+            character_id = session.execute(
+                portable.INSERT_CHARACTER,
+                {
+                    "ctype": ctype_id,
+                    "name": character.name,
+                    "level": character.level,
+                    "xp": character.xp,
+                    "money": character.money,
+                    "hp_current": character.hp_current,
+                    "hp_max": character.hp_max,
+                },
+            ).lastrowid
+
+            class_id = self._resolve_class_id(session, character.class_name or "fighter")
+            session.execute(_UPSERT_CHARACTER_CLASS, {"cid": character_id, "class_id": class_id})
+            attributes = [
+                {"cid": character_id, "name": name, "val": value} for name, value in (character.attributes or {}).items()
+            ]
+            if attributes:
+                session.execute(_UPSERT_CHARACTER_ATTRIBUTE, attributes)
+            session.execute(_UPSERT_CHARACTER_LOCATION, {"cid": character_id, "loc": location_id})
+            session.commit()
+
+        character.id = character_id
+        character.location_id = location_id
+        character.character_type_id = ctype_id
+        character.mark_clean()
+        return character
+
+    @staticmethod
+    def _load_attributes(session, character_ids: Sequence[int]) -> Dict[int, Dict[str, int]]:
+        if not character_ids:
+            return {}
+        attributes: Dict[int, Dict[str, int]] = {}
+        for row in session.execute(portable.LOAD_ATTRIBUTES, {"cids": list(character_ids)}):
+            attributes.setdefault(row.character_id, {})[row.attr_name] = row.value
+        return attributes
+
+    @staticmethod
+    def _resolve_class_id(session, class_name: str) -> int:
+        existing = session.execute(_CLASS_BY_SLUG, {"slug": class_name.strip()}).first()
+        if existing:
+            return existing.class_id
+        return session.execute(portable.INSERT_LOCAL_CLASS, {"name": class_name, "slug": class_name.lower()}).lastrowid
+
+
+class SqliteEntityRepository(_SqliteRepository, EntityRepository):
+    def get(self, entity_id: int) -> Optional[Entity]:
+        results = self.get_many([entity_id])
+        return results[0] if results else None
+
+    def get_many(self, entity_ids: List[int]) -> List[Entity]:
+        if not entity_ids:
+            return []
+        with self.session_factory() as session:
+            rows = session.execute(portable.ENTITIES_BY_ID, {"ids": list(entity_ids)}).all()
+        return rows_to_entities(rows)
+
+    def list_for_level(self, target_level: int, tolerance: int = 2) -> List[Entity]:
+        return self.list_by_level_band(target_level - tolerance, target_level + tolerance)
+
+    def list_by_level_band(self, level_min: int, level_max: int) -> List[Entity]:
+        with self.session_factory() as session:
+            rows = session.execute(portable.ENTITIES_BY_LEVEL, {"low": level_min, "high": level_max}).all()
+        return rows_to_entities(rows)
+
+    def list_by_location(self, location_id: int) -> List[Entity]:
+        with self.session_factory() as session:
+            rows = session.execute(portable.ENTITIES_AT_LOCATION, {"loc": location_id}).all()
+        return rows_to_entities(rows)
+
+    def get_default_location_id(self) -> Optional[int]:
+        with self.session_factory() as session:
+            return session.execute(_FIRST_LOCATION_ID).scalar()
+
+    def upsert_entities(self, entities: Sequence[Entity], location_id: Optional[int] = None) -> UpsertResult:
+        if not entities:
+            return UpsertResult()
+
+        summary = UpsertResult()
+        with self.session_factory.begin() as session:
+            monster_type_id = session.execute(_ENTITY_TYPE_ID, {"name": "monster"}).scalar()
+            if monster_type_id is None:
+                monster_type_id = session.execute(_INSERT_ENTITY_TYPE, {"name": "monster"}).lastrowid
+
+            # Like the MySQL repository, only monsters are matched, so an import never
+            # overwrites another kind of entity that shares a monster's name.
+            stored = {
+                row.name_key: (row.entity_id, row.source_hash)
+                for row in session.execute(
+                    _ENTITY_HASHES_BY_NAME,
+                    {"entity_type_id": monster_type_id, "names": sorted({entity.name.lower() for entity in entities})},
+                )
+            }
+
+            for entity in entities:
+                payload = portable.entity_import_payload(entity, monster_type_id)
+                existing_id, existing_hash = stored.get(entity.name.lower(), (None, None))
+                if existing_id and existing_hash == payload["source_hash"]:
+                    entity_id = existing_id
+                    summary.skipped += 1
+                elif existing_id:
+                    session.execute(_UPDATE_ENTITY, payload | {"entity_id": existing_id})
+                    entity_id = existing_id
+                    summary.updated += 1
+                else:
+                    entity_id = session.execute(_INSERT_ENTITY, payload).lastrowid
+                    summary.created += 1
+                stored[entity.name.lower()] = (entity_id, payload["source_hash"])
+
+                if location_id is not None:
+                    current = session.execute(_ENTITY_LOCATION, {"entity_id": entity_id}).scalar()
+                    if current != location_id:
+                        session.execute(_UPSERT_ENTITY_LOCATION, {"entity_id": entity_id, "location_id": location_id})
+                        summary.attached += 1
+
+        return summary
+
+
+class SqliteWorldRepository(_SqliteRepository, WorldRepository):
+    def load_default(self) -> Optional[World]:
+        with self.session_factory() as session:
+            row = session.execute(portable.LOAD_WORLD).first()
+            if not row:
+                session.execute(portable.INSERT_WORLD)
+                session.commit()
+                row = session.execute(portable.LOAD_WORLD).first()
+        return portable.row_to_world(row)
+
+    def save(self, world: World) -> None:
+        dirty = world.dirty_fields()
+        if not dirty:
+            return
+        columns = tuple(column for column in World._tracked_fields if column in dirty)
+        params = {column: getattr(world, column) for column in columns}
+        if "flags" in params:
+            params["flags"] = json.dumps(world.flags)
+        with self.session_factory() as session:
+            session.execute(portable.world_update(columns), params | {"wid": world.id})
+            session.commit()
+        world.mark_clean()
+
+
+class SqliteLocationRepository(_SqliteRepository, LocationRepository):
+    def get(self, location_id: int) -> Optional[Location]:
+        with self.session_factory() as session:
+            row = session.execute(portable.GET_LOCATION, {"loc": location_id}).first()
+        return portable.row_to_location(row) if row else None
+
+    def list_all(self) -> List[Location]:
+        with self.session_factory() as session:
+            rows = session.execute(portable.LIST_LOCATIONS).all()
+        return [portable.row_to_location(row) for row in rows]
+
+    def get_starting_location(self) -> Optional[Location]:
+        with self.session_factory() as session:
+            row = session.execute(portable.STARTING_LOCATION).first()
+        return portable.row_to_location(row) if row else None
+
+
+class SqliteSpellRepository(_SqliteRepository, SpellRepository):
+    def get_by_slug(self, slug: str) -> Optional[Spell]:
+        with self.session_factory() as session:
+            row = session.execute(portable.SPELL_BY_SLUG, {"slug": slug}).first()
+        return portable.row_to_spell(row) if row else None
+
+    def list_by_class(self, class_slug: str, max_level: int) -> Sequence[Spell]:
+        with self.session_factory() as session:
+            rows = session.execute(
+                portable.SPELLS_FOR_CLASS,
+                {"class_key": class_key(class_slug), "any_class": ANY_CLASS_KEY, "max_level": max_level},
+            ).all()
+        return [portable.row_to_spell(row) for row in rows]
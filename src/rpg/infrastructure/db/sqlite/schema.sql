@@ -0,0 +1,145 @@
+-- Embedded SQLite schema mirroring the MySQL tables the repositories use.
+-- Every statement is idempotent so ensure_schema() can run on each start.
+
+CREATE TABLE IF NOT EXISTS character_type (
+    character_type_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS "character" (
+    character_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    character_type_id INTEGER NOT NULL REFERENCES character_type (character_type_id),
+    name TEXT NOT NULL,
+    alive INTEGER NOT NULL DEFAULT 1,
+    level INTEGER NOT NULL DEFAULT 1,
+    xp INTEGER NOT NULL DEFAULT 0,
+    money INTEGER NOT NULL DEFAULT 0,
+    hp_current INTEGER NOT NULL DEFAULT 10,
+    hp_max INTEGER NOT NULL DEFAULT 10
+);
+
+CREATE TABLE IF NOT EXISTS attribute (
+    attribute_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS character_attribute (
+    character_id INTEGER NOT NULL REFERENCES "character" (character_id) ON DELETE CASCADE,
+    attribute_id INTEGER NOT NULL REFERENCES attribute (attribute_id) ON DELETE CASCADE,
+    value INTEGER NOT NULL,
+    PRIMARY KEY (character_id, attribute_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS place (
+    place_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS location (
+    location_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    x INTEGER NOT NULL,
+    y INTEGER NOT NULL,
+    place_id INTEGER NOT NULL REFERENCES place (place_id),
+    UNIQUE (x, y)
+);
+
+CREATE TABLE IF NOT EXISTS character_location (
+    character_id INTEGER PRIMARY KEY REFERENCES "character" (character_id) ON DELETE CASCADE,
+    location_id INTEGER NOT NULL REFERENCES location (location_id)
+);
+CREATE INDEX IF NOT EXISTS idx_character_location_location ON character_location (location_id, character_id);
+
+CREATE TABLE IF NOT EXISTS class (
+    class_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    hit_die TEXT,
+    primary_ability TEXT,
+    source TEXT,
+    open5e_slug TEXT UNIQUE,
+    slug_key TEXT GENERATED ALWAYS AS (lower(open5e_slug)) STORED,
+    name_key TEXT GENERATED ALWAYS AS (lower(name)) STORED
+);
+CREATE UNIQUE INDEX IF NOT EXISTS uk_class_slug_key ON class (slug_key);
+CREATE UNIQUE INDEX IF NOT EXISTS uk_class_name_key ON class (name_key);
+CREATE INDEX IF NOT EXISTS idx_class_slug_nocase ON class (open5e_slug COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_class_name_nocase ON class (name COLLATE NOCASE);
+
+CREATE TABLE IF NOT EXISTS character_class (
+    character_id INTEGER PRIMARY KEY REFERENCES "character" (character_id) ON DELETE CASCADE,
+    class_id INTEGER NOT NULL REFERENCES class (class_id)
+);
+
+CREATE TABLE IF NOT EXISTS entity_type (
+    entity_type_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE COLLATE NOCASE
+);
+
+CREATE TABLE IF NOT EXISTS entity (
+    entity_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    entity_type_id INTEGER NOT NULL REFERENCES entity_type (entity_type_id),
+    name TEXT NOT NULL,
+    level INTEGER,
+    armour_class INTEGER,
+    attack_bonus INTEGER,
+    damage_dice TEXT,
+    hp_max INTEGER,
+    kind TEXT,
+    source_hash TEXT
+);
+DROP INDEX IF EXISTS idx_entity_level;
+CREATE INDEX IF NOT EXISTS idx_entity_level_cover
+    ON entity (level, name, armour_class, attack_bonus, damage_dice, hp_max, kind);
+CREATE INDEX IF NOT EXISTS idx_entity_name_nocase ON entity (name COLLATE NOCASE);
+
+CREATE TABLE IF NOT EXISTS entity_location (
+    entity_id INTEGER PRIMARY KEY REFERENCES entity (entity_id) ON DELETE CASCADE,
+    location_id INTEGER NOT NULL REFERENCES location (location_id)
+);
+CREATE INDEX IF NOT EXISTS idx_entity_location_location ON entity_location (location_id, entity_id);
+
+CREATE TABLE IF NOT EXISTS world (
+    world_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    current_turn INTEGER NOT NULL DEFAULT 0,
+    threat_level INTEGER NOT NULL DEFAULT 0,
+    flags TEXT
+);
+
+CREATE TABLE IF NOT EXISTS spell (
+    slug TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    level_int INTEGER NOT NULL,
+    school TEXT,
+    casting_time TEXT,
+    range_text TEXT,
+    duration TEXT,
+    components TEXT,
+    concentration INTEGER NOT NULL DEFAULT 0,
+    ritual INTEGER NOT NULL DEFAULT 0,
+    desc_text TEXT,
+    higher_level TEXT,
+    classes_json TEXT
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_spell_level ON spell (level_int, name);
+
+-- class_key is the lower-cased class name; '*' marks spells open to every class.
+CREATE TABLE IF NOT EXISTS spell_class (
+    class_key TEXT NOT NULL,
+    level_int INTEGER NOT NULL,
+    spell_slug TEXT NOT NULL REFERENCES spell (slug) ON DELETE CASCADE,
+    PRIMARY KEY (class_key, level_int, spell_slug)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_spell_class_slug ON spell_class (spell_slug);
+
+-- Minimal seed so a fresh database is playable.
+INSERT OR IGNORE INTO character_type (name) VALUES ('player'), ('non-playable');
+INSERT OR IGNORE INTO attribute (name) VALUES
+    ('strength'), ('constitution'), ('dexterity'), ('intelligence'), ('charisma'), ('wisdom'),
+    ('might'), ('agility'), ('wit'), ('spirit');
+INSERT INTO world (name) SELECT 'Default World' WHERE NOT EXISTS (SELECT 1 FROM world);
+INSERT INTO place (name) SELECT 'Starting Town' WHERE NOT EXISTS (SELECT 1 FROM place);
+INSERT OR IGNORE INTO location (x, y, place_id) SELECT 0, 0, MIN(place_id) FROM place;
+INSERT OR IGNORE INTO class (name, open5e_slug, hit_die, primary_ability, source) VALUES
+    ('Fighter', 'fighter', 'd10', 'strength', 'seed'),
+    ('Rogue', 'rogue', 'd8', 'dexterity', 'seed'),
+    ('Wizard', 'wizard', 'd6', 'intelligence', 'seed');
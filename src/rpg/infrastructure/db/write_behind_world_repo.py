@@ -0,0 +1,166 @@
+import atexit
+import threading
+import time
+from typing import Callable, Optional
+
+from rpg.domain.models.world import World
+from rpg.domain.repositories import WorldRepository
+
+
+def _run_now(callback: Callable[[], None]) -> None:
+    callback()
+
+
+class WriteBehindWorldRepository(WorldRepository):
+    """Keep the world in memory and persist coalesced ticks to another repository.
+
+    ``save`` only records that the world changed; the wrapped repository is
+    written when ``flush_interval`` seconds have passed since the last flush,
+    when more than ``max_pending_turns`` turns are unsaved, or on ``flush`` /
+    ``close`` (also registered with ``atexit``). Many ticks therefore collapse
+    into one UPDATE of the ``world`` row instead of one per player action.
+    With ``idle_flush`` a daemon timer also flushes ``flush_interval`` real
+    seconds after the first unsaved tick, so a player who stops acting does
+    not leave turns pending until exit.
+
+    ``after_commit`` defers bookkeeping until the wrapped write is durable: a
+    flush made inside a unit of work only counts once that unit commits, and a
+    rollback leaves the world pending. Pass the backend's after-commit hook
+    (``run_after_commit`` for MySQL); the default treats writes as committed.
+    The idle timer skips its flush while such a commit is outstanding: the
+    player's open transaction holds the world row, so a second write would
+    only wait on it. The wrapped write itself runs outside the state lock, so
+    a slow write never stalls ``save`` or ``load_default`` in other threads.
+
+    The cached world is authoritative for this process, so a single process
+    should own world progression when this wrapper is in use.
+    """
+
+    def __init__(
+        self,
+        inner: WorldRepository,
+        flush_interval: float = 5.0,
+        max_pending_turns: int = 50,
+        clock: Callable[[], float] = time.monotonic,
+        on_flush_error: Optional[Callable[[Exception], None]] = None,
+        register_atexit: bool = True,
+        idle_flush: bool = True,
+        after_commit: Callable[[Callable[[], None]], None] = _run_now,
+    ) -> None:
+        self.inner = inner
+        self.flush_interval = flush_interval
+        self.max_pending_turns = max_pending_turns
+        self.on_flush_error = on_flush_error
+        self.idle_flush = idle_flush
+        self.flush_count = 0
+        self._clock = clock
+        self._after_commit = after_commit
+        self._lock = threading.RLock()
+        # Serialises writes to ``inner``; never taken while holding ``_lock``.
+        self._write_lock = threading.Lock()
+        self._world: Optional[World] = None
+        self._dirty = False
+        self._version = 0
+        self._awaiting_commit: Optional[int] = None
+        self._flushed_turn = 0
+        self._last_flush = clock()
+        self._timer: Optional[threading.Timer] = None
+        self._atexit_registered = register_atexit
+        if register_atexit:
+            atexit.register(self.flush)
+
+    @property
+    def pending(self) -> bool:
+        return self._dirty
+
+    def load_default(self) -> Optional[World]:
+        with self._lock:
+            if self._world is None:
+                self._world = self.inner.load_default()
+                if self._world is not None:
+                    self._flushed_turn = self._world.current_turn
+            return self._world
+
+    def save(self, world: World) -> None:
+        with self._lock:
+            self._world = world
+            self._dirty = True
+            self._version += 1
+            due = self._should_flush(world)
+        if due:
+            self.flush()
+        with self._lock:
+            if self._dirty:
+                self._arm_timer()
+
+    def flush(self) -> bool:
+        """Write the pending world through to the wrapped repository.
+
+        Returns True when a write happened. On failure the state stays pending
+        so the next flush retries it; the error is passed to ``on_flush_error``
+        when one is configured and re-raised otherwise.
+        """
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty or self._world is None:
+                    return False
+                world, version = self._world, self._version
+            try:
+                self.inner.save(world)
+            except Exception as exc:
+                if self.on_flush_error is None:
+                    raise
+                self.on_flush_error(exc)
+                return False
+            with self._lock:
+                self._last_flush = self._clock()
+                self.flush_count += 1
+                self._awaiting_commit = version
+            self._after_commit(self._committed_callback(version, world.current_turn))
+            return True
+
+    def close(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self.flush()
+        if self._atexit_registered:
+            atexit.unregister(self.flush)
+            self._atexit_registered = False
+
+    def _committed_callback(self, version: int, turn: int) -> Callable[[], None]:
+        def committed() -> None:
+            with self._lock:
+                self._flushed_turn = turn
+                if self._awaiting_commit == version:
+                    self._awaiting_commit = None
+                # A save that landed after this flush is still pending.
+                if self._version == version:
+                    self._dirty = False
+
+        return committed
+
+    def _arm_timer(self) -> None:
+        if not self.idle_flush or self._timer is not None:
+            return
+        self._timer = threading.Timer(self.flush_interval, self._flush_when_idle)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_when_idle(self) -> None:
+        with self._lock:
+            self._timer = None
+            committing = self._awaiting_commit is not None
+        try:
+            if not committing:
+                self.flush()
+        finally:
+            with self._lock:
+                if self._dirty:
+                    self._arm_timer()
+
+    def _should_flush(self, world: World) -> bool:
+        if self._clock() - self._last_flush >= self.flush_interval:
+            return True
+        return world.current_turn - self._flushed_turn >= self.max_pending_turns
@@ -0,0 +1,214 @@
+"""Threaded stage pipeline for content imports.
+
+Each stage owns a bounded input queue and a pool of worker threads. A worker
+takes one item, calls the stage function, and puts whatever it returns onto
+the next stage's queue, so fetching, mapping and writing overlap while the
+bounded queues stop a fast stage from racing ahead of a slow one. A stage may
+also have a ``finish`` callable whose outputs are emitted once its input is
+exhausted (``Batcher`` uses it to flush a final partial batch).
+
+If any stage raises, the pipeline stops feeding work, unblocks every worker
+and re-raises the first error from ``run``.
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, List, Optional
+
+_DONE = object()
+_POLL_SECONDS = 0.05
+
+
+@dataclass
+class StageMetrics:
+    name: str
+    workers: int
+    items_in: int = 0
+    items_out: int = 0
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0
+    queue_capacity: int = 0
+
+    def throughput(self, elapsed: float) -> float:
+        """Input items handled per wall-clock second of the whole run."""
+        return self.items_in / elapsed if elapsed > 0 else 0.0
+
+
+@dataclass
+class PipelineReport:
+    elapsed: float = 0.0
+    stages: List[StageMetrics] = field(default_factory=list)
+
+    def lines(self) -> List[str]:
+        return [
+            f"{stage.name:<8} workers={stage.workers} in={stage.items_in} out={stage.items_out} "
+            f"{stage.throughput(self.elapsed):8.1f}/s busy={stage.busy_seconds:6.2f}s "
+            f"queue max {stage.max_queue_depth}/{stage.queue_capacity}"
+            for stage in self.stages
+        ]
+
+
+class Batcher:
+    """Stage function that groups incoming lists into lists of ``size`` items."""
+
+    def __init__(self, size: int) -> None:
+        if size < 1:
+            raise ValueError("batch size must be at least 1")
+        self.size = size
+        self._pending: list = []
+        self._lock = threading.Lock()
+
+    def __call__(self, items: Iterable) -> List[list]:
+        with self._lock:
+            self._pending.extend(items)
+            batches = []
+            while len(self._pending) >= self.size:
+                batches.append(self._pending[: self.size])
+                del self._pending[: self.size]
+            return batches
+
+    def finish(self) -> List[list]:
+        with self._lock:
+            rest, self._pending = self._pending, []
+        return [rest] if rest else []
+
+
+@dataclass
+class _Stage:
+    fn: Callable[[object], Optional[Iterable]]
+    finish: Optional[Callable[[], Optional[Iterable]]]
+    metrics: StageMetrics
+    inbox: "queue.Queue"
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    remaining: int = 0
+
+
+class ImportPipeline:
+    def __init__(self, queue_size: int = 8) -> None:
+        self.queue_size = queue_size
+        self._stages: List[_Stage] = []
+        self._failed = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._error_lock = threading.Lock()
+
+    def add_stage(
+        self,
+        name: str,
+        fn: Callable[[object], Optional[Iterable]],
+        workers: int = 1,
+        finish: Optional[Callable[[], Optional[Iterable]]] = None,
+    ) -> "ImportPipeline":
+        """Append a stage; ``fn`` returns an iterable of items for the next stage."""
+        if workers < 1:
+            raise ValueError(f"stage {name!r} needs at least one worker")
+        self._stages.append(
+            _Stage(
+                fn=fn,
+                finish=finish,
+                metrics=StageMetrics(name=name, workers=workers, queue_capacity=self.queue_size),
+                inbox=queue.Queue(maxsize=self.queue_size),
+                remaining=workers,
+            )
+        )
+        return self
+
+    def run(self, source: Iterable) -> PipelineReport:
+        if not self._stages:
+            raise ValueError("pipeline has no stages")
+        started = time.perf_counter()
+        threads = [
+            threading.Thread(target=self._work, args=(index,), name=f"import-{stage.metrics.name}-{n}", daemon=True)
+            for index, stage in enumerate(self._stages)
+            for n in range(stage.metrics.workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        first = self._stages[0]
+        try:
+            for item in source:
+                if not self._put(first, item):
+                    break
+        except BaseException as exc:
+            self._fail(exc)
+        for _ in range(first.metrics.workers):
+            self._put(first, _DONE, force=True)
+        for thread in threads:
+            thread.join()
+
+        if self._error is not None:
+            raise self._error
+        return PipelineReport(elapsed=time.perf_counter() - started, stages=[s.metrics for s in self._stages])
+
+    def _work(self, index: int) -> None:
+        stage = self._stages[index]
+        downstream = self._stages[index + 1] if index + 1 < len(self._stages) else None
+        while True:
+            item = stage.inbox.get()
+            if item is _DONE:
+                break
+            if self._failed.is_set():
+                continue
+            start = time.perf_counter()
+            try:
+                outputs = list(stage.fn(item) or ())
+            except BaseException as exc:
+                self._fail(exc)
+                continue
+            with stage.lock:
+                stage.metrics.items_in += 1
+                stage.metrics.items_out += len(outputs)
+                stage.metrics.busy_seconds += time.perf_counter() - start
+            self._emit(downstream, outputs)
+
+        with stage.lock:
+            stage.remaining -= 1
+            last_worker = stage.remaining == 0
+        if not last_worker:
+            return
+        if stage.finish is not None and not self._failed.is_set():
+            try:
+                outputs = list(stage.finish() or ())
+            except BaseException as exc:
+                self._fail(exc)
+                outputs = []
+            with stage.lock:
+                stage.metrics.items_out += len(outputs)
+            self._emit(downstream, outputs)
+        if downstream is not None:
+            for _ in range(downstream.metrics.workers):
+                self._put(downstream, _DONE, force=True)
+
+    def _emit(self, downstream: Optional[_Stage], outputs: list) -> None:
+        if downstream is None:
+            return
+        for output in outputs:
+            if not self._put(downstream, output):
+                return
+
+    def _put(self, stage: _Stage, item, force: bool = False) -> bool:
+        """Enqueue ``item``; gives up (returns False) once the pipeline has failed.
+
+        End-of-stream markers are ``force``d through so every worker exits.
+        """
+        while True:
+            if self._failed.is_set() and not force:
+                return False
+            try:
+                stage.inbox.put(item, timeout=_POLL_SECONDS)
+            except queue.Full:
+                # Workers keep consuming (and discarding) after a failure,
+                # so a forced marker always gets through eventually.
+                continue
+            depth = stage.inbox.qsize()
+            with stage.lock:
+                stage.metrics.max_queue_depth = max(stage.metrics.max_queue_depth, depth)
+            return True
+
+    def _fail(self, exc: BaseException) -> None:
+        with self._error_lock:
+            if self._error is None:
+                self._error = exc
+        self._failed.set()
@@ -1,3 +1,4 @@
+from bisect import bisect_right, insort
 from typing import Dict, List, Optional
 
 from rpg.domain.models.character import Character
@@ -7,6 +8,8 @@ from rpg.domain.repositories import CharacterRepository
 class InMemoryCharacterRepository(CharacterRepository):
     def __init__(self):
         self._characters: Dict[int, Character] = {}
+        # Ids in ascending order, so a page is a bisect plus a slice.
+        self._ids: List[int] = []
 
     def get(self, character_id: int) -> Optional[Character]:
         return self._characters.get(character_id)
@@ -14,17 +17,24 @@ class InMemoryCharacterRepository(CharacterRepository):
     def list_all(self) -> List[Character]:
         return list(self._characters.values())
 
+    def list_page(self, after_id: int = 0, limit: int = 50) -> List[Character]:
+        start = bisect_right(self._ids, after_id)
+        return [self._characters[cid] for cid in self._ids[start : start + limit]]
+
     def save(self, character: Character) -> None:
         if character.id is None:
             return
+        if character.id not in self._characters:
+            insort(self._ids, character.id)
         self._characters[character.id] = character
 
     def find_by_location(self, location_id: int) -> List[Character]:
         return [c for c in self._characters.values() if c.location_id == location_id]
 
     def create(self, character: Character, location_id: int) -> Character:
-        next_id = max(self._characters.keys(), default=0) + 1
+        next_id = (self._ids[-1] if self._ids else 0) + 1
         character.id = next_id
         character.location_id = location_id
         self._characters[next_id] = character
+        self._ids.append(next_id)
         return character
@@ -0,0 +1,172 @@
+"""Persistent, compressed cache of Open5e API responses.
+
+Each response is stored as one gzip-compressed JSON file named after a hash of
+the request URL (query string included), together with the ``ETag`` and
+``Last-Modified`` validators the server sent. ``Open5eClient`` serves entries
+younger than ``max_age`` straight from disk and revalidates older ones with a
+conditional request, so an unchanged page costs a 304 instead of a download.
+In offline mode the network is never touched and any stored entry is served.
+The directory is trimmed back under ``max_bytes`` least-recently-used first;
+its size is scanned once and then tracked per write, so the directory is only
+listed again when a write pushes it over budget.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_AGE = 24 * 60 * 60.0
+
+
+class Open5eCacheMiss(LookupError):
+    """Raised in offline mode when a request has no cached response."""
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    body: dict
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: float = 0.0
+
+    def validators(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    evicted: int = 0
+
+
+class Open5eResponseCache:
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age: float = DEFAULT_MAX_AGE,
+        offline: bool = False,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.offline = offline
+        self.stats = CacheStats()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._total: Optional[int] = None
+
+    @classmethod
+    def from_env(cls) -> Optional["Open5eResponseCache"]:
+        """Build a cache from ``RPG_OPEN5E_CACHE_DIR`` (None when unset).
+
+        ``RPG_OPEN5E_CACHE_MAX_MB``, ``RPG_OPEN5E_CACHE_MAX_AGE`` (seconds) and
+        ``RPG_OPEN5E_OFFLINE=1`` tune it.
+        """
+        directory = os.getenv("RPG_OPEN5E_CACHE_DIR")
+        if not directory:
+            return None
+        return cls(
+            directory,
+            max_bytes=int(float(os.getenv("RPG_OPEN5E_CACHE_MAX_MB", DEFAULT_MAX_BYTES / 1024 / 1024)) * 1024 * 1024),
+            max_age=float(os.getenv("RPG_OPEN5E_CACHE_MAX_AGE", DEFAULT_MAX_AGE)),
+            offline=os.getenv("RPG_OPEN5E_OFFLINE", "").lower() in {"1", "true", "yes"},
+        )
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        path = self._path(url)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        if data.get("url") != url:
+            return None
+        return CachedResponse(
+            url=url,
+            body=data["body"],
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+            stored_at=data.get("stored_at", 0.0),
+        )
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        return time.time() - entry.stored_at < self.max_age
+
+    def put(self, url: str, body: dict, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        path = self._path(url)
+        record = {"url": url, "etag": etag, "last_modified": last_modified, "stored_at": time.time(), "body": body}
+        # A unique temp file per write, so concurrent puts of one URL never share one.
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as handle:
+                json.dump(record, handle, separators=(",", ":"))
+            size = os.path.getsize(tmp)
+            with self._lock:
+                replaced = _file_size(path)
+                os.replace(tmp, path)
+                if self._total is None:
+                    self._total = self.size()
+                else:
+                    self._total += size - replaced
+                if self._total > self.max_bytes:
+                    self._evict()
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def refresh(self, entry: CachedResponse) -> None:
+        """Restart an entry's freshness window after a 304."""
+        self.put(entry.url, entry.body, entry.etag, entry.last_modified)
+
+    def touch(self, url: str) -> None:
+        try:
+            os.utime(self._path(url))
+        except OSError:
+            pass
+
+    def size(self) -> int:
+        return sum(path.stat().st_size for path in self.directory.glob("*.json.gz"))
+
+    def _path(self, url: str) -> Path:
+        return self.directory / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json.gz"
+
+    def _evict(self) -> None:
+        # Rescan rather than trust the running total: other processes may share the directory.
+        entries = []
+        total = 0
+        for path in self.directory.glob("*.json.gz"):
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        if total > self.max_bytes:
+            for _, size, path in sorted(entries):
+                path.unlink(missing_ok=True)
+                self.stats.evicted += 1
+                total -= size
+                if total <= self.max_bytes:
+                    break
+        self._total = total
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
@@ -1,45 +1,118 @@
 import httpx
 
+from rpg.infrastructure.open5e_cache import Open5eCacheMiss, Open5eResponseCache
+from rpg.infrastructure.open5e_transport import new_async_http_client, shared_http_client
+
 
 class Open5eClient:
-    """Lightweight Open5e HTTP client (synchronous, small surface)."""
+    """Lightweight Open5e HTTP client (synchronous, small surface).
+
+    Responses go through ``cache`` when one is given, or when
+    ``RPG_OPEN5E_CACHE_DIR`` is set (see ``Open5eResponseCache.from_env``).
+    Without an ``http_client`` requests use the process-wide rate-limited,
+    retrying client from ``open5e_transport``, which ``close`` leaves open.
+    """
 
     BASE_URL = "https://api.open5e.com"
 
     def __init__(
-        self, base_url: str = BASE_URL, timeout: float = 10.0, http_client: httpx.Client | None = None
+        self,
+        base_url: str = BASE_URL,
+        timeout: float = 10.0,
+        http_client: httpx.Client | None = None,
+        cache: Open5eResponseCache | None = None,
     ) -> None:
-        self.client = http_client or httpx.Client(base_url=base_url, timeout=timeout)
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.client = http_client or shared_http_client()
+        self._owns_client = http_client is not None
+        self.cache = cache if cache is not None else Open5eResponseCache.from_env()
 
     def list_monsters(self, page: int = 1) -> dict:
-        resp = self.client.get("/monsters/", params={"page": page})
-        resp.raise_for_status()
-        return resp.json()
+        return self._get_json("/monsters/", params={"page": page})
 
     def get_monster(self, slug: str) -> dict:
-        resp = self.client.get(f"/monsters/{slug}/")
-        resp.raise_for_status()
-        return resp.json()
+        return self._get_json(f"/monsters/{slug}/")
 
     def list_spells(self, page: int = 1) -> dict:
-        resp = self.client.get("/spells/", params={"page": page})
-        resp.raise_for_status()
-        return resp.json()
+        return self._get_json("/spells/", params={"page": page})
 
     def list_classes(self, page: int = 1) -> dict:
-        resp = self.client.get("/classes/", params={"page": page})
-        resp.raise_for_status()
-        return resp.json()
+        return self._get_json("/classes/", params={"page": page})
 
     def list_races(self, page: int = 1) -> dict:
-        resp = self.client.get("/races/", params={"page": page})
-        resp.raise_for_status()
-        return resp.json()
+        return self._get_json("/races/", params={"page": page})
 
     def get_race(self, slug: str) -> dict:
-        resp = self.client.get(f"/races/{slug}/")
-        resp.raise_for_status()
-        return resp.json()
+        return self._get_json(f"/races/{slug}/")
 
     def close(self) -> None:
-        self.client.close()
+        if self._owns_client:
+            self.client.close()
+
+    def _get_json(self, path: str, params: dict | None = None) -> dict:
+        if self.cache is None:
+            resp = self.client.get(f"{self.base_url}{path}", params=params, timeout=self.timeout)
+            resp.raise_for_status()
+            return resp.json()
+
+        request = self.client.build_request("GET", f"{self.base_url}{path}", params=params, timeout=self.timeout)
+        url = str(request.url)
+        cached = self.cache.get(url)
+        if cached is not None and (self.cache.offline or self.cache.is_fresh(cached)):
+            self.cache.stats.hits += 1
+            self.cache.touch(url)
+            return cached.body
+        if self.cache.offline:
+            self.cache.stats.misses += 1
+            raise Open5eCacheMiss(f"{url} is not cached and offline mode is on")
+
+        if cached is not None:
+            request.headers.update(cached.validators())
+        resp = self.client.send(request)
+        if resp.status_code == 304 and cached is not None:
+            self.cache.stats.revalidated += 1
+            self.cache.refresh(cached)
+            return cached.body
+        resp.raise_for_status()
+        body = resp.json()
+        self.cache.stats.misses += 1
+        self.cache.put(url, body, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+        return body
+
+
+class AsyncOpen5eClient:
+    """Async counterpart of ``Open5eClient`` for fetching many pages concurrently."""
+
+    BASE_URL = Open5eClient.BASE_URL
+
+    def __init__(
+        self, base_url: str = BASE_URL, timeout: float = 10.0, http_client: httpx.AsyncClient | None = None
+    ) -> None:
+        self.client = http_client or new_async_http_client(base_url=base_url, timeout=timeout)
+
+    async def list_monsters(self, page: int = 1) -> dict:
+        return await self._get_json("/monsters/", params={"page": page})
+
+    async def get_monster(self, slug: str) -> dict:
+        return await self._get_json(f"/monsters/{slug}/")
+
+    async def list_spells(self, page: int = 1) -> dict:
+        return await self._get_json("/spells/", params={"page": page})
+
+    async def list_classes(self, page: int = 1) -> dict:
+        return await self._get_json("/classes/", params={"page": page})
+
+    async def list_races(self, page: int = 1) -> dict:
+        return await self._get_json("/races/", params={"page": page})
+
+    async def get_race(self, slug: str) -> dict:
+        return await self._get_json(f"/races/{slug}/")
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def _get_json(self, path: str, params: dict | None = None) -> dict:
+        resp = await self.client.get(path, params=params)
+        resp.raise_for_status()
+        return resp.json()
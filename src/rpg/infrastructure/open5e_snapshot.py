@@ -0,0 +1,208 @@
+"""Versioned offline snapshot of Open5e content.
+
+A snapshot is a gzip-compressed, line-delimited JSON file. The first line is
+a header naming the format and version, with an index of pages and records
+per kind. Each following line holds one API page::
+
+    {"format": "rpg-open5e-snapshot", "version": 1, "created_at": ..., "index": {"monsters": {...}}}
+    {"kind": "monsters", "page": 1, "results": [...]}
+    {"kind": "monsters", "page": 2, "results": [...]}
+    {"kind": "spells", "page": 1, "results": [...]}
+
+Readers decompress and parse one line at a time, so memory use stays at one
+page however large the snapshot is. ``SnapshotOpen5eClient`` answers the
+``Open5eClient`` listing calls from a snapshot, which lets the existing
+importers seed a database with no network access.
+
+Usage:
+    python -m rpg.infrastructure.open5e_snapshot export open5e.jsonl.gz
+    python -m rpg.infrastructure.open5e_snapshot info open5e.jsonl.gz
+"""
+
+import argparse
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Sequence
+
+from rpg.infrastructure.open5e_client import Open5eClient
+
+SNAPSHOT_FORMAT = "rpg-open5e-snapshot"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_KINDS = ("monsters", "spells", "classes", "races")
+
+
+class SnapshotFormatError(ValueError):
+    pass
+
+
+def export_snapshot(
+    client,
+    path: str | os.PathLike,
+    kinds: Sequence[str] = SNAPSHOT_KINDS,
+    max_pages: Optional[int] = None,
+) -> dict:
+    """Page through each kind with ``client`` and write a snapshot; return its header."""
+    path = Path(path)
+    index: Dict[str, Dict[str, int]] = {}
+    with tempfile.TemporaryFile("w+b") as body:
+        with gzip.open(body, "wt", encoding="utf-8") as out:
+            for kind in kinds:
+                fetch = getattr(client, f"list_{kind}")
+                pages = records = 0
+                page = 1
+                while max_pages is None or page <= max_pages:
+                    payload = fetch(page=page)
+                    results = payload.get("results", [])
+                    if not results:
+                        break
+                    out.write(json.dumps({"kind": kind, "page": page, "results": results}, separators=(",", ":")))
+                    out.write("\n")
+                    pages += 1
+                    records += len(results)
+                    if not payload.get("next"):
+                        break
+                    page += 1
+                index[kind] = {"pages": pages, "records": records}
+
+        header = {
+            "format": SNAPSHOT_FORMAT,
+            "version": SNAPSHOT_VERSION,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "index": index,
+        }
+        # gzip members concatenate into one stream, so the header is compressed
+        # on its own and the already-compressed body is appended after it.
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as target:
+            with gzip.open(target, "wt", encoding="utf-8") as out:
+                out.write(json.dumps(header, separators=(",", ":")) + "\n")
+            body.seek(0)
+            shutil.copyfileobj(body, target)
+        os.replace(tmp_path, path)
+    return header
+
+
+class SnapshotReader:
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = Path(path)
+        with gzip.open(self.path, "rt", encoding="utf-8") as handle:
+            self.header = self._parse_header(handle.readline())
+
+    @property
+    def index(self) -> Dict[str, Dict[str, int]]:
+        return self.header["index"]
+
+    def page_count(self, kind: str) -> int:
+        return self.index.get(kind, {}).get("pages", 0)
+
+    def iter_pages(self, kind: str) -> Iterator[dict]:
+        """Yield ``{"kind", "page", "results"}`` lines for ``kind`` in page order."""
+        if kind not in self.index:
+            return
+        with gzip.open(self.path, "rt", encoding="utf-8") as handle:
+            handle.readline()
+            for line in handle:
+                record = json.loads(line)
+                if record["kind"] == kind:
+                    yield record
+
+    def iter_records(self, kind: str) -> Iterator[dict]:
+        for page in self.iter_pages(kind):
+            yield from page["results"]
+
+    def _parse_header(self, line: str) -> dict:
+        try:
+            header = json.loads(line)
+        except ValueError as exc:
+            raise SnapshotFormatError(f"{self.path} is not an Open5e snapshot") from exc
+        if not isinstance(header, dict) or header.get("format") != SNAPSHOT_FORMAT:
+            raise SnapshotFormatError(f"{self.path} is not an Open5e snapshot")
+        if header.get("version", 0) > SNAPSHOT_VERSION:
+            raise SnapshotFormatError(
+                f"{self.path} is snapshot version {header['version']}; this build reads up to {SNAPSHOT_VERSION}"
+            )
+        return header
+
+
+class SnapshotOpen5eClient:
+    """Serve ``Open5eClient`` page listings from a snapshot file.
+
+    Pages requested in order are read straight off an open stream; asking for
+    an earlier page restarts the scan for that kind. Calls are serialised, so
+    one instance can back several fetch threads.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.reader = SnapshotReader(path)
+        self._cursors: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def list_monsters(self, page: int = 1) -> dict:
+        return self._page("monsters", page)
+
+    def list_spells(self, page: int = 1) -> dict:
+        return self._page("spells", page)
+
+    def list_classes(self, page: int = 1) -> dict:
+        return self._page("classes", page)
+
+    def list_races(self, page: int = 1) -> dict:
+        return self._page("races", page)
+
+    def close(self) -> None:
+        with self._lock:
+            for pages, _ in self._cursors.values():
+                pages.close()
+            self._cursors.clear()
+
+    def _page(self, kind: str, page: int) -> dict:
+        with self._lock:
+            return self._read_page(kind, page)
+
+    def _read_page(self, kind: str, page: int) -> dict:
+        pages, last_page = self._cursors.get(kind, (None, None))
+        if pages is None or last_page is None or page <= last_page:
+            if pages is not None:
+                pages.close()
+            pages, last_page = self.reader.iter_pages(kind), 0
+        results: list = []
+        for record in pages:
+            last_page = record["page"]
+            if last_page == page:
+                results = record["results"]
+                break
+        self._cursors[kind] = (pages, last_page)
+        has_next = page < self.reader.page_count(kind)
+        return {"results": results, "next": page + 1 if has_next else None}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export or inspect an offline Open5e content snapshot")
+    commands = parser.add_subparsers(dest="command", required=True)
+    export = commands.add_parser("export", help="Download Open5e content into a snapshot file")
+    export.add_argument("path")
+    export.add_argument("--kinds", nargs="+", choices=SNAPSHOT_KINDS, default=list(SNAPSHOT_KINDS))
+    export.add_argument("--max-pages", type=int, default=None, help="Stop each kind after this many pages")
+    info = commands.add_parser("info", help="Print a snapshot's header")
+    info.add_argument("path")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        client = Open5eClient()
+        try:
+            header = export_snapshot(client, args.path, kinds=args.kinds, max_pages=args.max_pages)
+        finally:
+            client.close()
+    else:
+        header = SnapshotReader(args.path).header
+    print(json.dumps(header, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""Shared, rate-limited and retrying HTTP transport for Open5e traffic.
+
+``Open5eTransport`` wraps an httpx transport. Before every attempt it takes a
+token from a ``TokenBucket``, so all importers together stay under one request
+rate. GET requests answered with 429 or a 5xx status, or that time out or drop
+mid-response, are retried with jittered exponential backoff; a numeric
+``Retry-After`` header takes precedence. Their bodies are read inside the
+transport, so a connection lost while reading the body is retried as well
+(Open5e pages are small JSON documents, so nothing is lost by not streaming).
+A refused connection or failed DNS lookup is raised at once, since retrying it
+would only delay the error. Latency, retries and failures are counted per
+endpoint (the first path segment, e.g. ``/monsters/``).
+
+``shared_http_client`` returns one keep-alive ``httpx.Client`` for the whole
+process, so ``Open5eClient`` instances and the spell importer reuse the same
+connection pool, limiter and stats. Async clients cannot share a pool across
+event loops, but ``new_async_http_client`` gives them the same limiter and
+stats. ``RPG_OPEN5E_RATE`` (requests per second, 0 for unlimited),
+``RPG_OPEN5E_BURST`` and ``RPG_OPEN5E_RETRIES`` tune the shared settings.
+"""
+
+import asyncio
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+DEFAULT_RATE = 10.0
+DEFAULT_BURST = 10
+DEFAULT_RETRIES = 4
+DEFAULT_BACKOFF = 0.5
+MAX_BACKOFF = 30.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_METHODS = frozenset({"GET", "HEAD"})
+RETRY_EXCEPTIONS = (httpx.TimeoutException, httpx.ReadError, httpx.WriteError, httpx.RemoteProtocolError)
+DEFAULT_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=8, keepalive_expiry=30.0)
+
+
+class TokenBucket:
+    """Thread-safe token bucket; ``reserve`` says how long to wait for a token.
+
+    Tokens may go negative, so concurrent callers queue up behind each other
+    rather than all waking at once when the bucket refills.
+    """
+
+    def __init__(
+        self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+
+@dataclass
+class RetryPolicy:
+    retries: int = DEFAULT_RETRIES
+    backoff: float = DEFAULT_BACKOFF
+    max_backoff: float = MAX_BACKOFF
+    statuses: frozenset = RETRY_STATUSES
+    rng: Callable[[], float] = random.random
+
+    def delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Seconds to wait before retry number ``attempt + 1``."""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), self.max_backoff)
+        ceiling = min(self.max_backoff, self.backoff * 2**attempt)
+        return ceiling / 2 + self.rng() * ceiling / 2
+
+
+@dataclass
+class EndpointStats:
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_seconds / self.requests * 1000 if self.requests else 0.0
+
+
+class TransportStats:
+    def __init__(self) -> None:
+        self.endpoints: Dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float, failed: bool = False) -> None:
+        with self._lock:
+            stats = self.endpoints.setdefault(endpoint, EndpointStats())
+            stats.requests += 1
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            if failed:
+                stats.failures += 1
+
+    def record_retry(self, endpoint: str) -> None:
+        with self._lock:
+            self.endpoints.setdefault(endpoint, EndpointStats()).retries += 1
+
+    def lines(self) -> List[str]:
+        with self._lock:
+            return [
+                f"{endpoint:<12} requests={stats.requests} retries={stats.retries} failures={stats.failures} "
+                f"mean {stats.mean_ms:7.1f} ms  max {stats.max_seconds * 1000:7.1f} ms"
+                for endpoint, stats in sorted(self.endpoints.items())
+            ]
+
+
+def endpoint_key(url: httpx.URL) -> str:
+    segment = url.path.strip("/").split("/", 1)[0]
+    return f"/{segment}/" if segment else "/"
+
+
+def _read_body(response: httpx.Response) -> None:
+    try:
+        response.read()
+    except httpx.TransportError:
+        response.close()
+        raise
+
+
+async def _aread_body(response: httpx.Response) -> None:
+    try:
+        await response.aread()
+    except httpx.TransportError:
+        await response.aclose()
+        raise
+
+
+class _RetryLoop:
+    def __init__(
+        self,
+        limiter: Optional[TokenBucket] = None,
+        policy: Optional[RetryPolicy] = None,
+        stats: Optional[TransportStats] = None,
+    ) -> None:
+        self.limiter = limiter or TokenBucket()
+        self.policy = policy or RetryPolicy()
+        self.stats = stats or TransportStats()
+
+    def _retryable(self, request: httpx.Request, attempt: int, error: Optional[Exception] = None) -> bool:
+        if error is not None and not isinstance(error, RETRY_EXCEPTIONS):
+            return False
+        return request.method in RETRY_METHODS and attempt < self.policy.retries
+
+
+class Open5eTransport(_RetryLoop, httpx.BaseTransport):
+    def __init__(
+        self,
+        inner: Optional[httpx.BaseTransport] = None,
+        limiter: Optional[TokenBucket] = None,
+        policy: Optional[RetryPolicy] = None,
+        stats: Optional[TransportStats] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        super().__init__(limiter, policy, stats)
+        self.inner = inner or httpx.HTTPTransport(limits=DEFAULT_LIMITS)
+        self._sleep = sleep
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        endpoint = endpoint_key(request.url)
+        attempt = 0
+        while True:
+            wait = self.limiter.reserve()
+            if wait:
+                self._sleep(wait)
+            started = time.perf_counter()
+            try:
+                response = self.inner.handle_request(request)
+                if request.method in RETRY_METHODS:
+                    _read_body(response)
+            except httpx.TransportError as exc:
+                self.stats.record(endpoint, time.perf_counter() - started, failed=True)
+                if not self._retryable(request, attempt, exc):
+                    raise
+                delay = self.policy.delay(attempt)
+            else:
+                failed = response.status_code in self.policy.statuses
+                self.stats.record(endpoint, time.perf_counter() - started, failed=failed)
+                if not (failed and self._retryable(request, attempt)):
+                    return response
+                delay = self.policy.delay(attempt, response)
+                response.close()
+            attempt += 1
+            self.stats.record_retry(endpoint)
+            self._sleep(delay)
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class AsyncOpen5eTransport(_RetryLoop, httpx.AsyncBaseTransport):
+    def __init__(
+        self,
+        inner: Optional[httpx.AsyncBaseTransport] = None,
+        limiter: Optional[TokenBucket] = None,
+        policy: Optional[RetryPolicy] = None,
+        stats: Optional[TransportStats] = None,
+    ) -> None:
+        super().__init__(limiter, policy, stats)
+        self.inner = inner or httpx.AsyncHTTPTransport(limits=DEFAULT_LIMITS)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        endpoint = endpoint_key(request.url)
+        attempt = 0
+        while True:
+            wait = self.limiter.reserve()
+            if wait:
+                await asyncio.sleep(wait)
+            started = time.perf_counter()
+            try:
+                response = await self.inner.handle_async_request(request)
+                if request.method in RETRY_METHODS:
+                    await _aread_body(response)
+            except httpx.TransportError as exc:
+                self.stats.record(endpoint, time.perf_counter() - started, failed=True)
+                if not self._retryable(request, attempt, exc):
+                    raise
+                delay = self.policy.delay(attempt)
+            else:
+                failed = response.status_code in self.policy.statuses
+                self.stats.record(endpoint, time.perf_counter() - started, failed=failed)
+                if not (failed and self._retryable(request, attempt)):
+                    return response
+                delay = self.policy.delay(attempt, response)
+                await response.aclose()
+            attempt += 1
+            self.stats.record_retry(endpoint)
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+_shared_lock = threading.Lock()
+_shared_limiter: Optional[TokenBucket] = None
+_shared_policy: Optional[RetryPolicy] = None
+_shared_client: Optional[httpx.Client] = None
+SHARED_STATS = TransportStats()
+
+
+def _shared_settings() -> tuple:
+    global _shared_limiter, _shared_policy
+    if _shared_limiter is None:
+        _shared_limiter = TokenBucket(
+            rate=float(os.getenv("RPG_OPEN5E_RATE", DEFAULT_RATE)),
+            burst=int(os.getenv("RPG_OPEN5E_BURST", DEFAULT_BURST)),
+        )
+        _shared_policy = RetryPolicy(retries=int(os.getenv("RPG_OPEN5E_RETRIES", DEFAULT_RETRIES)))
+    return _shared_limiter, _shared_policy
+
+
+def shared_http_client() -> httpx.Client:
+    """The process-wide keep-alive client; callers must not close it."""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            limiter, policy = _shared_settings()
+            _shared_client = httpx.Client(
+                transport=Open5eTransport(limiter=limiter, policy=policy, stats=SHARED_STATS)
+            )
+        return _shared_client
+
+
+def new_async_http_client(base_url: str = "", timeout: float = 10.0) -> httpx.AsyncClient:
+    """An async client that shares the process-wide limiter and stats."""
+    with _shared_lock:
+        limiter, policy = _shared_settings()
+    transport = AsyncOpen5eTransport(limiter=limiter, policy=policy, stats=SHARED_STATS)
+    return httpx.AsyncClient(base_url=base_url, timeout=timeout, transport=transport)
@@ -0,0 +1,59 @@
+"""On-disk copy of the Open5e race catalog used at character creation.
+
+``CharacterCreationService`` merges the stored rows into its races as soon as
+it starts and only refreshes them from Open5e (in the background) once the
+file is older than ``max_age``.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import List, Optional
+
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60.0
+
+
+def _default_path() -> Path:
+    cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "rpg" / "open5e_races.json"
+
+
+class RaceCatalogFile:
+    def __init__(self, path: str | os.PathLike, max_age: float = DEFAULT_MAX_AGE) -> None:
+        self.path = Path(path)
+        self.max_age = max_age
+
+    @classmethod
+    def from_env(cls, use_default_path: bool = True) -> Optional["RaceCatalogFile"]:
+        """Build from ``RPG_RACE_CATALOG`` (default under the user cache dir; ``off`` disables it).
+
+        With ``use_default_path=False`` an unset variable also means off, so
+        throwaway in-memory games leave the user's cache directory alone.
+        ``RPG_RACE_CATALOG_MAX_AGE`` sets the refresh age in seconds.
+        """
+        path = os.getenv("RPG_RACE_CATALOG") or (_default_path() if use_default_path else "off")
+        if str(path).lower() == "off":
+            return None
+        return cls(path, max_age=float(os.getenv("RPG_RACE_CATALOG_MAX_AGE", DEFAULT_MAX_AGE)))
+
+    def load(self) -> Optional[List[dict]]:
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                rows = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        return rows if isinstance(rows, list) else None
+
+    def is_fresh(self) -> bool:
+        try:
+            return time.time() - self.path.stat().st_mtime < self.max_age
+        except OSError:
+            return False
+
+    def save(self, rows: List[dict]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as handle:
+            json.dump(rows, handle, separators=(",", ":"))
+        os.replace(tmp, self.path)
@@ -15,6 +15,10 @@ ABILITY_NAME_MAP = {
     "CHA": "charisma",
 }
 
+# How long the race menu waits for a first Open5e race download before
+# falling back to the built-in races.
+RACE_CATALOG_WAIT_SECONDS = 5.0
+
 
 def _format_attr_line(attrs: Dict[str, int]) -> str:
     parts: List[str] = []
@@ -90,6 +94,9 @@ def _format_bonus_line(bonuses: Dict[str, int]) -> str:
 
 
 def _choose_race(creation_service):
+    if not creation_service.wait_for_races(timeout=0):
+        print("Fetching races from Open5e...")
+        creation_service.wait_for_races(timeout=RACE_CATALOG_WAIT_SECONDS)
     races = creation_service.list_races()
     options = [
         f"{race.name:<12} | {_format_bonus_line(race.bonuses):<18} | Speed {race.speed:<2} | {_format_trait_summary(race.traits)}"
@@ -22,7 +22,13 @@ from rpg.infrastructure.db.mysql.repos import (
     MysqlLocationRepository,
     MysqlWorldRepository,
 )
+from rpg.infrastructure.db.mysql.unit_of_work import MysqlUnitOfWork, run_after_commit
+from rpg.infrastructure.db.write_behind_world_repo import WriteBehindWorldRepository
 from rpg.infrastructure.open5e_client import Open5eClient
+from rpg.infrastructure.race_catalog_cache import RaceCatalogFile
+
+
+MENU_PAGE_SIZE = 20
 
 
 def _bootstrap() -> tuple[GameService, CharacterCreationService]:
@@ -135,7 +141,11 @@ def _bootstrap_inmemory() -> tuple[GameService, CharacterCreationService]:
     progression = WorldProgression(world_repo, entity_repo, event_bus)
 
     creation_service = CharacterCreationService(
-        char_repo, class_repo, location_repo, open5e_client=Open5eClient()
+        char_repo,
+        class_repo,
+        location_repo,
+        open5e_client=Open5eClient(),
+        race_catalog=RaceCatalogFile.from_env(use_default_path=False),
     )
 
     return (
@@ -151,7 +161,7 @@ def _bootstrap_inmemory() -> tuple[GameService, CharacterCreationService]:
 
 def _bootstrap_mysql() -> tuple[GameService, CharacterCreationService]:
     event_bus = EventBus()
-    world_repo = MysqlWorldRepository()
+    world_repo = WriteBehindWorldRepository(MysqlWorldRepository(), after_commit=run_after_commit)
     char_repo = MysqlCharacterRepository()
     class_repo = MysqlClassRepository()
     entity_repo = MysqlEntityRepository()
@@ -160,7 +170,11 @@ def _bootstrap_mysql() -> tuple[GameService, CharacterCreationService]:
     progression = WorldProgression(world_repo, entity_repo, event_bus)
 
     creation_service = CharacterCreationService(
-        char_repo, class_repo, location_repo, open5e_client=Open5eClient()
+        char_repo,
+        class_repo,
+        location_repo,
+        open5e_client=Open5eClient(),
+        race_catalog=RaceCatalogFile.from_env(),
     )
 
     return (
@@ -170,6 +184,7 @@ def _bootstrap_mysql() -> tuple[GameService, CharacterCreationService]:
             location_repo=location_repo,
             world_repo=world_repo,
             progression=progression,
+            unit_of_work_factory=MysqlUnitOfWork,
         ),
         creation_service,
     )
@@ -248,8 +263,13 @@ def _main_menu(
 ) -> int | None:
     """Allow the player to pick an existing character or create a new one."""
 
+    # This menu reads whole lines with input(), like the N/Q choices beside it, so
+    # paging uses letters too; the arrow-key "Continue" menu pages with menu entries.
+    # Ids each visited page started after, so "previous" can step back.
+    page_starts = [0]
     while True:
-        characters = game.list_characters()
+        characters = game.list_characters_page(after_id=page_starts[-1], limit=MENU_PAGE_SIZE)
+        has_next = len(characters) == MENU_PAGE_SIZE
 
         print("=== MAIN MENU ===")
         if characters:
@@ -260,6 +280,10 @@ def _main_menu(
                     f"  {idx}) {char.name} — level {char.level} "
                     f"{char.class_name or 'Adventurer'}{status}"
                 )
+            if has_next:
+                print("  M) More characters")
+            if len(page_starts) > 1:
+                print("  P) Previous page")
             print("  N) Create new character")
             print("  Q) Quit")
 
@@ -268,10 +292,19 @@ def _main_menu(
                 return None
             if choice == "n":
                 return run_character_creator(creation_service)
+            if choice == "m" and has_next:
+                page_starts.append(characters[-1].id or 0)
+                continue
+            if choice == "p" and len(page_starts) > 1:
+                page_starts.pop()
+                continue
             if choice.isdigit() and 1 <= int(choice) <= len(characters):
                 return characters[int(choice) - 1].id or 0
 
             print("Invalid choice. Try again.\n")
+        elif len(page_starts) > 1:
+            # The rest of the roster was removed while browsing; start over.
+            page_starts = [0]
         else:
             print("No characters found. Let's create a new hero!\n")
             return run_character_creator(creation_service)
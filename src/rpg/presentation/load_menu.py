@@ -1,22 +1,42 @@
 from rpg.application.services.game_service import GameService
 from rpg.presentation.menu_controls import arrow_menu, clear_screen
 
+PAGE_SIZE = 20
+NEXT_PAGE = "Next page >"
+PREVIOUS_PAGE = "< Previous page"
 
-def choose_existing_character(game_service: GameService):
-    characters = game_service.list_characters()
-    if not characters:
-        clear_screen()
-        print("No characters available.")
-        input("Press ENTER to return to the menu...")
-        return None
 
-    options = [
-        f"{char.name} (Level {char.level}){' [DEAD]' if not char.alive else ''}"
-        for char in characters
-    ]
+def choose_existing_character(game_service: GameService):
+    # Ids each visited page started after, so "previous" can step back.
+    page_starts = [0]
+    while True:
+        characters = game_service.list_characters_page(after_id=page_starts[-1], limit=PAGE_SIZE)
+        if not characters and len(page_starts) > 1:
+            # The rest of the roster was removed while browsing; start over.
+            page_starts = [0]
+            continue
+        if not characters:
+            clear_screen()
+            print("No characters available.")
+            input("Press ENTER to return to the menu...")
+            return None
 
-    selection = arrow_menu("CONTINUE", options)
-    if selection == -1:
-        return None
+        options = [
+            f"{char.name} (Level {char.level}){' [DEAD]' if not char.alive else ''}"
+            for char in characters
+        ]
+        has_next = len(characters) == PAGE_SIZE
+        if has_next:
+            options.append(NEXT_PAGE)
+        if len(page_starts) > 1:
+            options.append(PREVIOUS_PAGE)
 
-    return characters[selection].id
+        selection = arrow_menu("CONTINUE", options)
+        if selection == -1:
+            return None
+        if selection < len(characters):
+            return characters[selection].id
+        if options[selection] == NEXT_PAGE:
+            page_starts.append(characters[-1].id or 0)
+        else:
+            page_starts.pop()
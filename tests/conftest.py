@@ -0,0 +1,21 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from rpg.infrastructure.db.instrumentation import QueryBudget
+
+
+@pytest.fixture
+def query_budget():
+    """Per-operation statement limits, checked when the test finishes.
+
+    Add the fixture as an exporter on a ``QueryInstrumentation`` and declare
+    limits with ``query_budget.limit("make_choice", 8)``; any traced action
+    that issues more statements fails the test with its slowest queries.
+    """
+    budget = QueryBudget()
+    yield budget
+    budget.check()
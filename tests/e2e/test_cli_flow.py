@@ -6,7 +6,7 @@ from unittest import mock
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
-from rpg.presentation import cli
+from rpg.presentation import cli, load_menu
 
 
 class CliFlowTests(unittest.TestCase):
@@ -26,6 +26,43 @@ class CliFlowTests(unittest.TestCase):
         self.assertIn("Turn", transcript)
         self.assertIn("Goodbye.", transcript)
 
+    def test_main_menu_pages_through_characters(self) -> None:
+        game, creation_service = cli._bootstrap_inmemory()
+        for idx in range(3):
+            with mock.patch("builtins.input", side_effect=[f"Hero{idx}", "1"]), mock.patch("sys.stdout", new_callable=io.StringIO):
+                cli.run_character_creator(creation_service)
+
+        with mock.patch.object(cli, "MENU_PAGE_SIZE", 2), mock.patch(
+            "builtins.input", side_effect=["m", "1"]
+        ), mock.patch("sys.stdout", new_callable=io.StringIO) as output:
+            chosen = cli._main_menu(game, creation_service)
+
+        transcript = output.getvalue()
+        self.assertEqual(game.list_characters()[2].id, chosen)
+        self.assertIn("M) More characters", transcript)
+        self.assertIn("P) Previous page", transcript)
+
+    def test_continue_menu_pages_with_arrow_menu_entries(self) -> None:
+        game, creation_service = cli._bootstrap_inmemory()
+        for idx in range(3):
+            with mock.patch("builtins.input", side_effect=[f"Hero{idx}", "1"]), mock.patch(
+                "sys.stdout", new_callable=io.StringIO
+            ):
+                cli.run_character_creator(creation_service)
+        menus: list[list[str]] = []
+
+        def pick(title: str, options: list[str]) -> int:
+            menus.append(options)
+            return [2, 1, 0][len(menus) - 1]
+
+        with mock.patch.object(load_menu, "PAGE_SIZE", 2), mock.patch.object(load_menu, "arrow_menu", side_effect=pick):
+            chosen = load_menu.choose_existing_character(game)
+
+        characters = game.list_characters()
+        self.assertEqual(characters[0].id, chosen)
+        self.assertEqual(load_menu.NEXT_PAGE, menus[0][2])
+        self.assertEqual([load_menu.PREVIOUS_PAGE], menus[1][1:])
+
 
 if __name__ == "__main__":
     unittest.main()
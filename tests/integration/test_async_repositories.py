@@ -0,0 +1,155 @@
+import asyncio
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from sqlalchemy import text
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.application.services.async_game_service import AsyncGameService
+from rpg.domain.models.character import Character
+from rpg.infrastructure.db.mysql.async_repos import (
+    AsyncMysqlCharacterRepository,
+    AsyncMysqlEntityRepository,
+    AsyncMysqlLocationRepository,
+    AsyncMysqlWorldRepository,
+)
+from rpg.infrastructure.db.mysql.async_unit_of_work import AsyncMysqlUnitOfWork, create_async_session_factory
+from rpg.infrastructure.db.sqlite.connection import create_sqlite_engine, ensure_schema
+
+
+class AsyncRepositoryIntegrationTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        path = Path(self._tmp.name) / "game.sqlite3"
+        engine = create_sqlite_engine(f"sqlite:///{path}")
+        ensure_schema(engine)
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO entity_type (name) VALUES ('monster');"
+                )
+            )
+            conn.execute(
+                text(
+                    "INSERT INTO entity (entity_type_id, name, level, hp_max) "
+                    "VALUES (1, 'Rat', 1, 2), (1, 'Goblin', 2, 3)"
+                )
+            )
+        engine.dispose()
+        self.session_factory = create_async_session_factory(f"sqlite+aiosqlite:///{path}")
+
+    async def asyncTearDown(self) -> None:
+        await self.session_factory.kw["bind"].dispose()
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _service(self) -> AsyncGameService:
+        return AsyncGameService(
+            AsyncMysqlCharacterRepository(self.session_factory),
+            entity_repo=AsyncMysqlEntityRepository(self.session_factory),
+            location_repo=AsyncMysqlLocationRepository(self.session_factory),
+            world_repo=AsyncMysqlWorldRepository(self.session_factory),
+            unit_of_work_factory=lambda: AsyncMysqlUnitOfWork(self.session_factory),
+        )
+
+    async def test_character_round_trip(self) -> None:
+        repo = AsyncMysqlCharacterRepository(self.session_factory)
+        location = await AsyncMysqlLocationRepository(self.session_factory).get_starting_location()
+        created = await repo.create(Character(id=None, name="Ash", attributes={"strength": 14}), location.id)
+
+        created.hp_current = 3
+        await repo.save(created)
+
+        loaded = await repo.get(created.id)
+        self.assertEqual(3, loaded.hp_current)
+        self.assertEqual("Fighter", loaded.class_name)
+        self.assertEqual({"strength": 14}, loaded.attributes)
+
+    async def test_save_upserts_untracked_characters_and_writes_attributes(self) -> None:
+        repo = AsyncMysqlCharacterRepository(self.session_factory)
+        location = await AsyncMysqlLocationRepository(self.session_factory).get_starting_location()
+        stored = await repo.create(Character(id=None, name="Bryn", attributes={"strength": 11}), location.id)
+
+        stored.attributes["strength"] = 16
+        await repo.save(stored)
+        await repo.save(Character(id=500, name="Imported", location_id=location.id, attributes={"wisdom": 13}))
+
+        self.assertEqual({"strength": 16}, (await repo.get(stored.id)).attributes)
+        imported = await repo.get(500)
+        self.assertEqual(("Imported", location.id), (imported.name, imported.location_id))
+        self.assertEqual({"wisdom": 13}, imported.attributes)
+
+    async def test_save_of_a_deleted_character_raises(self) -> None:
+        repo = AsyncMysqlCharacterRepository(self.session_factory)
+        location = await AsyncMysqlLocationRepository(self.session_factory).get_starting_location()
+        stored = await repo.create(Character(id=None, name="Gone"), location.id)
+        async with self.session_factory() as session:
+            await session.execute(text("DELETE FROM `character` WHERE character_id = :cid"), {"cid": stored.id})
+            await session.commit()
+
+        stored.hp_current = 1
+        with self.assertRaises(LookupError):
+            await repo.save(stored)
+
+    async def test_concurrent_players_each_get_their_own_unit_of_work(self) -> None:
+        service = self._service()
+        location = await service.location_repo.get_starting_location()
+        players = [
+            await service.character_repo.create(Character(id=None, name=f"P{i}"), location.id) for i in range(4)
+        ]
+
+        results = await asyncio.gather(*(service.make_choice(player.id, "explore") for player in players))
+
+        self.assertEqual(4, len(results))
+        self.assertTrue(all(result.messages for result in results))
+        world = await service.world_repo.load_default()
+        self.assertEqual(4, world.current_turn)
+
+    async def test_explore_plans_from_level_band(self) -> None:
+        service = self._service()
+        location = await service.location_repo.get_starting_location()
+        player = await service.character_repo.create(Character(id=None, name="Scout"), location.id)
+
+        plan, character, _ = await service.explore(player.id)
+
+        self.assertEqual("level-band", plan.source)
+        self.assertTrue({enemy.name for enemy in plan.enemies} <= {"Rat", "Goblin"})
+        self.assertEqual(player.id, character.id)
+
+    async def test_unit_of_work_rolls_back_on_error(self) -> None:
+        repo = AsyncMysqlWorldRepository(self.session_factory)
+        with self.assertRaises(RuntimeError):
+            async with AsyncMysqlUnitOfWork(self.session_factory):
+                world = await repo.load_default()
+                world.current_turn = 99
+                await repo.save(world)
+                raise RuntimeError("boom")
+
+        self.assertEqual(0, (await repo.load_default()).current_turn)
+
+    async def test_saved_models_are_marked_clean_only_after_commit(self) -> None:
+        repo = AsyncMysqlWorldRepository(self.session_factory)
+        world = await repo.load_default()
+        with self.assertRaises(RuntimeError):
+            async with AsyncMysqlUnitOfWork(self.session_factory):
+                world.advance_turns(4)
+                await repo.save(world)
+                self.assertEqual({"current_turn"}, set(world.dirty_fields()))
+                raise RuntimeError("combat blew up")
+
+        self.assertEqual({"current_turn"}, set(world.dirty_fields()), "A rolled-back save must be retried")
+
+        async with AsyncMysqlUnitOfWork(self.session_factory):
+            await repo.save(world)
+            world.threat_level = 3
+
+        self.assertEqual({"threat_level"}, set(world.dirty_fields()), "Edits after the save stay dirty")
+        self.assertEqual(4, (await repo.load_default()).current_turn)
+
+
+if __name__ == "__main__":
+    unittest.main()
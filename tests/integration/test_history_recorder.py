@@ -0,0 +1,257 @@
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.domain.models.entity import Entity
+from rpg.infrastructure.db.history_recorder import HistoryRecorder
+from rpg.infrastructure.db.mysql import repos as mysql_repos
+from rpg.infrastructure.db.mysql.repos import MysqlEntityRepository, MysqlWorldRepository
+from rpg.infrastructure.db.mysql.unit_of_work import MysqlUnitOfWork
+
+
+def _bootstrap_history_schema(engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                CREATE TABLE h_character (
+                    h_character_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    h_action TEXT,
+                    h_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    character_id INTEGER NOT NULL,
+                    character_type_id INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    alive INTEGER NOT NULL,
+                    level INTEGER NOT NULL,
+                    xp INTEGER NOT NULL,
+                    money INTEGER NOT NULL
+                )
+                """
+            )
+        )
+        conn.execute(
+            text(
+                """
+                CREATE TABLE h_entity (
+                    h_entity_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    h_action TEXT,
+                    h_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    entity_id INTEGER NOT NULL,
+                    entity_type_id INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    level INTEGER
+                )
+                """
+            )
+        )
+        conn.execute(
+            text(
+                """
+                CREATE TABLE h_character_location (
+                    h_character_location_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    h_action TEXT,
+                    h_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    character_location_id INTEGER,
+                    character_id INTEGER NOT NULL,
+                    location_id INTEGER NOT NULL
+                )
+                """
+            )
+        )
+        conn.execute(
+            text(
+                """
+                CREATE TABLE h_world (
+                    h_world_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    h_action TEXT,
+                    h_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    world_id INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    current_turn INTEGER NOT NULL,
+                    threat_level INTEGER NOT NULL,
+                    flags TEXT
+                )
+                """
+            )
+        )
+
+
+def _bootstrap_entity_schema(engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE entity_type (entity_type_id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, "
+                "name_key TEXT GENERATED ALWAYS AS (lower(name)) STORED)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE TABLE entity (entity_id INTEGER PRIMARY KEY AUTOINCREMENT, entity_type_id INTEGER NOT NULL, "
+                "name TEXT NOT NULL, level INTEGER, armour_class INTEGER, attack_bonus INTEGER, damage_dice TEXT, "
+                "hp_max INTEGER, kind TEXT, source_hash TEXT, name_key TEXT GENERATED ALWAYS AS (lower(name)) STORED)"
+            )
+        )
+
+
+def _character_row(character_id: int) -> dict:
+    return {
+        "character_id": character_id,
+        "character_type_id": 1,
+        "name": f"Hero {character_id}",
+        "alive": 1,
+        "level": 1,
+        "xp": 0,
+        "money": 0,
+    }
+
+
+class HistoryRecorderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.engine = create_engine(f"sqlite:///{Path(self._tmp.name) / 'history.sqlite3'}")
+        _bootstrap_history_schema(self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine)
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+        self._tmp.cleanup()
+
+    def _count(self, table: str) -> int:
+        with self.engine.connect() as conn:
+            return conn.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+
+    def test_background_flush_writes_one_multi_row_insert_per_table(self) -> None:
+        inserts: list[str] = []
+        event.listen(
+            self.engine,
+            "before_cursor_execute",
+            lambda conn, cursor, stmt, *args: inserts.append(stmt) if stmt.startswith("INSERT") else None,
+        )
+        recorder = HistoryRecorder(self.SessionLocal, batch_size=100, register_atexit=False, autostart=False)
+        for character_id in range(1, 6):
+            recorder.record("character", "update", _character_row(character_id))
+
+        recorder.start()
+        recorder.flush()
+        recorder.close()
+
+        self.assertEqual(1, len(inserts))
+        self.assertEqual(5, self._count("h_character"))
+        stats = recorder.stats()
+        self.assertEqual((5, 5, 0, 0), (stats.recorded, stats.written, stats.dropped, stats.pending))
+
+    def test_records_queued_within_the_flush_interval_share_one_insert(self) -> None:
+        inserts: list[str] = []
+        event.listen(
+            self.engine,
+            "before_cursor_execute",
+            lambda conn, cursor, stmt, *args: inserts.append(stmt) if stmt.startswith("INSERT") else None,
+        )
+        recorder = HistoryRecorder(self.SessionLocal, flush_interval=5.0, register_atexit=False)
+        for character_id in range(1, 4):
+            recorder.record("character", "update", _character_row(character_id))
+            time.sleep(0.05)
+
+        recorder.flush()
+        recorder.close()
+
+        self.assertEqual(1, len(inserts))
+        self.assertEqual(3, self._count("h_character"))
+
+    def test_full_buffer_drops_records_and_reports_backpressure(self) -> None:
+        recorder = HistoryRecorder(self.SessionLocal, max_pending=3, register_atexit=False, autostart=False)
+
+        accepted = [recorder.record("character", "create", _character_row(i)) for i in range(1, 6)]
+
+        self.assertEqual([True, True, True, False, False], accepted)
+        stats = recorder.stats()
+        self.assertEqual((3, 2, 3), (stats.recorded, stats.dropped, stats.high_water))
+        self.assertEqual(1.0, stats.backpressure)
+
+        recorder.close()
+        self.assertEqual(3, self._count("h_character"))
+        self.assertEqual(0.0, recorder.stats().backpressure)
+
+    def test_write_failures_are_counted_and_reported(self) -> None:
+        errors: list[Exception] = []
+        recorder = HistoryRecorder(
+            self.SessionLocal, register_atexit=False, autostart=False, on_flush_error=errors.append
+        )
+        recorder.record("character", "update", {"character_id": 1})
+
+        recorder.close()
+
+        self.assertEqual(1, len(errors))
+        self.assertEqual(1, recorder.stats().failed)
+
+    def test_bad_row_is_retried_alone_and_the_rest_of_the_batch_is_kept(self) -> None:
+        errors: list[Exception] = []
+        recorder = HistoryRecorder(
+            self.SessionLocal, register_atexit=False, autostart=False, on_flush_error=errors.append
+        )
+        recorder.record("character", "update", _character_row(1))
+        recorder.record("character", "update", {"character_id": 2})
+        recorder.record("character_location", "update", {"character_id": 1, "location_id": 3})
+        recorder.record("character", "update", _character_row(3))
+
+        recorder.close()
+
+        self.assertEqual(1, len(errors))
+        stats = recorder.stats()
+        self.assertEqual((3, 1), (stats.written, stats.failed))
+        self.assertEqual(2, self._count("h_character"))
+        self.assertEqual(1, self._count("h_character_location"))
+
+    def test_repository_records_only_committed_changes(self) -> None:
+        _bootstrap_entity_schema(self.engine)
+        recorder = HistoryRecorder(self.SessionLocal, register_atexit=False, autostart=False)
+        with mock.patch.object(mysql_repos, "SessionLocal", self.SessionLocal):
+            repo = MysqlEntityRepository(history=recorder)
+            repo.upsert_entities([Entity(id=0, name="Goblin", level=1, hp=6)])
+
+            with self.assertRaises(RuntimeError):
+                with MysqlUnitOfWork(self.SessionLocal):
+                    repo.upsert_entities([Entity(id=0, name="Ogre", level=5, hp=30)])
+                    raise RuntimeError("abandon the action")
+
+            with MysqlUnitOfWork(self.SessionLocal):
+                repo.upsert_entities([Entity(id=0, name="Goblin", level=2, hp=9)])
+
+        recorder.close()
+        with self.engine.connect() as conn:
+            rows = conn.execute(text("SELECT h_action, name, level FROM h_entity ORDER BY h_entity_id")).all()
+        self.assertEqual([("create", "Goblin", 1), ("update", "Goblin", 2)], [tuple(row) for row in rows])
+
+    def test_world_saves_are_recorded(self) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TABLE world (world_id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, "
+                    "current_turn INTEGER NOT NULL DEFAULT 0, threat_level INTEGER NOT NULL DEFAULT 0, flags TEXT)"
+                )
+            )
+            conn.execute(text("INSERT INTO world (name) VALUES ('Default World')"))
+        recorder = HistoryRecorder(self.SessionLocal, register_atexit=False, autostart=False)
+        with mock.patch.object(mysql_repos, "SessionLocal", self.SessionLocal):
+            repo = MysqlWorldRepository(history=recorder)
+            world = repo.load_default()
+            world.current_turn = 4
+            world.flags["storm"] = True
+            repo.save(world)
+
+        recorder.close()
+        with self.engine.connect() as conn:
+            rows = conn.execute(text("SELECT h_action, world_id, current_turn, flags FROM h_world")).all()
+        self.assertEqual([("update", world.id, 4, '{"storm": true}')], [tuple(row) for row in rows])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,16 +1,26 @@
+import json
 import sys
 from pathlib import Path
 import unittest
 from unittest import mock
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
 from rpg.domain.models.entity import Entity
 from rpg.infrastructure.db.mysql import repos as mysql_repos
-from rpg.infrastructure.db.mysql.repos import MysqlEntityRepository, MysqlWorldRepository
+from rpg.infrastructure.db.mysql import import_open5e_spells
+from rpg.infrastructure.db.mysql.import_open5e_spells import _replace_spell_class_rows
+from rpg.infrastructure.db.mysql.repos import (
+    MysqlCharacterRepository,
+    MysqlClassRepository,
+    MysqlEntityRepository,
+    MysqlSpellRepository,
+    MysqlWorldRepository,
+)
+from rpg.infrastructure.db.mysql.unit_of_work import MysqlUnitOfWork, current_unit_of_work
 
 
 def _bootstrap_entity_schema(engine) -> None:
@@ -20,11 +30,13 @@ def _bootstrap_entity_schema(engine) -> None:
                 """
                 CREATE TABLE entity_type (
                     entity_type_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL UNIQUE
+                    name TEXT NOT NULL UNIQUE,
+                    name_key TEXT GENERATED ALWAYS AS (lower(name)) STORED
                 )
                 """
             )
         )
+        conn.execute(text("CREATE INDEX idx_entity_type_name_key ON entity_type (name_key)"))
         conn.execute(
             text(
                 """
@@ -37,11 +49,14 @@ def _bootstrap_entity_schema(engine) -> None:
                     attack_bonus INTEGER,
                     damage_dice TEXT,
                     hp_max INTEGER,
-                    kind TEXT
+                    kind TEXT,
+                    source_hash TEXT,
+                    name_key TEXT GENERATED ALWAYS AS (lower(name)) STORED
                 )
                 """
             )
         )
+        conn.execute(text("CREATE INDEX idx_entity_name_key ON entity (name_key)"))
         conn.execute(
             text(
                 """
@@ -86,6 +101,124 @@ def _bootstrap_world_schema(engine) -> None:
         )
 
 
+def _bootstrap_character_schema(engine) -> None:
+    statements = [
+        """
+        CREATE TABLE `character` (
+            character_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            character_type_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            alive INTEGER NOT NULL,
+            level INTEGER NOT NULL,
+            xp INTEGER NOT NULL,
+            money INTEGER NOT NULL,
+            hp_current INTEGER NOT NULL DEFAULT 10,
+            hp_max INTEGER NOT NULL DEFAULT 10
+        )
+        """,
+        """
+        CREATE TABLE character_location (
+            character_location_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            character_id INTEGER NOT NULL UNIQUE,
+            location_id INTEGER NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE class (
+            class_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            hit_die TEXT,
+            primary_ability TEXT,
+            source TEXT,
+            open5e_slug TEXT,
+            slug_key TEXT GENERATED ALWAYS AS (lower(open5e_slug)) STORED,
+            name_key TEXT GENERATED ALWAYS AS (lower(name)) STORED
+        )
+        """,
+        "CREATE UNIQUE INDEX uk_class_slug_key ON class (slug_key)",
+        "CREATE UNIQUE INDEX uk_class_name_key ON class (name_key)",
+        """
+        CREATE TABLE character_class (
+            character_class_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            character_id INTEGER NOT NULL UNIQUE,
+            class_id INTEGER NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE attribute (
+            attribute_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE character_attribute (
+            character_attribute_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            character_id INTEGER NOT NULL,
+            attribute_id INTEGER NOT NULL,
+            value INTEGER NOT NULL,
+            UNIQUE(character_id, attribute_id)
+        )
+        """,
+    ]
+    with engine.begin() as conn:
+        for statement in statements:
+            conn.execute(text(statement))
+
+
+def _bootstrap_spell_schema(engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                CREATE TABLE spell (
+                    slug TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    level_int INTEGER NOT NULL,
+                    school TEXT,
+                    casting_time TEXT,
+                    range_text TEXT,
+                    duration TEXT,
+                    components TEXT,
+                    concentration INTEGER NOT NULL DEFAULT 0,
+                    ritual INTEGER NOT NULL DEFAULT 0,
+                    desc_text TEXT,
+                    higher_level TEXT,
+                    classes_json TEXT,
+                    source_hash TEXT
+                )
+                """
+            )
+        )
+        conn.execute(
+            text(
+                """
+                CREATE TABLE spell_class (
+                    class_key TEXT NOT NULL,
+                    level_int INTEGER NOT NULL,
+                    spell_slug TEXT NOT NULL,
+                    PRIMARY KEY (class_key, level_int, spell_slug)
+                )
+                """
+            )
+        )
+
+
+def _capture_queries(engine) -> list[tuple[str, tuple]]:
+    seen: list[tuple[str, tuple]] = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, stmt, params, *args: seen.append((stmt, params)),
+    )
+    return seen
+
+
+def _capture_statements(engine) -> list[str]:
+    seen: list[str] = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, stmt, *args: seen.append(stmt))
+    return seen
+
+
 class MysqlEntityRepositoryIntegrationTests(unittest.TestCase):
     def setUp(self) -> None:
         self.engine = create_engine("sqlite:///:memory:", future=True)
@@ -136,6 +269,37 @@ class MysqlEntityRepositoryIntegrationTests(unittest.TestCase):
             ).scalar()
             self.assertEqual(2, location_id)
 
+    def test_upsert_ignores_same_named_entities_of_other_types(self) -> None:
+        with self.SessionLocal() as session:
+            session.execute(text("INSERT INTO entity_type (name) VALUES ('npc')"))
+            session.execute(text("INSERT INTO entity (entity_type_id, name, level) VALUES (1, 'Goblin', 7)"))
+            session.commit()
+
+        result = self.repo.upsert_entities([Entity(id=0, name="Goblin", level=1, hp=6)])
+
+        self.assertEqual((1, 0), (result.created, result.updated))
+        with self.SessionLocal() as session:
+            levels = session.execute(text("SELECT entity_type_id, level FROM entity ORDER BY entity_id")).all()
+        self.assertEqual([(1, 7), (2, 1)], [tuple(row) for row in levels])
+
+    def test_hot_reads_reuse_compiled_statements(self) -> None:
+        self.repo.upsert_entities([Entity(id=0, name="Goblin", level=1, hp=6)], location_id=1)
+        self.repo.list_by_location(1)
+        self.repo.get_many([1])
+
+        cache_hits: list[bool] = []
+        event.listen(
+            self.engine,
+            "after_cursor_execute",
+            lambda conn, cursor, stmt, params, context, many: cache_hits.append(
+                context.cache_hit == context.dialect.CACHE_HIT
+            ),
+        )
+        self.assertEqual(["Goblin"], [e.name for e in self.repo.list_by_location(1)])
+        self.assertEqual(["Goblin"], [e.name for e in self.repo.get_many([1, 2])])
+
+        self.assertEqual([True, True], cache_hits)
+
 
 class MysqlWorldRepositoryIntegrationTests(unittest.TestCase):
     def setUp(self) -> None:
@@ -175,6 +339,310 @@ class MysqlWorldRepositoryIntegrationTests(unittest.TestCase):
             self.assertEqual(3, row.threat_level)
             self.assertEqual('{"season": "winter"}', row.flags)
 
+    def test_save_writes_only_changed_columns_and_skips_clean_worlds(self) -> None:
+        world = self.repo.load_default()
+        world.flags = {"season": "spring"}
+        self.repo.save(world)
+
+        with self.SessionLocal.begin() as session:
+            session.execute(text("UPDATE world SET flags = '{\"season\": \"edited\"}'"))
+
+        statements = _capture_statements(self.engine)
+        self.repo.save(world)
+        self.assertEqual([], statements, "Saving an unchanged world should be a no-op")
+
+        world.advance_turns()
+        self.repo.save(world)
+        self.assertEqual(1, len(statements))
+        self.assertNotIn("flags", statements[0])
+
+        with self.SessionLocal() as session:
+            row = session.execute(text("SELECT current_turn, flags FROM world")).first()
+        self.assertEqual(1, row.current_turn)
+        self.assertEqual('{"season": "edited"}', row.flags)
+
+
+class MysqlCharacterRepositoryIntegrationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine("sqlite:///:memory:", future=True)
+        _bootstrap_character_schema(self.engine)
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO `character` (character_id, character_type_id, name, alive, level, xp, money, hp_current, hp_max)
+                    VALUES (1, 1, 'Mira', 1, 2, 40, 5, 3, 12)
+                    """
+                )
+            )
+            conn.execute(text("INSERT INTO character_location (character_id, location_id) VALUES (1, 1)"))
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, autocommit=False)
+        self.session_patcher = mock.patch.object(mysql_repos, "SessionLocal", self.SessionLocal)
+        self.session_patcher.start()
+        self.repo = MysqlCharacterRepository()
+
+    def tearDown(self) -> None:
+        self.session_patcher.stop()
+        self.engine.dispose()
+
+    def test_save_after_rest_updates_only_hp(self) -> None:
+        character = self.repo.get(1)
+        character.hp_current = 12
+
+        statements = _capture_statements(self.engine)
+        self.repo.save(character)
+
+        self.assertEqual(1, len(statements))
+        self.assertIn("hp_current", statements[0])
+        self.assertNotIn("character_location", statements[0])
+        self.assertNotIn("name", statements[0])
+
+        reloaded = self.repo.get(1)
+        self.assertEqual(12, reloaded.hp_current)
+        self.assertEqual(40, reloaded.xp)
+
+        statements.clear()
+        self.repo.save(reloaded)
+        self.assertEqual([], statements)
+
+    def test_list_page_and_iter_all_walk_characters_by_key(self) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO `character` (character_id, character_type_id, name, alive, level, xp, money, hp_current, hp_max) "
+                    "VALUES (:cid, 1, :name, 1, 1, 0, 0, 10, 10)"
+                ),
+                [{"cid": cid, "name": f"Hero {cid}"} for cid in (2, 3, 4)],
+            )
+
+        first = self.repo.list_page(after_id=0, limit=2)
+        second = self.repo.list_page(after_id=first[-1].id, limit=2)
+        streamed = list(self.repo.iter_all(batch_size=2))
+
+        self.assertEqual([1, 2], [c.id for c in first])
+        self.assertEqual([3, 4], [c.id for c in second])
+        self.assertEqual([1, 2, 3, 4], [c.id for c in streamed])
+        self.assertFalse(any(c.dirty_fields() for c in streamed))
+        with MysqlUnitOfWork(self.SessionLocal):
+            self.assertEqual([1, 2, 3, 4], [c.id for c in self.repo.iter_all(batch_size=3)])
+
+
+class MysqlSpellRepositoryIntegrationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine("sqlite:///:memory:", future=True)
+        _bootstrap_spell_schema(self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, autocommit=False)
+        self.session_patcher = mock.patch.object(mysql_repos, "SessionLocal", self.SessionLocal)
+        self.session_patcher.start()
+
+    def tearDown(self) -> None:
+        self.session_patcher.stop()
+        self.engine.dispose()
+
+    def _add_spell(self, slug: str, level: int, classes: list[str] | None) -> None:
+        with self.SessionLocal() as session:
+            session.execute(
+                text(
+                    "INSERT INTO spell (slug, name, level_int, classes_json) VALUES (:slug, :name, :level, :classes)"
+                ),
+                {
+                    "slug": slug,
+                    "name": slug.replace("-", " ").title(),
+                    "level": level,
+                    "classes": json.dumps(classes) if classes is not None else None,
+                },
+            )
+            _replace_spell_class_rows(session, [(slug, level, classes)])
+            session.commit()
+
+    def test_list_by_class_reads_the_spell_class_index(self) -> None:
+        self._add_spell("fire-bolt", 0, ["Wizard", "Sorcerer"])
+        self._add_spell("cure-wounds", 1, ["Cleric"])
+        self._add_spell("light", 0, None)
+        self._add_spell("unlisted", 0, [])
+        self._add_spell("wish", 9, ["Wizard"])
+
+        statements = _capture_statements(self.engine)
+        spells = MysqlSpellRepository().list_by_class("wizard", max_level=1)
+
+        # No class list means any class; an explicit empty list means none.
+        self.assertEqual(["fire-bolt", "light"], [spell.slug for spell in spells])
+        self.assertEqual(["Wizard", "Sorcerer"], spells[0].classes)
+        self.assertNotIn("JSON_CONTAINS", statements[0])
+
+    def test_reimport_replaces_index_rows(self) -> None:
+        self._add_spell("shield", 1, ["Wizard"])
+        with self.SessionLocal() as session:
+            _replace_spell_class_rows(session, [("shield", 1, ["Sorcerer"])])
+            session.commit()
+
+        repo = MysqlSpellRepository()
+        self.assertEqual([], list(repo.list_by_class("wizard", max_level=9)))
+        self.assertEqual(["shield"], [spell.slug for spell in repo.list_by_class("Sorcerer", max_level=9)])
+
+    def test_batch_index_replace_covers_every_spell_in_the_batch(self) -> None:
+        self._add_spell("shield", 1, ["Wizard"])
+        self._add_spell("bless", 1, ["Cleric"])
+        with self.SessionLocal() as session:
+            _replace_spell_class_rows(session, [("shield", 1, ["Sorcerer"]), ("bless", 1, ["Paladin"])])
+            session.commit()
+
+        repo = MysqlSpellRepository()
+        self.assertEqual([], list(repo.list_by_class("wizard", max_level=9)))
+        self.assertEqual([], list(repo.list_by_class("cleric", max_level=9)))
+        self.assertEqual(["shield"], [spell.slug for spell in repo.list_by_class("sorcerer", max_level=9)])
+
+    def test_spell_dry_run_diffs_stored_hashes_without_writing(self) -> None:
+        shield = {"slug": "shield", "name": "Shield", "level_int": 1, "classes": ["Wizard"]}
+        values = import_open5e_spells._with_source_hash(import_open5e_spells._spell_values(shield))
+        with self.SessionLocal() as session:
+            session.execute(
+                text("INSERT INTO spell (slug, name, level_int, source_hash) VALUES (:slug, :name, 1, :source_hash)"),
+                values,
+            )
+            session.execute(text("INSERT INTO spell (slug, name, level_int) VALUES ('wish', 'Wish', 9)"))
+            session.execute(text("INSERT INTO spell (slug, name, level_int) VALUES ('light', 'Light', 0)"))
+            session.commit()
+
+        statements = _capture_statements(self.engine)
+        with mock.patch.object(import_open5e_spells, "SessionLocal", self.SessionLocal):
+            report = import_open5e_spells.diff_spells(
+                [shield, {"slug": "wish", "name": "Wish", "level_int": 9}, {"slug": "bless", "name": "Bless"}]
+            )
+
+        self.assertEqual(
+            (["bless"], ["wish"], ["shield"], ["light"]),
+            (report.new, report.changed, report.unchanged, report.orphaned),
+        )
+        self.assertEqual(1, len(statements))
+        self.assertTrue(statements[0].lstrip().startswith("SELECT"))
+
+
+class MysqlLookupQueryPlanTests(unittest.TestCase):
+    """Guard against case-insensitive lookups regressing to full table scans."""
+
+    def setUp(self) -> None:
+        self.engine = create_engine("sqlite:///:memory:", future=True)
+        _bootstrap_entity_schema(self.engine)
+        _bootstrap_character_schema(self.engine)
+        with self.engine.begin() as conn:
+            conn.execute(text("INSERT INTO class (name, open5e_slug) VALUES ('Wizard', 'wizard'), ('Rogue', 'rogue')"))
+            conn.execute(text("INSERT INTO entity_type (name) VALUES ('Monster')"))
+            conn.execute(text("INSERT INTO entity (entity_type_id, name, level) VALUES (1, 'Goblin', 1)"))
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, autocommit=False)
+        self.session_patcher = mock.patch.object(mysql_repos, "SessionLocal", self.SessionLocal)
+        self.session_patcher.start()
+
+    def tearDown(self) -> None:
+        self.session_patcher.stop()
+        self.engine.dispose()
+
+    def _plans_for_lookups(self, queries, table: str) -> list[str]:
+        plans = []
+        with self.engine.connect() as conn:
+            for statement, params in queries:
+                normalized = " ".join(statement.split())
+                if not normalized.startswith("SELECT") or f"FROM {table} WHERE" not in normalized:
+                    continue
+                cursor = conn.connection.driver_connection.execute(f"EXPLAIN QUERY PLAN {statement}", params)
+                plans.append(" | ".join(row[3] for row in cursor.fetchall()))
+        return plans
+
+    def test_class_slug_lookup_uses_key_indexes(self) -> None:
+        queries = _capture_queries(self.engine)
+        self.assertEqual("Wizard", MysqlClassRepository().get_by_slug(" WIZARD ").name)
+
+        plans = self._plans_for_lookups(queries, "class")
+        self.assertEqual(1, len(plans))
+        self.assertNotIn("SCAN class", plans[0])
+        self.assertIn("uk_class_slug_key", plans[0])
+        self.assertIn("uk_class_name_key", plans[0])
+
+    def test_entity_name_and_type_lookups_use_key_indexes(self) -> None:
+        queries = _capture_queries(self.engine)
+        MysqlEntityRepository().upsert_entities([Entity(id=0, name="GOBLIN", level=2)])
+
+        entity_plans = self._plans_for_lookups(queries, "entity")
+        type_plans = self._plans_for_lookups(queries, "entity_type")
+        self.assertEqual(1, len(entity_plans))
+        self.assertIn("idx_entity_name_key", entity_plans[0])
+        self.assertEqual(1, len(type_plans))
+        self.assertIn("idx_entity_type_name_key", type_plans[0])
+
+
+class MysqlUnitOfWorkIntegrationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine("sqlite:///:memory:", future=True)
+        _bootstrap_world_schema(self.engine)
+        with self.engine.begin() as conn:
+            conn.execute(text("INSERT INTO world (name, current_turn, threat_level, flags) VALUES ('Shared', 0, 0, '{}')"))
+        self.sessions_opened = 0
+        base_factory = sessionmaker(bind=self.engine, autoflush=False, autocommit=False)
+
+        def counting_factory():
+            self.sessions_opened += 1
+            return base_factory()
+
+        self.SessionLocal = base_factory
+        self.counting_factory = counting_factory
+        self.session_patcher = mock.patch.object(mysql_repos, "SessionLocal", counting_factory)
+        self.session_patcher.start()
+        self.repo = MysqlWorldRepository()
+
+    def tearDown(self) -> None:
+        self.session_patcher.stop()
+        self.engine.dispose()
+
+    def test_repositories_share_one_session_and_identity_map(self) -> None:
+        with MysqlUnitOfWork(self.counting_factory):
+            first = self.repo.load_default()
+            second = self.repo.load_default()
+            first.advance_turns(2)
+            self.repo.save(first)
+            with MysqlUnitOfWork(self.counting_factory):
+                nested = self.repo.load_default()
+
+        self.assertIs(first, second)
+        self.assertIs(first, nested)
+        self.assertEqual(1, self.sessions_opened)
+        self.assertIsNone(current_unit_of_work())
+        with self.SessionLocal() as session:
+            turn = session.execute(text("SELECT current_turn FROM world")).scalar()
+        self.assertEqual(2, turn)
+
+    def test_rolls_back_all_writes_when_action_fails(self) -> None:
+        with self.assertRaises(RuntimeError):
+            with MysqlUnitOfWork(self.counting_factory):
+                world = self.repo.load_default()
+                world.advance_turns(4)
+                self.repo.save(world)
+                raise RuntimeError("combat blew up")
+
+        with self.SessionLocal() as session:
+            turn = session.execute(text("SELECT current_turn FROM world")).scalar()
+        self.assertEqual(0, turn)
+        self.assertIsNone(current_unit_of_work())
+
+    def test_saved_models_are_marked_clean_only_after_commit(self) -> None:
+        world = self.repo.load_default()
+        with self.assertRaises(RuntimeError):
+            with MysqlUnitOfWork(self.counting_factory):
+                world.advance_turns(4)
+                self.repo.save(world)
+                self.assertEqual({"current_turn"}, set(world.dirty_fields()))
+                raise RuntimeError("combat blew up")
+
+        self.assertEqual({"current_turn"}, set(world.dirty_fields()), "A rolled-back save must be retried")
+
+        with MysqlUnitOfWork(self.counting_factory):
+            self.repo.save(world)
+            world.threat_level = 3
+
+        self.assertEqual({"threat_level"}, set(world.dirty_fields()), "Edits after the save stay dirty")
+        with self.SessionLocal() as session:
+            turn = session.execute(text("SELECT current_turn FROM world")).scalar()
+        self.assertEqual(4, turn)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,16 +1,24 @@
+import asyncio
 import sys
 from pathlib import Path
 import unittest
 from unittest import mock
 
-from sqlalchemy import create_engine, text
+import httpx
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
 from rpg.infrastructure.db.mysql import repos as mysql_repos
-from rpg.infrastructure.db.mysql.open5e_monster_importer import Open5eMonsterImporter
+from rpg.infrastructure.db.mysql.open5e_monster_importer import (
+    Open5eMonsterImporter,
+    map_monster,
+    map_monsters_parallel,
+)
 from rpg.infrastructure.db.mysql.repos import MysqlEntityRepository
+from rpg.infrastructure.open5e_client import AsyncOpen5eClient
 
 
 class FakeOpen5eClient:
@@ -31,7 +39,8 @@ def _bootstrap_schema(engine) -> None:
                 """
                 CREATE TABLE entity_type (
                     entity_type_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL
+                    name TEXT NOT NULL,
+                    name_key TEXT GENERATED ALWAYS AS (lower(name)) STORED
                 )
                 """
             )
@@ -48,7 +57,9 @@ def _bootstrap_schema(engine) -> None:
                     attack_bonus INTEGER,
                     damage_dice TEXT,
                     hp_max INTEGER,
-                    kind TEXT
+                    kind TEXT,
+                    source_hash TEXT,
+                    name_key TEXT GENERATED ALWAYS AS (lower(name)) STORED
                 )
                 """
             )
@@ -227,6 +238,131 @@ class Open5eMonsterImporterIntegrationTests(unittest.TestCase):
 
             self.assertEqual(2, location_id)
 
+    def test_reimport_skips_rows_whose_hash_is_unchanged(self) -> None:
+        client = FakeOpen5eClient(pages={1: [_monster("Wolf"), _monster("Boar")]})
+        importer = Open5eMonsterImporter(repository=self.repo, client=client)
+        importer.import_monsters(pages=1, location_id=1)
+
+        writes: list[str] = []
+
+        def record_entity_writes(conn, cursor, statement, *args) -> None:
+            if "INTO entity " in statement or "UPDATE entity" in statement:
+                writes.append(statement)
+
+        event.listen(self.engine, "before_cursor_execute", record_entity_writes)
+        client.pages[1][1] = dict(_monster("Boar"), hit_points=40)
+        result = importer.import_monsters(pages=1, location_id=1)
+
+        self.assertEqual((0, 1, 1), (result.created, result.updated, result.skipped))
+        self.assertEqual(1, len(writes))
+        with self.SessionLocal() as session:
+            self.assertEqual(40, session.execute(text("SELECT hp_max FROM entity WHERE name = 'Boar'")).scalar())
+
+    def test_dry_run_reports_changes_without_writing(self) -> None:
+        client = FakeOpen5eClient(pages={1: [_monster("Wolf"), _monster("Boar"), _monster("Rat")]})
+        importer = Open5eMonsterImporter(repository=self.repo, client=client)
+        importer.import_monsters(pages=1, location_id=1)
+
+        client.pages[1] = [_monster("Wolf"), dict(_monster("Boar"), hit_points=40), _monster("Bear")]
+        statements: list[str] = []
+        event.listen(self.engine, "before_cursor_execute", lambda conn, cursor, stmt, *args: statements.append(stmt))
+        report = importer.dry_run(pages=1)
+
+        self.assertEqual(
+            (["bear"], ["boar"], ["wolf"], ["rat"]),
+            (report.new, report.changed, report.unchanged, report.orphaned),
+        )
+        self.assertTrue(all(stmt.lstrip().upper().startswith("SELECT") for stmt in statements))
+        self.assertEqual(2, len(statements))
+        self.assertIn("1 new, 1 changed, 1 unchanged, 1 orphaned", report.lines()[0])
+
+    def test_parallel_import_maps_across_processes_in_page_order(self) -> None:
+        def bite(i: int) -> list:
+            return [{"name": "Bite", "desc": f"+{i} to hit, (1d{i + 4}) damage"}]
+
+        pages = {page: [dict(_monster(f"Beast {page}-{i}"), actions=bite(i)) for i in range(4)] for page in (1, 2, 3)}
+        monsters = [monster for page in (1, 2, 3) for monster in pages[page]]
+        entities = map_monsters_parallel(monsters, processes=2, chunk_size=3)
+
+        self.assertEqual([map_monster(monster) for monster in monsters], entities)
+        self.assertEqual("1d7", entities[3].damage_die)
+
+        importer = Open5eMonsterImporter(repository=self.repo, client=FakeOpen5eClient(pages=pages))
+        result = importer.import_monsters_parallel(pages=3, location_id=1, processes=2, chunk_size=5, batch_size=5)
+
+        self.assertEqual((12, 12), (result.created, result.attached))
+        with self.SessionLocal() as session:
+            names = session.execute(text("SELECT name FROM entity ORDER BY entity_id")).scalars().all()
+        self.assertEqual([monster["name"] for monster in monsters], names)
+
+
+def _monster(name: str) -> dict:
+    return {"name": name, "challenge_rating": "1", "armor_class": 12, "hit_points": 11, "type": "beast"}
+
+
+class ConcurrentOpen5eMonsterImporterTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        # Writes run on a worker thread, so every thread must see the same in-memory database.
+        self.engine = create_engine(
+            "sqlite://", future=True, poolclass=StaticPool, connect_args={"check_same_thread": False}
+        )
+        _bootstrap_schema(self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, autocommit=False)
+        self.session_patcher = mock.patch.object(mysql_repos, "SessionLocal", self.SessionLocal)
+        self.session_patcher.start()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def tearDown(self) -> None:
+        self.session_patcher.stop()
+        self.engine.dispose()
+
+    def _client(self, pages: dict) -> AsyncOpen5eClient:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01 * (5 - page))
+            self.in_flight -= 1
+            if page not in pages:
+                return httpx.Response(404)
+            return httpx.Response(200, json={"results": pages[page]})
+
+        http_client = httpx.AsyncClient(base_url="https://api.test", transport=httpx.MockTransport(handler))
+        return AsyncOpen5eClient(base_url="https://api.test", http_client=http_client)
+
+    async def test_fetches_pages_in_parallel_and_writes_each_one(self) -> None:
+        client = self._client({page: [_monster(f"Beast {page}-{i}") for i in range(3)] for page in range(1, 5)})
+        importer = Open5eMonsterImporter(repository=MysqlEntityRepository(), client=client)
+
+        result = await importer.import_monsters_async(pages=4, location_id=2, concurrency=3)
+        await client.aclose()
+
+        self.assertEqual((12, 0, 12), (result.created, result.updated, result.attached))
+        self.assertEqual(3, self.max_in_flight)
+        with self.SessionLocal() as session:
+            attached = session.execute(text("SELECT COUNT(*) FROM entity_location WHERE location_id = 2")).scalar()
+        self.assertEqual(12, attached)
+
+    def test_pipelined_import_writes_in_batches(self) -> None:
+        pages = {page: [_monster(f"Beast {page}-{i}") for i in range(3)] for page in range(1, 5)}
+        client = FakeOpen5eClient(pages=pages)
+        importer = Open5eMonsterImporter(repository=MysqlEntityRepository(), client=client)
+
+        result = importer.import_monsters_pipelined(pages=5, location_id=1, batch_size=5, fetch_workers=2)
+
+        self.assertEqual((12, 12), (result.created, result.attached))
+        write = importer.last_report.stages[-1]
+        self.assertEqual((3, "write"), (write.items_in, write.name))
+
+    async def test_failed_page_stops_the_import(self) -> None:
+        client = self._client({1: [_monster("Wolf")], 2: [_monster("Boar")]})
+        importer = Open5eMonsterImporter(repository=MysqlEntityRepository(), client=client)
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await importer.import_monsters_async(pages=3, location_id=1, concurrency=3)
+        await client.aclose()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,101 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.application.services.event_bus import EventBus
+from rpg.application.services.game_service import GameService
+from rpg.application.services.world_progression import WorldProgression
+from rpg.infrastructure.db.instrumentation import QueryBudget, QueryBudgetExceeded, QueryInstrumentation
+from rpg.infrastructure.db.sqlite.connection import create_session_factory
+from rpg.infrastructure.db.sqlite.repos import (
+    SqliteCharacterRepository,
+    SqliteClassRepository,
+    SqliteEntityRepository,
+    SqliteLocationRepository,
+    SqliteWorldRepository,
+)
+
+
+def _sqlite_game(session_factory, instrumentation: QueryInstrumentation) -> GameService:
+    entity_repo = SqliteEntityRepository(session_factory)
+    world_repo = SqliteWorldRepository(session_factory)
+    return GameService(
+        SqliteCharacterRepository(session_factory),
+        entity_repo=entity_repo,
+        location_repo=SqliteLocationRepository(session_factory),
+        world_repo=world_repo,
+        class_repo=SqliteClassRepository(session_factory),
+        progression=WorldProgression(world_repo, entity_repo, EventBus()),
+        operation_tracer=instrumentation.operation,
+    )
+
+
+class QueryInstrumentationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine("sqlite://")
+        self.instrumentation = QueryInstrumentation(keep_slowest=2)
+        self.instrumentation.attach(self.engine)
+        self.exported = []
+        self.instrumentation.add_exporter(self.exported.append)
+
+    def tearDown(self) -> None:
+        self.instrumentation.detach()
+        self.engine.dispose()
+
+    def test_counts_statements_per_outermost_operation(self) -> None:
+        with self.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            with self.instrumentation.operation("make_choice"):
+                conn.execute(text("SELECT 2"))
+                with self.instrumentation.operation("rest"):
+                    conn.execute(text("SELECT 3"))
+                    conn.execute(text("SELECT 4"))
+
+        self.assertEqual(["make_choice"], [stats.operation for stats in self.exported])
+        stats = self.exported[0]
+        self.assertEqual(3, stats.statement_count)
+        self.assertEqual(2, len(stats.slowest))
+        self.assertGreaterEqual(stats.slowest[0][0], stats.slowest[1][0])
+        self.assertGreater(stats.total_time, 0)
+        totals = self.instrumentation.totals["make_choice"]
+        self.assertEqual((1, 3), (totals.runs, totals.statements))
+
+    def test_budget_reports_operations_over_their_limit(self) -> None:
+        budget = QueryBudget({"explore": 1})
+        self.instrumentation.add_exporter(budget)
+        with self.engine.connect() as conn, self.instrumentation.operation("explore"):
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+        with self.assertRaises(QueryBudgetExceeded) as raised:
+            budget.check()
+        self.assertIn("explore: 2 statements (budget 1)", str(raised.exception))
+
+
+def test_game_actions_stay_within_query_budgets(query_budget) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        session_factory = create_session_factory(f"sqlite:///{Path(tmp) / 'game.sqlite3'}")
+        instrumentation = QueryInstrumentation()
+        instrumentation.attach(session_factory.kw["bind"])
+        instrumentation.add_exporter(query_budget)
+        for operation, limit in {"create_character": 8, "make_choice": 8, "explore": 8, "rest": 4}.items():
+            query_budget.limit(operation, limit)
+
+        game = _sqlite_game(session_factory, instrumentation)
+        character = game.character_creation_service.create_character("Asha", 0)
+        game.make_choice(character.id, "explore")
+        game.make_choice(character.id, "rest")
+        game.explore(character.id)
+        game.rest(character.id)
+
+        assert set(instrumentation.totals) == {"create_character", "make_choice", "explore", "rest"}
+        session_factory.kw["bind"].dispose()
+
+
+if __name__ == "__main__":
+    unittest.main()
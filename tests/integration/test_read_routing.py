@@ -0,0 +1,88 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.domain.models.entity import Entity
+from rpg.infrastructure.db.mysql import repos as mysql_repos
+from rpg.infrastructure.db.mysql.repos import MysqlClassRepository, MysqlEntityRepository
+from rpg.infrastructure.db.mysql.unit_of_work import MysqlUnitOfWork
+
+
+_SCHEMA = (
+    "CREATE TABLE entity_type (entity_type_id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, "
+    "name_key TEXT GENERATED ALWAYS AS (lower(name)) STORED)",
+    "CREATE TABLE entity (entity_id INTEGER PRIMARY KEY AUTOINCREMENT, entity_type_id INTEGER NOT NULL, "
+    "name TEXT NOT NULL, level INTEGER, armour_class INTEGER, attack_bonus INTEGER, damage_dice TEXT, "
+    "hp_max INTEGER, kind TEXT, source_hash TEXT, name_key TEXT GENERATED ALWAYS AS (lower(name)) STORED)",
+    "CREATE TABLE entity_location (entity_id INTEGER PRIMARY KEY, location_id INTEGER NOT NULL)",
+    "CREATE TABLE class (class_id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, open5e_slug TEXT, "
+    "hit_die TEXT, primary_ability TEXT, source TEXT)",
+)
+
+
+def _database(path: Path, label: str):
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as conn:
+        for statement in _SCHEMA:
+            conn.execute(text(statement))
+        conn.execute(text("INSERT INTO entity (entity_type_id, name, level) VALUES (1, :name, 2)"), {"name": f"{label} Wolf"})
+        conn.execute(text("INSERT INTO class (name, open5e_slug) VALUES (:name, 'fighter')"), {"name": f"{label} Fighter"})
+    return engine, sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+
+class ReadRoutingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.primary, self.PrimarySession = _database(Path(self._tmp.name) / "primary.sqlite3", "Primary")
+        self.replica, self.ReplicaSession = _database(Path(self._tmp.name) / "replica.sqlite3", "Replica")
+        self.patchers = [
+            mock.patch.object(mysql_repos, "SessionLocal", self.PrimarySession),
+            mock.patch.object(mysql_repos, "ReadSessionLocal", self.ReplicaSession),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+        self.entities = MysqlEntityRepository()
+
+    def tearDown(self) -> None:
+        for patcher in self.patchers:
+            patcher.stop()
+        self.primary.dispose()
+        self.replica.dispose()
+        self._tmp.cleanup()
+
+    def _band_names(self) -> list[str]:
+        return sorted(e.name for e in self.entities.list_by_level_band(1, 5))
+
+    def test_static_reads_use_replica_and_writes_use_primary(self) -> None:
+        self.entities.upsert_entities([Entity(id=0, name="Ogre", level=4, hp=30)])
+
+        self.assertEqual(["Replica Wolf"], self._band_names())
+        self.assertEqual(["Replica Fighter"], [c.name for c in MysqlClassRepository().list_playable()])
+        with self.primary.connect() as conn:
+            self.assertEqual(2, conn.execute(text("SELECT COUNT(*) FROM entity")).scalar())
+
+    def test_unit_of_work_sticks_to_primary_after_writing(self) -> None:
+        with MysqlUnitOfWork(self.PrimarySession, read_session_factory=self.ReplicaSession):
+            self.assertEqual(["Replica Wolf"], self._band_names())
+            self.entities.upsert_entities([Entity(id=0, name="Ogre", level=4, hp=30)])
+            self.assertEqual(["Ogre", "Primary Wolf"], self._band_names())
+
+        with MysqlUnitOfWork(self.PrimarySession, read_session_factory=self.ReplicaSession):
+            self.assertEqual(["Replica Wolf"], self._band_names())
+
+    def test_without_a_replica_reads_go_to_the_primary(self) -> None:
+        with mock.patch.object(mysql_repos, "ReadSessionLocal", None):
+            self.assertEqual(["Primary Wolf"], self._band_names())
+            with MysqlUnitOfWork(self.PrimarySession):
+                self.assertEqual(["Primary Wolf"], self._band_names())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from sqlalchemy import event, text
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.domain.models.character import Character
+from rpg.domain.models.entity import Entity
+from rpg.infrastructure.db.sqlite.connection import create_session_factory, ensure_schema
+from rpg.infrastructure.db.sqlite.repos import (
+    SqliteCharacterRepository,
+    SqliteClassRepository,
+    SqliteEntityRepository,
+    SqliteLocationRepository,
+    SqliteSpellRepository,
+    SqliteWorldRepository,
+)
+
+
+class SqliteRepositoryIntegrationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.url = f"sqlite:///{Path(self._tmp.name) / 'game.sqlite3'}"
+        self.session_factory = create_session_factory(self.url)
+
+    def tearDown(self) -> None:
+        self.session_factory.kw["bind"].dispose()
+        self._tmp.cleanup()
+
+    def test_schema_uses_wal_and_is_idempotent(self) -> None:
+        engine = self.session_factory.kw["bind"]
+        ensure_schema(engine)
+        with engine.connect() as conn:
+            self.assertEqual("wal", conn.execute(text("PRAGMA journal_mode")).scalar())
+            self.assertEqual(1, conn.execute(text("SELECT COUNT(*) FROM world")).scalar())
+
+    def test_character_round_trip_persists_across_factories(self) -> None:
+        repo = SqliteCharacterRepository(self.session_factory)
+        location = SqliteLocationRepository(self.session_factory).get_starting_location()
+        created = repo.create(
+            Character(id=None, name="Vale", class_name="wizard", attributes={"intelligence": 15}),
+            location.id,
+        )
+
+        created.hp_current = 4
+        repo.save(created)
+
+        reopened = SqliteCharacterRepository(create_session_factory(self.url))
+        loaded = reopened.get(created.id)
+        self.assertEqual("Vale", loaded.name)
+        self.assertEqual(4, loaded.hp_current)
+        self.assertEqual("Wizard", loaded.class_name)
+        self.assertEqual({"intelligence": 15}, loaded.attributes)
+        self.assertEqual([created.id], [c.id for c in reopened.find_by_location(location.id)])
+
+        loaded.attributes["intelligence"] = 17
+        reopened.save(loaded)
+        self.assertEqual({"intelligence": 17}, repo.get(created.id).attributes)
+
+    def test_save_many_writes_all_changes_in_one_transaction(self) -> None:
+        repo = SqliteCharacterRepository(self.session_factory)
+        location = SqliteLocationRepository(self.session_factory).get_starting_location()
+        for name in ("Ash", "Bryn", "Cato"):
+            repo.create(Character(id=None, name=name, class_name="fighter", attributes={"strength": 12}), location.id)
+
+        listed = repo.list_page(limit=10)
+        for character in listed:
+            character.hp_current = 1
+        listed[2].attributes = {"strength": 18}
+
+        commits: list[object] = []
+        event.listen(self.session_factory.kw["bind"], "commit", commits.append)
+        repo.save_many(listed)
+
+        self.assertEqual(1, len(commits))
+        self.assertEqual([1, 1, 1], [repo.get(c.id).hp_current for c in listed])
+        self.assertEqual([12, 12, 18], [repo.get(c.id).attributes["strength"] for c in listed])
+
+    def test_entity_upsert_and_level_band(self) -> None:
+        repo = SqliteEntityRepository(self.session_factory)
+        location_id = repo.get_default_location_id()
+
+        first = repo.upsert_entities([Entity(id=0, name="Wolf", level=2, hp=11)], location_id=location_id)
+        second = repo.upsert_entities([Entity(id=0, name="wolf", level=3, hp=13)], location_id=location_id)
+
+        self.assertEqual((1, 0, 1), (first.created, first.updated, first.attached))
+        self.assertEqual((0, 1, 0), (second.created, second.updated, second.attached))
+        self.assertEqual(["Wolf"], [e.name for e in repo.list_by_level_band(3, 3)])
+        self.assertEqual(13, repo.list_by_location(location_id)[0].hp_max)
+
+    def test_reimporting_unchanged_entities_skips_them(self) -> None:
+        repo = SqliteEntityRepository(self.session_factory)
+        with self.session_factory.begin() as session:
+            session.execute(text("INSERT INTO entity_type (name) VALUES ('npc')"))
+            npc_type_id = session.execute(text("SELECT entity_type_id FROM entity_type WHERE name = 'npc'")).scalar()
+            session.execute(
+                text("INSERT INTO entity (entity_type_id, name, level) VALUES (:type_id, 'Ogre', 9)"),
+                {"type_id": npc_type_id},
+            )
+        entities = [Entity(id=0, name="Ogre", level=5, hp=30), Entity(id=0, name="Rat", level=1, hp=2)]
+
+        first = repo.upsert_entities(entities)
+        again = repo.upsert_entities(entities)
+        changed = repo.upsert_entities([Entity(id=0, name="Rat", level=2, hp=4)])
+
+        self.assertEqual((2, 0, 0), (first.created, first.updated, first.skipped))
+        self.assertEqual((0, 0, 2), (again.created, again.updated, again.skipped))
+        self.assertEqual((0, 1, 0), (changed.created, changed.updated, changed.skipped))
+        self.assertEqual([9, 5], sorted((e.level for e in repo.list_by_level_band(5, 9)), reverse=True))
+
+    def test_schema_adds_source_hash_to_older_entity_tables(self) -> None:
+        engine = self.session_factory.kw["bind"]
+        with engine.begin() as conn:
+            conn.execute(text("DROP INDEX idx_entity_level_cover"))
+            conn.execute(text("ALTER TABLE entity DROP COLUMN source_hash"))
+
+        ensure_schema(engine)
+
+        with engine.connect() as conn:
+            columns = [row[1] for row in conn.execute(text("PRAGMA table_info(entity)"))]
+        self.assertIn("source_hash", columns)
+
+    def test_world_save_writes_only_dirty_fields(self) -> None:
+        repo = SqliteWorldRepository(self.session_factory)
+        world = repo.load_default()
+        world.current_turn = 7
+        world.flags["seen"] = True
+        repo.save(world)
+
+        reloaded = repo.load_default()
+        self.assertEqual(7, reloaded.current_turn)
+        self.assertEqual({"seen": True}, reloaded.flags)
+
+    def test_class_lookup_is_case_insensitive(self) -> None:
+        repo = SqliteClassRepository(self.session_factory)
+        self.assertEqual("Rogue", repo.get_by_slug("ROGUE").name)
+        self.assertEqual(["Fighter", "Rogue", "Wizard"], [c.name for c in repo.list_playable()])
+
+    def test_spells_for_class_include_classless_spells(self) -> None:
+        with self.session_factory.begin() as session:
+            session.execute(
+                text(
+                    "INSERT INTO spell (slug, name, level_int, classes_json) VALUES "
+                    "('fire-bolt', 'Fire Bolt', 0, :wizard), ('wish', 'Wish', 9, :wizard), "
+                    "('light', 'Light', 0, NULL), ('cure', 'Cure Wounds', 1, :cleric)"
+                ),
+                {"wizard": json.dumps(["Wizard"]), "cleric": json.dumps(["Cleric"])},
+            )
+            session.execute(
+                text(
+                    "INSERT INTO spell_class (class_key, level_int, spell_slug) VALUES "
+                    "('wizard', 0, 'fire-bolt'), ('wizard', 9, 'wish'), ('*', 0, 'light'), ('cleric', 1, 'cure')"
+                )
+            )
+        repo = SqliteSpellRepository(self.session_factory)
+
+        spells = repo.list_by_class("wizard", max_level=1)
+
+        self.assertEqual(["fire-bolt", "light"], [s.slug for s in spells])
+        self.assertEqual(["Wizard"], repo.get_by_slug("fire-bolt").classes)
+
+
+if __name__ == "__main__":
+    unittest.main()
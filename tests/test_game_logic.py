@@ -1,5 +1,6 @@
 import random
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 import unittest
 
@@ -97,6 +98,35 @@ class GameServiceTests(unittest.TestCase):
         self.assertEqual(1, len(slain_events))
         self.assertEqual(monster.id, slain_events[0].monster_id)
 
+    def test_make_choice_runs_inside_a_single_unit_of_work(self) -> None:
+        character = Character(id=1, name="Cleric", location_id=1)
+        character_repo = InMemoryCharacterRepository({character.id: character})
+        entity_repo = InMemoryEntityRepository([])
+        location_repo = InMemoryLocationRepository({1: Location(id=1, name="Chapel")})
+        world_repo = InMemoryWorldRepository(seed=2)
+        scopes: list[str] = []
+
+        @contextmanager
+        def unit_of_work():
+            scopes.append("enter")
+            yield
+            scopes.append("exit")
+
+        service = GameService(
+            character_repo=character_repo,
+            entity_repo=entity_repo,
+            location_repo=location_repo,
+            world_repo=world_repo,
+            progression=WorldProgression(world_repo, entity_repo, self.event_bus),
+            unit_of_work_factory=unit_of_work,
+        )
+
+        service.make_choice(character.id, "rest")
+
+        # rest() opens its own scope, nested inside the action's scope
+        self.assertEqual(["enter", "enter", "exit", "exit"], scopes)
+        self.assertEqual(1, world_repo.load_default().current_turn)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -61,6 +61,34 @@ class InMemoryCharacterRepositoryTests(unittest.TestCase):
         self.assertEqual(5, created.location_id)
         self.assertIn(created.id, repo._characters)
 
+    def test_save_many_stores_every_character(self) -> None:
+        repo = InMemoryCharacterRepository({})
+
+        repo.save_many([Character(id=1, name="Ash"), Character(id=2, name="Bryn")])
+
+        self.assertEqual(["Ash", "Bryn"], [c.name for c in repo.list_all()])
+
+    def test_list_page_walks_ids_in_order(self) -> None:
+        repo = InMemoryCharacterRepository({cid: Character(id=cid, name=f"C{cid}") for cid in (5, 2, 9, 7, 1)})
+
+        self.assertEqual([1, 2], [c.id for c in repo.list_page(after_id=0, limit=2)])
+        self.assertEqual([5, 7], [c.id for c in repo.list_page(after_id=2, limit=2)])
+        self.assertEqual([9], [c.id for c in repo.list_page(after_id=7, limit=2)])
+        self.assertEqual([1, 2, 5, 7, 9], [c.id for c in repo.iter_all(batch_size=2)])
+
+        repo.save(Character(id=6, name="C6"))
+        repo.create(Character(id=None, name="New"), location_id=1)
+        self.assertEqual([6, 7, 9, 10], [c.id for c in repo.list_page(after_id=5, limit=10)])
+
+
+    def test_save_assigns_an_id_to_a_character_without_one(self) -> None:
+        repo = InMemoryCharacterRepository({3: Character(id=3, name="Ash")})
+
+        repo.save(Character(id=None, name="Bryn"))
+        repo.save_many([Character(id=None, name="Cael")])
+
+        self.assertEqual([(3, "Ash"), (4, "Bryn"), (5, "Cael")], [(c.id, c.name) for c in repo.list_page()])
+
 
 class InMemoryWorldRepositoryTests(unittest.TestCase):
     def test_save_and_load_persists_world_state(self) -> None:
@@ -0,0 +1,45 @@
+import sys
+from pathlib import Path
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.domain.models.character import Character
+from rpg.domain.models.world import World
+
+
+class ChangeTrackingTests(unittest.TestCase):
+    def test_untracked_objects_report_every_field_dirty(self) -> None:
+        world = World(id=1, name="Fresh")
+
+        self.assertFalse(world.is_tracked)
+        self.assertEqual({"current_turn", "threat_level", "flags"}, set(world.dirty_fields()))
+
+    def test_mark_clean_then_mutate_reports_only_changed_fields(self) -> None:
+        character = Character(id=1, name="Ayla", hp_current=4, hp_max=10)
+        character.mark_clean()
+        self.assertEqual(frozenset(), character.dirty_fields())
+
+        character.hp_current = 10
+        self.assertEqual({"hp_current"}, set(character.dirty_fields()))
+
+        character.hp_current = 4
+        self.assertEqual(frozenset(), character.dirty_fields(), "Reverting a change leaves nothing to write")
+
+    def test_in_place_flag_edits_are_detected(self) -> None:
+        world = World(id=1, name="Flagged", flags={"quests": {"bridge": "open"}})
+        world.mark_clean()
+
+        world.flags["quests"]["bridge"] = "burned"
+
+        self.assertEqual({"flags"}, set(world.dirty_fields()))
+
+    def test_snapshot_does_not_affect_equality(self) -> None:
+        tracked = World(id=1, name="Same")
+        tracked.mark_clean()
+
+        self.assertEqual(World(id=1, name="Same"), tracked)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,14 @@
 import sys
+import tempfile
+import threading
 from pathlib import Path
 import unittest
+from unittest import mock
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
 from rpg.application.services.character_creation_service import CharacterCreationService
+from rpg.infrastructure.race_catalog_cache import RaceCatalogFile
 
 
 class _DummyRepo:
@@ -14,13 +18,16 @@ class _DummyRepo:
 
 
 class _FakeRaceClient:
-    def __init__(self, pages, should_raise: bool = False):
+    def __init__(self, pages, should_raise: bool = False, gate: threading.Event | None = None):
         self.pages = pages
         self.should_raise = should_raise
+        self.gate = gate
         self.calls = []
         self.closed = False
 
     def list_races(self, page: int = 1) -> dict:
+        if self.gate is not None:
+            self.gate.wait(5)
         if self.should_raise:
             raise RuntimeError("boom")
         self.calls.append(page)
@@ -63,6 +70,7 @@ class CharacterCreationRacesTests(unittest.TestCase):
         service = CharacterCreationService(
             self.char_repo, self.class_repo, self.location_repo, open5e_client=client
         )
+        self.assertTrue(service.wait_for_races(timeout=5))
         races = service.list_races()
 
         names = [race.name for race in races]
@@ -89,6 +97,7 @@ class CharacterCreationRacesTests(unittest.TestCase):
         service = CharacterCreationService(
             self.char_repo, self.class_repo, self.location_repo, open5e_client=client
         )
+        self.assertTrue(service.wait_for_races(timeout=5))
         races = service.list_races()
 
         names = {race.name for race in races}
@@ -97,6 +106,66 @@ class CharacterCreationRacesTests(unittest.TestCase):
         self.assertTrue(client.closed)
         self.assertEqual([], client.calls)
 
+    def test_startup_returns_defaults_without_waiting_for_open5e(self) -> None:
+        gate = threading.Event()
+        client = _FakeRaceClient(pages={1: {"results": [{"name": "Tiefling", "speed": 30}]}}, gate=gate)
+
+        service = CharacterCreationService(
+            self.char_repo, self.class_repo, self.location_repo, open5e_client=client
+        )
+
+        self.assertEqual(["Human", "Elf", "Dwarf", "Halfling"], [race.name for race in service.list_races()])
+        self.assertFalse(service.wait_for_races(timeout=0))
+        gate.set()
+        self.assertTrue(service.wait_for_races(timeout=5))
+        self.assertIn("Tiefling", [race.name for race in service.list_races()])
+
+
+class RaceCatalogCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.catalog = RaceCatalogFile(Path(self.tmp.name) / "races.json")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _service(self, client):
+        return CharacterCreationService(
+            _DummyRepo(), _DummyRepo(), _DummyRepo(), open5e_client=client, race_catalog=self.catalog
+        )
+
+    def test_refresh_saves_catalog_and_fresh_catalog_skips_the_network(self) -> None:
+        first = _FakeRaceClient(pages={1: {"results": [{"name": "Gnome", "speed": 25}]}})
+        self.assertTrue(self._service(first).wait_for_races(timeout=5))
+        self.assertEqual([{"name": "Gnome", "speed": 25}], self.catalog.load())
+
+        second = _FakeRaceClient(pages={}, should_raise=True)
+        service = self._service(second)
+
+        self.assertIn("Gnome", [race.name for race in service.list_races()])
+        self.assertTrue(service.wait_for_races(timeout=0))
+        self.assertEqual([], second.calls)
+        self.assertTrue(second.closed)
+
+    def test_stale_catalog_is_served_while_refresh_fails(self) -> None:
+        self.catalog.save([{"name": "Gnome", "speed": 25}])
+        self.catalog.max_age = 0
+        client = _FakeRaceClient(pages={}, should_raise=True)
+
+        service = self._service(client)
+        self.assertTrue(service.wait_for_races(timeout=5))
+
+        self.assertIn("Gnome", [race.name for race in service.list_races()])
+        self.assertTrue(client.closed)
+
+    def test_catalog_from_env_can_stay_off_unless_configured(self) -> None:
+        path = Path(self.tmp.name) / "env.json"
+        with mock.patch.dict("os.environ", {}, clear=True):
+            self.assertIsNone(RaceCatalogFile.from_env(use_default_path=False))
+            self.assertIsNotNone(RaceCatalogFile.from_env())
+        with mock.patch.dict("os.environ", {"RPG_RACE_CATALOG": str(path)}, clear=True):
+            self.assertEqual(path, RaceCatalogFile.from_env(use_default_path=False).path)
+
 
 if __name__ == "__main__":
     unittest.main()
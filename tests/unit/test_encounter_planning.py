@@ -1,14 +1,17 @@
+import asyncio
 import sys
 from pathlib import Path
 import unittest
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
+from rpg.application.services.async_game_service import AsyncGameService
+
 from rpg.domain.models.encounter_definition import EncounterDefinition, EncounterSlot
 from rpg.domain.models.entity import Entity
 from rpg.domain.models.faction import Faction
 from rpg.domain.models.stats import CombatStats
-from rpg.domain.repositories import EntityRepository
+from rpg.domain.repositories import EncounterDefinitionRepository, EntityRepository
 from rpg.domain.services.encounter_planner import EncounterPlanner
 
 
@@ -116,6 +119,67 @@ class EncounterPlannerTests(unittest.TestCase):
         self.assertEqual("goblin_band", chosen.id)
 
 
+class _StubDefinitionRepository(EncounterDefinitionRepository):
+    def __init__(self, definitions: list[EncounterDefinition]):
+        self._definitions = definitions
+
+    def list_for_location(self, location_id: int):
+        return [definition for definition in self._definitions if definition.applies_to_location(location_id)]
+
+
+class _YieldingAsyncEntityRepository:
+    """Async entity repository that yields to the loop on every call, like a real driver."""
+
+    def __init__(self, entities: list[Entity]) -> None:
+        self._entities = entities
+
+    async def get_many(self, entity_ids: list[int]) -> list[Entity]:
+        await asyncio.sleep(0)
+        return [entity for entity in self._entities if entity.id in entity_ids]
+
+    async def list_by_location(self, location_id: int) -> list[Entity]:
+        await asyncio.sleep(0)
+        return list(self._entities)
+
+
+class AsyncEncounterPlanTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        entities = [Entity(id=i, name=f"Monster {i}", level=1, hp=5) for i in range(1, 21)]
+        self.service = AsyncGameService(character_repo=None, entity_repo=_YieldingAsyncEntityRepository(entities))
+
+    async def _plan(self, world_turn: int) -> list[int]:
+        plan = await self.service._generate_plan(
+            location_id=1, player_level=1, world_turn=world_turn, faction_bias=None, max_enemies=3
+        )
+        return [enemy.id for enemy in plan.enemies]
+
+    async def test_gathered_plans_match_their_sequential_results(self) -> None:
+        expected = [await self._plan(turn) for turn in (1, 2)]
+        self.assertNotEqual(expected[0], expected[1], "Seeds chosen to give different plans")
+
+        for _ in range(5):
+            self.assertEqual(expected, list(await asyncio.gather(self._plan(1), self._plan(2))))
+
+    async def test_definitions_are_used_before_the_entity_pool(self) -> None:
+        self.service.definition_repo = _StubDefinitionRepository(
+            [
+                EncounterDefinition(
+                    id="pair",
+                    name="Pair",
+                    location_ids=[1],
+                    slots=[EncounterSlot(entity_id=7, min_count=2, max_count=2)],
+                )
+            ]
+        )
+
+        plan = await self.service._generate_plan(
+            location_id=1, player_level=1, world_turn=0, faction_bias=None, max_enemies=3
+        )
+
+        self.assertEqual(("definition", "pair"), (plan.source, plan.definition_id))
+        self.assertEqual([7, 7], [enemy.id for enemy in plan.enemies])
+
+
 class FactionModelTests(unittest.TestCase):
     def test_attitude_changes_with_reputation(self):
         faction = Faction(id="wardens", name="Emerald Wardens")
@@ -0,0 +1,50 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.infrastructure.db.entity_mapper import (
+    MAX_TABLE_LEVEL,
+    default_combat_fields,
+    default_stats_for_level,
+    defaults_for_level,
+    row_to_entity,
+    rows_to_entities,
+)
+
+
+class EntityMapperTests(unittest.TestCase):
+    def test_level_table_matches_formulas(self) -> None:
+        for level in range(-2, MAX_TABLE_LEVEL + 5):
+            defaults = defaults_for_level(level)
+            self.assertEqual(default_stats_for_level(level), tuple(defaults[:4]))
+            self.assertEqual(default_combat_fields(level), tuple(defaults[4:]))
+
+    def test_missing_columns_fall_back_to_level_defaults(self) -> None:
+        entity = row_to_entity((7, "Ghoul", 4, None, None, None, None, None))
+
+        defaults = defaults_for_level(4)
+        self.assertEqual(defaults.hp, entity.hp_max)
+        self.assertEqual(defaults.hp, entity.hp_current)
+        self.assertEqual(defaults.armour_class, entity.armour_class)
+        self.assertEqual(defaults.damage_die, entity.damage_die)
+        self.assertEqual("beast", entity.kind)
+
+    def test_stored_columns_win_and_level_zero_is_treated_as_one(self) -> None:
+        rows = [
+            (1, "Ogre", 5, 11, 6, "2d8+4", 59, "giant"),
+            (2, "Rat", 0, None, None, None, None, None),
+            (3, "Tarrasque", 40, None, None, None, None, "monstrosity"),
+        ]
+
+        ogre, rat, tarrasque = rows_to_entities(rows)
+
+        self.assertEqual((11, 6, "2d8+4", 59, "giant"), (ogre.armour_class, ogre.attack_bonus, ogre.damage_die, ogre.hp, ogre.kind))
+        self.assertEqual(1, rat.level)
+        self.assertEqual(defaults_for_level(1).hp, rat.hp)
+        self.assertEqual(defaults_for_level(40).attack_max, tarrasque.attack_max)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import sys
+from pathlib import Path
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.infrastructure.db.import_diff import ChangeReport, diff_hashes
+
+
+class DiffHashesTests(unittest.TestCase):
+    def test_classifies_incoming_rows_against_stored_hashes(self) -> None:
+        stored = {"wolf": "a", "boar": "b", "rat": "c", "legacy": None}
+
+        report = diff_hashes("monsters", stored, [("bear", "x"), ("boar", "changed"), ("wolf", "a"), ("legacy", "d")])
+
+        self.assertEqual(["bear"], report.new)
+        self.assertEqual(["boar", "legacy"], report.changed)
+        self.assertEqual(["wolf"], report.unchanged)
+        self.assertEqual(["rat"], report.orphaned)
+        self.assertTrue(report.has_changes)
+
+    def test_repeated_keys_are_judged_by_their_last_hash(self) -> None:
+        report = diff_hashes("spells", {"shield": "a"}, [("shield", "b"), ("shield", "a")])
+
+        self.assertEqual((["shield"], []), (report.unchanged, report.changed))
+        self.assertFalse(report.has_changes)
+
+    def test_lines_summarise_counts_and_truncate_key_lists(self) -> None:
+        report = ChangeReport(kind="classes", new=[f"class-{i}" for i in range(5)], orphaned=["bard"])
+
+        lines = report.lines(limit=2)
+
+        self.assertEqual("classes: 5 new, 0 changed, 0 unchanged, 1 orphaned (dry run, nothing written)", lines[0])
+        self.assertEqual("  new      class-0, class-1 ... (+3 more)", lines[1])
+        self.assertEqual("  orphaned bard", lines[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
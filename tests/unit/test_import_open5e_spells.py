@@ -0,0 +1,120 @@
+import sys
+from pathlib import Path
+import unittest
+from unittest import mock
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.infrastructure.db.mysql import import_open5e_spells
+from rpg.infrastructure.db.mysql.import_open5e_spells import SpellImportResult, iter_open5e_pages
+
+
+def _paged_handler(requests: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        page = int(request.url.params.get("page", "1"))
+        next_url = f"https://api.open5e.com/spells/?page={page + 1}" if page < 3 else None
+        return httpx.Response(200, json={"results": [{"slug": f"spell-{page}"}], "next": next_url})
+
+    return handler
+
+
+def _spell_row(page: int) -> dict:
+    return {"slug": f"spell-{page}", "name": f"Spell {page}", "level_int": 1}
+
+
+def _spell_pages_handler(request: httpx.Request) -> httpx.Response:
+    page = int(request.url.params.get("page", "1"))
+    next_url = f"https://api.open5e.com/spells/?page={page + 1}" if page < 3 else None
+    return httpx.Response(200, json={"results": [_spell_row(page)], "next": next_url})
+
+
+def _stored_hash(page: int) -> str:
+    return import_open5e_spells._with_source_hash(import_open5e_spells._spell_values(_spell_row(page)))["source_hash"]
+
+
+class _RecordingSession:
+    """Stands in for a MySQL session: serves the stored hashes and logs cursor writes."""
+
+    def __init__(self, stored_hashes: dict) -> None:
+        self.stored_hashes = stored_hashes
+        self.cursors: list = []
+        self.commits = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def execute(self, statement, params=None):
+        if statement is import_open5e_spells._SPELL_HASHES:
+            return mock.Mock(all=lambda: list(self.stored_hashes.items()))
+        if statement is import_open5e_spells._GET_CURSOR:
+            return mock.Mock(scalar=lambda: None)
+        if statement is import_open5e_spells._SET_CURSOR:
+            self.cursors.append(params["value"])
+        return mock.Mock()
+
+    def commit(self) -> None:
+        self.commits += 1
+
+
+class IterOpen5ePagesTests(unittest.TestCase):
+    def test_yields_each_page_with_the_url_of_the_next(self) -> None:
+        requests: list = []
+        client = httpx.Client(transport=httpx.MockTransport(_paged_handler(requests)))
+
+        pages = list(iter_open5e_pages("/spells/", limit=50, client=client))
+
+        self.assertEqual(
+            [
+                ("https://api.open5e.com/spells/?page=2", [{"slug": "spell-1"}]),
+                ("https://api.open5e.com/spells/?page=3", [{"slug": "spell-2"}]),
+                (None, [{"slug": "spell-3"}]),
+            ],
+            pages,
+        )
+        self.assertEqual({"limit": "50"}, dict(requests[0].url.params))
+        client.close()
+
+    def test_resumes_from_a_saved_page_url(self) -> None:
+        requests: list = []
+        client = httpx.Client(transport=httpx.MockTransport(_paged_handler(requests)))
+
+        pages = list(iter_open5e_pages("/spells/", start_url="https://api.open5e.com/spells/?page=3", client=client))
+
+        self.assertEqual([(None, [{"slug": "spell-3"}])], pages)
+        self.assertEqual(["https://api.open5e.com/spells/?page=3"], [str(request.url) for request in requests])
+        client.close()
+
+
+class ImportSpellsCursorTests(unittest.TestCase):
+    def test_unchanged_pages_still_advance_the_resume_cursor(self) -> None:
+        session = _RecordingSession({"spell-1": _stored_hash(1), "spell-2": _stored_hash(2)})
+        client = httpx.Client(transport=httpx.MockTransport(_spell_pages_handler))
+        written: list = []
+
+        with mock.patch.object(import_open5e_spells, "SessionLocal", lambda: session), mock.patch.object(
+            import_open5e_spells, "_write_batch", lambda _session, rows: written.append([r["slug"] for r in rows])
+        ):
+            result = import_open5e_spells.import_spells(http_client=client)
+
+        self.assertEqual((1, 2), (result.imported, result.skipped))
+        self.assertEqual(
+            ["https://api.open5e.com/spells/?page=2", "https://api.open5e.com/spells/?page=3"], session.cursors
+        )
+        self.assertEqual([["spell-3"]], written)
+        client.close()
+
+
+class SpellImportResultTests(unittest.TestCase):
+    def test_rows_per_second_counts_written_and_skipped_rows(self) -> None:
+        self.assertEqual(150.0, SpellImportResult(imported=200, skipped=100, seconds=2.0).rows_per_second)
+        self.assertEqual(0.0, SpellImportResult(imported=5).rows_per_second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.infrastructure.import_pipeline import Batcher, ImportPipeline
+
+
+class ImportPipelineTests(unittest.TestCase):
+    def test_stages_batch_items_and_report_metrics(self) -> None:
+        written: list[list[int]] = []
+        batcher = Batcher(4)
+        pipeline = (
+            ImportPipeline(queue_size=2)
+            .add_stage("fetch", lambda page: [[page * 10 + i for i in range(3)]], workers=3)
+            .add_stage("map", lambda rows: [[row + 1 for row in rows]], workers=2)
+            .add_stage("batch", batcher, finish=batcher.finish)
+            .add_stage("write", written.append)
+        )
+
+        report = pipeline.run(range(1, 6))
+
+        self.assertEqual([4, 4, 4, 3], [len(batch) for batch in written])
+        self.assertEqual(
+            sorted(page * 10 + i + 1 for page in range(1, 6) for i in range(3)),
+            sorted(row for batch in written for row in batch),
+        )
+        stages = {stage.name: stage for stage in report.stages}
+        self.assertEqual((5, 5), (stages["fetch"].items_in, stages["fetch"].items_out))
+        self.assertEqual((5, 4), (stages["batch"].items_in, stages["batch"].items_out))
+        self.assertTrue(all(stage.max_queue_depth <= 2 for stage in report.stages))
+        self.assertEqual(4, len(report.lines()))
+
+    def test_fetches_overlap_across_workers(self) -> None:
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fetch(page: int):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return [page]
+
+        ImportPipeline().add_stage("fetch", fetch, workers=4).add_stage("write", lambda page: None).run(range(8))
+
+        self.assertEqual(4, peak)
+
+    def test_stage_error_stops_the_run_and_is_raised(self) -> None:
+        def write(item: int) -> None:
+            if item == 3:
+                raise RuntimeError("disk full")
+
+        pipeline = (
+            ImportPipeline(queue_size=1)
+            .add_stage("fetch", lambda page: [page], workers=2)
+            .add_stage("write", write)
+        )
+
+        with self.assertRaisesRegex(RuntimeError, "disk full"):
+            pipeline.run(range(1000))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import sys
+import unittest
+from pathlib import Path
+
+from sqlalchemy.dialects import mysql
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.infrastructure.db.mysql import statements
+
+
+class MultiRowUpsertTests(unittest.TestCase):
+    def test_upsert_renders_one_values_group_per_row(self) -> None:
+        sql = str(statements.upsert_character_locations(3).compile(dialect=mysql.dialect()))
+
+        self.assertEqual(3, sql.count("(%s, %s)"))
+        self.assertTrue(sql.startswith("INSERT INTO character_location (character_id, location_id) VALUES"))
+        self.assertTrue(sql.endswith("ON DUPLICATE KEY UPDATE location_id = VALUES(location_id)"))
+
+    def test_numbered_params_match_the_statement_placeholders(self) -> None:
+        rows = [{"character_id": 1, "location_id": 4}, {"character_id": 2, "location_id": 5}]
+
+        params = statements.numbered_params(rows)
+
+        self.assertEqual(
+            {"character_id_0": 1, "location_id_0": 4, "character_id_1": 2, "location_id_1": 5}, params
+        )
+        self.assertEqual(set(params), set(statements.upsert_character_locations(2).compile().params))
+
+    def test_statements_are_built_once_per_row_count(self) -> None:
+        self.assertIs(statements.upsert_characters(7), statements.upsert_characters(7))
+        self.assertIsNot(statements.upsert_characters(7), statements.upsert_characters(8))
+
+
+if __name__ == "__main__":
+    unittest.main()
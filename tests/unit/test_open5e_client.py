@@ -1,12 +1,16 @@
+import os
 import sys
+import tempfile
 from pathlib import Path
 import unittest
+from unittest import mock
 
 import httpx
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
-from rpg.infrastructure.open5e_client import Open5eClient
+from rpg.infrastructure.open5e_cache import Open5eCacheMiss, Open5eResponseCache
+from rpg.infrastructure.open5e_client import AsyncOpen5eClient, Open5eClient
 
 
 class Open5eClientRaceApiTests(unittest.TestCase):
@@ -49,5 +53,109 @@ class Open5eClientRaceApiTests(unittest.TestCase):
         client.close()
 
 
+class Open5eClientCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.requests: list[httpx.Request] = []
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _client(self, cache: Open5eResponseCache, status: int = 200) -> Open5eClient:
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            if status == 304 and "If-None-Match" in request.headers:
+                return httpx.Response(304)
+            return httpx.Response(200, json={"results": [{"name": "Elf"}]}, headers={"ETag": '"v1"'})
+
+        http_client = httpx.Client(base_url="https://api.test", transport=httpx.MockTransport(handler))
+        return Open5eClient(base_url="https://api.test", http_client=http_client, cache=cache)
+
+    def test_fresh_entries_are_served_from_compressed_files(self) -> None:
+        cache = Open5eResponseCache(self._tmp.name)
+        client = self._client(cache)
+
+        client.list_races(page=1)
+        payload = client.list_races(page=1)
+        client.list_races(page=2)
+
+        self.assertEqual("Elf", payload["results"][0]["name"])
+        self.assertEqual(2, len(self.requests))
+        self.assertEqual((1, 2), (cache.stats.hits, cache.stats.misses))
+        for path in Path(self._tmp.name).iterdir():
+            self.assertEqual(b"\x1f\x8b", path.read_bytes()[:2])
+
+    def test_stale_entries_are_revalidated_with_their_etag(self) -> None:
+        cache = Open5eResponseCache(self._tmp.name, max_age=0)
+        client = self._client(cache, status=304)
+
+        client.list_monsters(page=1)
+        payload = client.list_monsters(page=1)
+
+        self.assertEqual("Elf", payload["results"][0]["name"])
+        self.assertEqual('"v1"', self.requests[1].headers["If-None-Match"])
+        self.assertEqual(1, cache.stats.revalidated)
+
+    def test_offline_mode_never_touches_the_network(self) -> None:
+        self._client(Open5eResponseCache(self._tmp.name)).get_race("elf")
+        offline = self._client(Open5eResponseCache(self._tmp.name, max_age=0, offline=True))
+
+        self.assertEqual("Elf", offline.get_race("elf")["results"][0]["name"])
+        with self.assertRaises(Open5eCacheMiss):
+            offline.get_race("dwarf")
+        self.assertEqual(1, len(self.requests))
+
+    def test_oldest_entries_are_evicted_over_the_size_budget(self) -> None:
+        cache = Open5eResponseCache(self._tmp.name)
+        cache.put("https://api.test/a", {"blob": "a" * 100})
+        entry_size = cache.size()
+        cache.max_bytes = entry_size * 5 // 2
+        cache.put("https://api.test/b", {"blob": "b" * 100})
+        # "a" was used more recently than "b".
+        os.utime(cache._path("https://api.test/a"), (2_000_000_000, 2_000_000_000))
+        os.utime(cache._path("https://api.test/b"), (1_000_000_000, 1_000_000_000))
+        cache.put("https://api.test/c", {"blob": "c" * 100})
+
+        self.assertIsNotNone(cache.get("https://api.test/a"))
+        self.assertIsNone(cache.get("https://api.test/b"))
+        self.assertEqual(1, cache.stats.evicted)
+
+    def test_directory_is_only_rescanned_when_a_write_goes_over_budget(self) -> None:
+        cache = Open5eResponseCache(self._tmp.name)
+        glob = Path.glob
+        with mock.patch.object(Path, "glob", autospec=True, side_effect=glob) as scans:
+            for name in "abcde":
+                cache.put(f"https://api.test/{name}", {"blob": name * 100})
+            self.assertEqual(1, scans.call_count)
+
+            # Room for half of one more entry, so the next write evicts exactly one.
+            cache.max_bytes = cache.size() * 11 // 10
+            scans.reset_mock()
+            cache.put("https://api.test/f", {"blob": "f" * 100})
+            self.assertEqual(1, scans.call_count)
+
+        self.assertEqual(1, cache.stats.evicted)
+        self.assertEqual([], [p.name for p in Path(self._tmp.name).iterdir() if p.suffix == ".tmp"])
+
+
+class AsyncOpen5eClientTests(unittest.IsolatedAsyncioTestCase):
+    async def test_list_monsters_requests_page(self) -> None:
+        captured = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            captured["path"] = request.url.path
+            captured["params"] = dict(request.url.params)
+            return httpx.Response(200, json={"results": [{"name": "Goblin"}]})
+
+        http_client = httpx.AsyncClient(base_url="https://api.test", transport=httpx.MockTransport(handler))
+        client = AsyncOpen5eClient(base_url="https://api.test", http_client=http_client)
+        payload = await client.list_monsters(page=3)
+        await client.aclose()
+
+        self.assertEqual("/monsters/", captured["path"])
+        self.assertEqual({"page": "3"}, captured["params"])
+        self.assertEqual("Goblin", payload["results"][0]["name"])
+
+
 if __name__ == "__main__":
     unittest.main()
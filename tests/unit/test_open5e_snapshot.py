@@ -0,0 +1,97 @@
+import gzip
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.infrastructure.db.mysql.open5e_monster_importer import Open5eMonsterImporter, UpsertResult
+from rpg.infrastructure.open5e_snapshot import (
+    SNAPSHOT_VERSION,
+    SnapshotFormatError,
+    SnapshotOpen5eClient,
+    SnapshotReader,
+    export_snapshot,
+)
+
+
+class PagedClient:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def __getattr__(self, name):
+        kind = name.removeprefix("list_")
+
+        def fetch(page: int = 1) -> dict:
+            kind_pages = self.pages.get(kind, {})
+            return {"results": kind_pages.get(page, []), "next": page + 1 if page + 1 in kind_pages else None}
+
+        return fetch
+
+
+class RecordingRepository:
+    def __init__(self):
+        self.names = []
+
+    def upsert_entities(self, entities, location_id=None) -> UpsertResult:
+        self.names.extend(entity.name for entity in entities)
+        return UpsertResult(created=len(entities))
+
+    def get_default_location_id(self):
+        return 1
+
+
+class Open5eSnapshotTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "open5e.jsonl.gz"
+        self.client = PagedClient(
+            {
+                "monsters": {1: [{"name": "Wolf"}, {"name": "Boar"}], 2: [{"name": "Ogre"}]},
+                "spells": {1: [{"slug": "light", "name": "Light"}]},
+            }
+        )
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_export_writes_an_indexed_header_and_one_line_per_page(self) -> None:
+        export_snapshot(self.client, self.path, kinds=("monsters", "spells", "races"))
+
+        with gzip.open(self.path, "rt", encoding="utf-8") as handle:
+            lines = [json.loads(line) for line in handle]
+        self.assertEqual(SNAPSHOT_VERSION, lines[0]["version"])
+        self.assertEqual({"pages": 2, "records": 3}, lines[0]["index"]["monsters"])
+        self.assertEqual({"pages": 0, "records": 0}, lines[0]["index"]["races"])
+        self.assertEqual([("monsters", 1), ("monsters", 2), ("spells", 1)], [(l["kind"], l["page"]) for l in lines[1:]])
+        self.assertEqual(["light"], [row["slug"] for row in SnapshotReader(self.path).iter_records("spells")])
+
+    def test_monster_importer_reads_pages_from_the_snapshot(self) -> None:
+        export_snapshot(self.client, self.path)
+        snapshot = SnapshotOpen5eClient(self.path)
+        repository = RecordingRepository()
+
+        result = Open5eMonsterImporter(repository, snapshot).import_monsters(
+            pages=snapshot.reader.page_count("monsters")
+        )
+        snapshot.close()
+
+        self.assertEqual(["Wolf", "Boar", "Ogre"], repository.names)
+        self.assertEqual(3, result.created)
+
+    def test_newer_or_foreign_files_are_rejected(self) -> None:
+        with gzip.open(self.path, "wt", encoding="utf-8") as handle:
+            handle.write(json.dumps({"format": "rpg-open5e-snapshot", "version": SNAPSHOT_VERSION + 1}) + "\n")
+        with self.assertRaises(SnapshotFormatError):
+            SnapshotReader(self.path)
+
+        with gzip.open(self.path, "wt", encoding="utf-8") as handle:
+            handle.write('{"results": []}\n')
+        with self.assertRaises(SnapshotFormatError):
+            SnapshotReader(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
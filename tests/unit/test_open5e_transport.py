@@ -0,0 +1,181 @@
+import sys
+from pathlib import Path
+import unittest
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.infrastructure.open5e_client import Open5eClient
+from rpg.infrastructure.open5e_transport import (
+    AsyncOpen5eTransport,
+    Open5eTransport,
+    RetryPolicy,
+    TokenBucket,
+    TransportStats,
+    shared_http_client,
+)
+
+
+def _scripted(responses: list, seen: list):
+    """MockTransport handler replaying ``responses`` (statuses or exceptions) in order."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        step = responses.pop(0)
+        if isinstance(step, Exception):
+            raise step
+        status, headers = step if isinstance(step, tuple) else (step, {})
+        return httpx.Response(status, headers=headers, json={"results": [], "status": status})
+
+    return handler
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_burst_is_free_then_callers_queue_at_the_rate(self) -> None:
+        now = [0.0]
+        bucket = TokenBucket(rate=2.0, burst=2, clock=lambda: now[0])
+
+        self.assertEqual([0.0, 0.0, 0.5, 1.0], [bucket.reserve() for _ in range(4)])
+        now[0] = 2.0
+        self.assertEqual(0.0, bucket.reserve())
+
+    def test_zero_rate_is_unlimited(self) -> None:
+        bucket = TokenBucket(rate=0, burst=1)
+        self.assertEqual([0.0] * 5, [bucket.reserve() for _ in range(5)])
+
+
+class RetryPolicyTests(unittest.TestCase):
+    def test_backoff_doubles_with_jitter_and_honours_retry_after(self) -> None:
+        policy = RetryPolicy(backoff=1.0, max_backoff=8.0, rng=lambda: 1.0)
+
+        self.assertEqual([1.0, 2.0, 4.0, 8.0, 8.0], [policy.delay(attempt) for attempt in range(5)])
+        self.assertEqual(0.5, RetryPolicy(backoff=1.0, rng=lambda: 0.0).delay(0))
+        self.assertEqual(3.0, policy.delay(0, httpx.Response(429, headers={"Retry-After": "3"})))
+
+
+class Open5eTransportTests(unittest.TestCase):
+    def _client(self, responses: list, seen: list, retries: int = 3):
+        sleeps: list = []
+        stats = TransportStats()
+        transport = Open5eTransport(
+            inner=httpx.MockTransport(_scripted(responses, seen)),
+            limiter=TokenBucket(rate=0),
+            policy=RetryPolicy(retries=retries, backoff=1.0, rng=lambda: 0.0),
+            stats=stats,
+            sleep=sleeps.append,
+        )
+        return httpx.Client(base_url="https://api.test", transport=transport), sleeps, stats
+
+    def test_retries_throttled_and_failed_requests_until_success(self) -> None:
+        seen: list = []
+        client, sleeps, stats = self._client([(429, {"Retry-After": "2"}), 503, 200], seen)
+
+        response = client.get("/monsters/", params={"page": 1})
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(3, len(seen))
+        self.assertEqual([2.0, 1.0], sleeps)
+        monsters = stats.endpoints["/monsters/"]
+        self.assertEqual((3, 2, 2), (monsters.requests, monsters.retries, monsters.failures))
+        client.close()
+
+    def test_retries_timeouts_and_gives_up_after_the_limit(self) -> None:
+        seen: list = []
+        client, sleeps, _ = self._client([httpx.ReadTimeout("slow"), 503, 503], seen, retries=2)
+
+        response = client.get("/spells/")
+
+        self.assertEqual(503, response.status_code)
+        self.assertEqual(3, len(seen))
+        self.assertEqual([0.5, 1.0], sleeps)
+        client.close()
+
+    def test_retries_connections_dropped_while_reading_the_body(self) -> None:
+        class _DroppedBody(httpx.SyncByteStream):
+            def __iter__(self):
+                yield b'{"results": '
+                raise httpx.ReadError("connection reset")
+
+        seen: list = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            if len(seen) == 1:
+                return httpx.Response(200, stream=_DroppedBody())
+            return httpx.Response(200, json={"results": ["ok"]})
+
+        transport = Open5eTransport(
+            inner=httpx.MockTransport(handler),
+            limiter=TokenBucket(rate=0),
+            policy=RetryPolicy(backoff=0.0),
+            sleep=lambda _: None,
+        )
+        with httpx.Client(base_url="https://api.test", transport=transport) as client:
+            response = client.get("/monsters/")
+
+        self.assertEqual({"results": ["ok"]}, response.json())
+        self.assertEqual(2, len(seen))
+        self.assertEqual(1, transport.stats.endpoints["/monsters/"].retries)
+
+    def test_refused_connections_fail_fast(self) -> None:
+        seen: list = []
+        client, sleeps, stats = self._client([httpx.ConnectError("refused"), 200], seen)
+
+        with self.assertRaises(httpx.ConnectError):
+            client.get("/races/")
+        self.assertEqual([], sleeps)
+        self.assertEqual(1, stats.endpoints["/races/"].failures)
+        client.close()
+
+    def test_does_not_retry_client_errors_or_non_idempotent_requests(self) -> None:
+        seen: list = []
+        client, sleeps, _ = self._client([404, 503], seen)
+
+        self.assertEqual(404, client.get("/races/missing/").status_code)
+        self.assertEqual(503, client.post("/races/", json={}).status_code)
+        self.assertEqual([], sleeps)
+        client.close()
+
+    def test_stats_group_detail_urls_under_their_endpoint(self) -> None:
+        seen: list = []
+        client, _, stats = self._client([200, 200], seen)
+
+        client.get("/monsters/wolf/")
+        client.get("/monsters/", params={"page": 2})
+
+        self.assertEqual(["/monsters/"], list(stats.endpoints))
+        self.assertEqual(2, stats.endpoints["/monsters/"].requests)
+        self.assertIn("requests=2", stats.lines()[0])
+        client.close()
+
+
+class AsyncOpen5eTransportTests(unittest.IsolatedAsyncioTestCase):
+    async def test_retries_server_errors(self) -> None:
+        seen: list = []
+        transport = AsyncOpen5eTransport(
+            inner=httpx.MockTransport(_scripted([502, 200], seen)),
+            limiter=TokenBucket(rate=0),
+            policy=RetryPolicy(backoff=0.0),
+        )
+        async with httpx.AsyncClient(base_url="https://api.test", transport=transport) as client:
+            response = await client.get("/monsters/")
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(2, len(seen))
+        self.assertEqual(1, transport.stats.endpoints["/monsters/"].retries)
+
+
+class SharedClientTests(unittest.TestCase):
+    def test_open5e_clients_reuse_one_keep_alive_client(self) -> None:
+        first, second = Open5eClient(), Open5eClient()
+
+        self.assertIs(first.client, second.client)
+        self.assertIs(shared_http_client(), first.client)
+        self.assertIsInstance(first.client._transport, Open5eTransport)
+        first.close()
+        self.assertFalse(shared_http_client().is_closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
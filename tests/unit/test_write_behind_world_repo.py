@@ -0,0 +1,218 @@
+import sys
+import threading
+import time
+from pathlib import Path
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.application.services.event_bus import EventBus
+from rpg.application.services.world_progression import WorldProgression
+from rpg.domain.models.world import World
+from rpg.domain.repositories import WorldRepository
+from rpg.infrastructure.db.inmemory.repos import InMemoryEntityRepository
+from rpg.infrastructure.db.write_behind_world_repo import WriteBehindWorldRepository
+
+
+class _RecordingWorldRepository(WorldRepository):
+    def __init__(self) -> None:
+        self.loads = 0
+        self.saved_turns: list[int] = []
+        self.fail_next = False
+
+    def load_default(self) -> World:
+        self.loads += 1
+        return World(id=1, name="Persisted", current_turn=10)
+
+    def save(self, world: World) -> None:
+        if self.fail_next:
+            self.fail_next = False
+            raise ConnectionError("database went away")
+        self.saved_turns.append(world.current_turn)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class WriteBehindWorldRepositoryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.inner = _RecordingWorldRepository()
+        self.clock = _FakeClock()
+        self.repo = WriteBehindWorldRepository(
+            self.inner,
+            flush_interval=5.0,
+            max_pending_turns=100,
+            clock=self.clock,
+            register_atexit=False,
+            idle_flush=False,
+        )
+        self.progression = WorldProgression(self.repo, InMemoryEntityRepository([]), EventBus())
+
+    def test_ticks_coalesce_until_the_interval_elapses(self) -> None:
+        world = self.repo.load_default()
+        for _ in range(4):
+            self.progression.tick(self.repo.load_default())
+
+        self.assertEqual(1, self.inner.loads)
+        self.assertEqual([], self.inner.saved_turns)
+        self.assertEqual(14, world.current_turn)
+
+        self.clock.now = 5.0
+        self.progression.tick(world)
+
+        self.assertEqual([15], self.inner.saved_turns)
+        self.assertFalse(self.repo.pending)
+
+    def test_pending_turn_cap_bounds_state_lost_on_crash(self) -> None:
+        repo = WriteBehindWorldRepository(
+            self.inner,
+            flush_interval=3600,
+            max_pending_turns=3,
+            clock=self.clock,
+            register_atexit=False,
+            idle_flush=False,
+        )
+        world = repo.load_default()
+        for _ in range(3):
+            world.advance_turns()
+            repo.save(world)
+
+        self.assertEqual([13], self.inner.saved_turns)
+
+    def test_close_flushes_pending_state(self) -> None:
+        world = self.repo.load_default()
+        world.advance_turns(2)
+        self.repo.save(world)
+
+        self.repo.close()
+
+        self.assertEqual([12], self.inner.saved_turns)
+        self.assertFalse(self.repo.flush(), "Nothing left to write after close")
+
+    def test_failed_flush_keeps_state_pending_and_reports_error(self) -> None:
+        errors: list[Exception] = []
+        repo = WriteBehindWorldRepository(
+            self.inner,
+            flush_interval=0,
+            clock=self.clock,
+            on_flush_error=errors.append,
+            register_atexit=False,
+            idle_flush=False,
+        )
+        world = repo.load_default()
+        world.advance_turns()
+        self.inner.fail_next = True
+
+        repo.save(world)
+
+        self.assertEqual(1, len(errors))
+        self.assertTrue(repo.pending)
+        self.assertTrue(repo.flush())
+        self.assertEqual([11], self.inner.saved_turns)
+
+    def test_idle_timer_flushes_ticks_left_pending(self) -> None:
+        repo = WriteBehindWorldRepository(self.inner, flush_interval=0.05, register_atexit=False)
+        world = repo.load_default()
+        world.advance_turns()
+        repo.save(world)
+        self.assertTrue(repo.pending)
+
+        deadline = time.monotonic() + 2.0
+        while repo.pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual([11], self.inner.saved_turns)
+        self.assertFalse(repo.pending)
+        repo.close()
+
+    def test_flush_only_counts_once_the_surrounding_transaction_commits(self) -> None:
+        deferred: list = []
+        repo = WriteBehindWorldRepository(
+            self.inner,
+            flush_interval=0,
+            clock=self.clock,
+            register_atexit=False,
+            idle_flush=False,
+            after_commit=deferred.append,
+        )
+        world = repo.load_default()
+        world.advance_turns()
+        repo.save(world)
+
+        self.assertEqual([11], self.inner.saved_turns)
+        self.assertTrue(repo.pending, "Rolled back unless the commit callback runs")
+
+        world.advance_turns()
+        first_commit = deferred.pop(0)
+        repo.save(world)
+        first_commit()
+        self.assertTrue(repo.pending, "A later save is still waiting for its own commit")
+
+        deferred.pop(0)()
+        self.assertFalse(repo.pending)
+        self.assertEqual([11, 12], self.inner.saved_turns)
+
+
+    def test_idle_flush_waits_for_a_unit_of_work_left_open(self) -> None:
+        deferred: list = []
+        repo = WriteBehindWorldRepository(
+            self.inner, flush_interval=0.02, clock=self.clock, register_atexit=False, after_commit=deferred.append
+        )
+        world = repo.load_default()
+        world.advance_turns()
+        repo.save(world)
+        self.assertTrue(repo.flush())  # Written inside a unit of work that has not committed yet.
+        world.advance_turns()
+        repo.save(world)
+
+        time.sleep(0.15)
+        self.assertEqual([11], self.inner.saved_turns, "The idle flush must not queue behind the open transaction")
+
+        deferred.pop(0)()
+        deadline = time.monotonic() + 2.0
+        while len(self.inner.saved_turns) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual([11, 12], self.inner.saved_turns)
+        deferred.pop(0)()
+        self.assertFalse(repo.pending)
+        repo.close()
+
+    def test_slow_writes_do_not_block_other_callers(self) -> None:
+        release = threading.Event()
+        writing = threading.Event()
+        inner_save = self.inner.save
+
+        def slow_save(world: World) -> None:
+            snapshot = World(id=world.id, name=world.name, current_turn=world.current_turn)
+            writing.set()
+            release.wait(2.0)
+            inner_save(snapshot)
+
+        self.inner.save = slow_save
+        world = self.repo.load_default()
+        world.advance_turns()
+        self.repo.save(world)
+        flusher = threading.Thread(target=self.repo.flush)
+        flusher.start()
+        self.assertTrue(writing.wait(2.0))
+
+        started = time.monotonic()
+        world.advance_turns()
+        self.repo.save(world)
+        self.assertIs(world, self.repo.load_default())
+        self.assertLess(time.monotonic() - started, 0.5)
+
+        release.set()
+        flusher.join()
+        self.assertTrue(self.repo.pending, "The second save is newer than the write in flight")
+        self.assertTrue(self.repo.flush())
+        self.assertEqual([11, 12], self.inner.saved_turns)
+
+
+if __name__ == "__main__":
+    unittest.main()